@@ -35,12 +35,11 @@ VERSION="2017-03-12"
 #             eliminated str(), list(), tuple() and dict() calls by replacing
 #             with "", [], () and {}; file list is now sorted.
 
-import sys,os,subprocess,time,pytz,datetime,codecs,xml.dom.minidom,base64,re,yaml
-import hashlib
+import sys,os,subprocess,time,pytz,datetime,codecs,re,yaml,functools
 
 from PyQt5 import QtGui, QtWidgets, QtCore
 
-import FotoPreProcessorWidgets,FotoPreProcessorItem
+import FotoPreProcessorWidgets,FotoPreProcessorItem,FotoPreProcessorTools,FotoPreProcessorIngest
 
 class FPPClickableLabel(QtWidgets.QLabel):
 	# new signal/slot mechanism: define emitted signals instead of using SLOT macro
@@ -56,10 +55,19 @@ class FPPClickableLabel(QtWidgets.QLabel):
 	def __init__(self):
 		super().__init__()
 		self.image = None
+		# 2026-10-18: images are decoded at screen size and cached,
+		#             neighbouring images are decoded in advance
+		self.cache_preview = FotoPreProcessorItem.FPPPreviewCache()
 		self.setSizePolicy(QtWidgets.QSizePolicy.Ignored,QtWidgets.QSizePolicy.Ignored)
 		self.setScaledContents(False)
 		self.setAlignment(QtCore.Qt.AlignCenter)
 		self.setBackgroundRole(QtGui.QPalette.Dark)
+		# 2026-10-18: while the label is resized the image is scaled fast,
+		#             the smooth scaling is done once resizing has settled
+		self.timer_rescale = QtCore.QTimer(self)
+		self.timer_rescale.setSingleShot(True)
+		self.timer_rescale.setInterval(150)
+		self.timer_rescale.timeout.connect(self.rescaleImage)
 		
 		self.button_prev = QtWidgets.QPushButton(QtGui.QIcon.fromTheme("go-previous"),QtCore.QCoreApplication.translate("Preview","Previous"))
 		self.button_next = QtWidgets.QPushButton(QtGui.QIcon.fromTheme("go-next"),QtCore.QCoreApplication.translate("Preview","Next"))
@@ -110,24 +118,40 @@ class FPPClickableLabel(QtWidgets.QLabel):
 		self.goBack.emit()
 	def updateItem(self,filepath,item):
 		QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
-		self.image = QtGui.QImage(str(os.path.join(filepath,item.filename())))
-		matrix = QtGui.QTransform()
-		if not item.checkOrientation(self.image.width(),self.image.height()):
-			# image dimensions were not changed during loading although
-			# EXIF information required that: fix this behaviour by manually
-			# applying the orientation transformations to the matrix
-			item.applyOrientation(matrix)
-		matrix.rotate(item.rotation())
-		self.image = self.image.transformed(matrix)
-		self.setPixmap(QtGui.QPixmap().fromImage(self.image))
+		# cached images are already oriented according to EXIF information
+		self.cache_preview.setScreenSize(QtWidgets.QApplication.desktop().screenGeometry(self).size())
+		self.image = self.cache_preview.load(item,str(os.path.join(filepath,item.filename())))
+		if item.rotation() != 0:
+			matrix = QtGui.QTransform()
+			matrix.rotate(item.rotation())
+			self.image = self.image.transformed(matrix)
+		self.timer_rescale.stop()
+		self.rescaleImage()
 		QtWidgets.QApplication.restoreOverrideCursor()
 		self.setToolTip(item.toolTip())
-		
+	def prefetchItems(self,filepath,items=()):
+		for item in items:
+			self.cache_preview.request(item,str(os.path.join(filepath,item.filename())))
+	def setCacheMemory(self,size=0):
+		self.cache_preview.setBudget(size)
+	def clearCache(self):
+		self.cache_preview.clear()
+	def shutdown(self):
+		self.cache_preview.shutdown()
+		
+	def rescaleImage(self,mode=QtCore.Qt.SmoothTransformation):
+		if self.image == None or self.image.isNull():
+			return
+		size_scaled = self.image.size()
+		size_scaled.scale(self.size(),QtCore.Qt.KeepAspectRatio)
+		if size_scaled == self.image.size():
+			self.setPixmap(QtGui.QPixmap().fromImage(self.image))
+		else:
+			self.setPixmap(QtGui.QPixmap().fromImage(self.image.scaled(size_scaled,QtCore.Qt.IgnoreAspectRatio,mode)))
 	def resizeEvent(self,event):
-		if self.image:
-			scaledSize = self.image.size()
-			scaledSize.scale(self.size(),QtCore.Qt.KeepAspectRatio);
-			self.setPixmap(QtGui.QPixmap().fromImage(self.image.scaled(self.size(),QtCore.Qt.KeepAspectRatio,QtCore.Qt.SmoothTransformation)))
+		if self.image != None:
+			self.rescaleImage(QtCore.Qt.FastTransformation)
+			self.timer_rescale.start()
 
 
 class FPPMainWindow(QtWidgets.QMainWindow):	
@@ -197,8 +221,24 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 			try:    self.int_readsize = int(settings.value("ReadSize",1024))
 			except: self.int_readsize = 1024
 			
-			try:    self.float_readdelay = float(settings.value("ReadDelay",0.0001))
-			except: self.float_readdelay = 0.0001
+			try:    self.int_cachesize = int(settings.value("CacheSize",512))
+			except: self.int_cachesize = 512
+			
+			try:    self.int_thumbnailmemory = int(settings.value("ThumbnailMemory",128))
+			except: self.int_thumbnailmemory = 128
+			
+			try:    self.int_previewmemory = int(settings.value("PreviewMemory",256))
+			except: self.int_previewmemory = 256
+			
+			try:    self.int_previewprefetch = int(settings.value("PreviewPrefetch",2))
+			except: self.int_previewprefetch = 2
+			
+			try:    self.int_exiftoolprocesses = int(settings.value("ExiftoolProcesses",os.cpu_count() or 1))
+			except: self.int_exiftoolprocesses = os.cpu_count() or 1
+			
+			self.str_ingestbackend = str(settings.value("IngestBackend",FotoPreProcessorIngest.FPPIngestWorker.BackendXML))
+			
+			self.bool_lazydigests = settings.value("LazyDigests",True) in ("true",True)
 			
 			# load miscellaneous settings
 			self.ustr_iconsize = str(settings.value("IconSize","128x128"))
@@ -219,17 +259,55 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 			settings.setValue("TheGimpPath",self.ustr_path_gimp)
 			settings.setValue("StepSize",self.int_stepsize)
 			settings.setValue("ReadSize",self.int_readsize)
+			settings.setValue("CacheSize",self.int_cachesize)
+			settings.setValue("ThumbnailMemory",self.int_thumbnailmemory)
+			settings.setValue("PreviewMemory",self.int_previewmemory)
+			settings.setValue("PreviewPrefetch",self.int_previewprefetch)
+			settings.setValue("ExiftoolProcesses",self.int_exiftoolprocesses)
+			settings.setValue("IngestBackend",self.str_ingestbackend)
+			settings.setValue("LazyDigests",self.bool_lazydigests)
 			settings.setValue("IconSize",self.ustr_iconsize)
 			settings.setValue("SortCriterion",self.int_sorting)
 			settings.setValue("WindowSize",self.size_window)
 			
 			self.ustr_path = ""
+			self.worker_ingest = None
+			self.thread_ingest = None
+			self.progress_ingest = None
+			
+			# 2026-10-18: persistent metadata cache, size given in MiB
+			self.cache = FotoPreProcessorTools.FPPMetadataCache()
+			self.openCache()
+			
+			# 2026-10-18: MD5 sums are calculated in the background
+			self.dct_items = {}
+			self.dct_digests = {}
+			self.pool_digest = FotoPreProcessorIngest.FPPDigestPool(self.cache)
+			self.pool_digest.digestReady.connect(self.updateDigest)
+			
+			# 2026-10-18: metadata of all images of the current directory is kept
+			#             in a columnar store; gallery items reference its rows
+			self.store_metadata = FotoPreProcessorItem.FPPMetadataStore()
+			
+			# 2026-10-18: preview images are extracted on demand
+			self.extractor_preview = FotoPreProcessorIngest.FPPPreviewExtractor(self.ustr_path_exiftool)
 			
 			self.setupGUI()
 			self.wasSaved = False
 			self.updateImageList()
 	
 	
+	def openCache(self):
+		"""(Re-)open the metadata cache in the user's cache directory."""
+		self.cache.open(
+			os.path.join(
+				QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.CacheLocation),
+				"metadata.sqlite"
+			),
+			self.int_cachesize * 1024**2
+		)
+	
+	
 	def sanitiseExecutable(self,path=""):
 		returnPath = ""
 		path = str(path)
@@ -267,6 +345,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		self.action_resetAll = QtWidgets.QAction(QtCore.QCoreApplication.translate("Menu","Reset everything"),self)
 		
 		action_config = QtWidgets.QAction(QtCore.QCoreApplication.translate("Menu","Configure FPP..."),self)
+		self.action_rebuildCache = QtWidgets.QAction(QtCore.QCoreApplication.translate("Menu","Rebuild metadata cache"),self)
+		self.action_rebuildCache.setEnabled(self.cache.isEnabled())
 		
 		self.action_sortByName = QtWidgets.QAction(QtCore.QCoreApplication.translate("Menu","Sort by filename"),self)
 		self.action_sortByTime = QtWidgets.QAction(QtCore.QCoreApplication.translate("Menu","Sort by timestamp"),self)
@@ -296,7 +376,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		
 		#---------------------------------------------------------------
 		
-		self.list_images = QtWidgets.QListWidget(self)
+		# 2026-10-18: model/view gallery, items are created on demand
+		self.list_images = FotoPreProcessorItem.FPPGalleryView(self)
 		self.list_images.setItemDelegate(FotoPreProcessorItem.FPPGalleryItemDelegate(QtGui.QIcon(os.path.join(sys.path[0],"icons","changed.png"))))
 		self.list_images.setIconSize(QtCore.QSize(128,128))
 		self.list_images.setViewMode(QtWidgets.QListView.IconMode)
@@ -304,10 +385,12 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		self.list_images.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
 		self.list_images.setDragEnabled(False)
 		self.list_images.setUniformItemSizes(True)
+		self.list_images.setIconMemory(self.int_thumbnailmemory * 1024**2)
 		
 		#---------------------------------------------------------------
 		
 		self.scroll_image_label = FPPClickableLabel()
+		self.scroll_image_label.setCacheMemory(self.int_previewmemory * 1024**2)
 		
 		#---------------------------------------------------------------
 		
@@ -362,6 +445,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		self.menu_iconSize = menu_settings.addMenu(QtCore.QCoreApplication.translate("Menu","Icon size"))
 		menu_sorting = menu_settings.addMenu(QtCore.QCoreApplication.translate("Menu","Sort criterion"))
 		menu_settings.addSeparator()
+		menu_settings.addAction(self.action_rebuildCache)
 		menu_settings.addAction(action_config)
 		
 		menu_docks.addAction(self.dock_geotagging.toggleViewAction())
@@ -398,6 +482,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		
 		self.list_images.itemSelectionChanged.connect(self.listImagesSelectionChanged)
 		self.list_images.itemChanged.connect(self.listImagesItemChanged)
+		self.list_images.itemsChanged.connect(self.listImagesItemsChanged)
 		self.list_images.itemDoubleClicked.connect(self.openPreviewImage)
 		
 		#---------------------------------------------------------------
@@ -465,6 +550,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		#---------------------------------------------------------------
 		
 		action_config.triggered.connect(self.configureProgram)
+		self.action_rebuildCache.triggered.connect(self.rebuildCache)
 		
 		#---------------------------------------------------------------
 		
@@ -495,11 +581,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 	
 	
 	def checkOnExit(self):
-		edited = False
-		for i in range(0,self.list_images.count()):
-			if self.list_images.item(i).edited():
-				edited = True
-				break
+		edited = self.list_images.editedCount() > 0
 		if edited:
 			if self.wasSaved:
 				# was already saved, so only ask if changes should be applied
@@ -526,6 +608,12 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		self.dock_copyright.close() # i.e.: save copyright DB
 		self.dock_description.close() # i.e.: save description DB
 		self.dock_keywords.close()  # i.e.: save keywords DB
+		self.stopIngest()
+		self.pool_digest.shutdown()
+		self.list_images.shutdown()
+		self.scroll_image_label.shutdown()
+		self.extractor_preview.close()
+		self.cache.close()
 		# save miscellaneous settings
 		settings = QtCore.QSettings()
 		settings.setIniCodec(QtCore.QTextCodec.codecForName("UTF-8"))
@@ -591,9 +679,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 			self.ustr_iconsize = str(action.text())
 		# fixing erroneous ampersand in string returned by text()
 		self.ustr_iconsize = self.ustr_iconsize.replace("&","")
+		# icons are rendered by the model when needed
 		self.list_images.setIconSize(self.dct_iconsize[self.ustr_iconsize])
-		for i in range(0,self.list_images.count()):
-			self.list_images.item(i).updateIcon()
 	
 	
 	def setSortCriterion(self,action):
@@ -604,35 +691,126 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		else:
 			self.int_sorting = FotoPreProcessorItem.FPPGalleryItem.SortByName
 		
-		for i in range(0,self.list_images.count()):
-			self.list_images.item(i).setSortCriterion(self.int_sorting)
-		self.list_images.sortItems()
-	
-	
-	def getFirstTextChild(self,node=None):
-		value = ""
-		for child in node.childNodes:
-			if child.nodeType == node.TEXT_NODE and len(child.nodeValue.strip()) > 0:
-				value = str(node.childNodes[0].nodeValue.strip())
-				break
-		return value
+		for item in self.list_images.items():
+			item.setSortCriterion(self.int_sorting)
+		self.list_images.sortItems(self.int_sorting)
+	
+	
+	def createItem(self,filename="",record={},thumbData=b"",digest="",sortCriterion=None):
+		"""Create a gallery item from given record, encoded thumbnail and MD5 sum."""
+		item = FotoPreProcessorItem.FPPGalleryItem(self.store_metadata)
+		item.setFilename(filename)
+		self.dct_items[filename] = item
+		# 2017-07-14: store original file's MD5 sum (hexadecimal representation)
+		item.setDigest(digest or self.dct_digests.pop(filename,""))
+		# 2026-10-18: lazy mode: MD5 sum is calculated when it's needed
+		item.setDigestFunction(functools.partial(self.pool_digest.digest,os.path.join(self.ustr_path,filename)))
+		item.setPreviewFunction(functools.partial(self.extractor_preview.previewImage,os.path.join(self.ustr_path,filename)))
+		if "Orientation" in record:
+			item.setOrientation(record["Orientation"])
+		if "Keywords" in record:
+			item.setKeywords(record["Keywords"])
+		item.setThumbnailData(thumbData)
+		
+		try:
+			imgwidth,imgheight = [int(i) for i in record["ImageSize"].split("x")]
+		except:
+			imgwidth,imgheight = -1,-1
+		item.setSize(imgwidth,imgheight);
+		
+		try:    item.setTimestamp(record["DateTimeOriginal"].split(" "))
+		except: pass
+		
+		focalLength  = record.get("FocalLength","")
+		cropFactor   = record.get("ScaleFactor35efl","")
+		aperture     = record.get("Aperture","")
+		shutterSpeed = record.get("ShutterSpeed","")
+		isoValue     = record.get("ISO","")
+		settings = []
+		if len(focalLength) != 0:
+			try:
+				settings.append("{0} mm ({1})".format(
+					int(float(focalLength) * float(cropFactor)),
+					QtCore.QCoreApplication.translate("ItemToolTip","on full-frame")
+				))
+			except:
+				settings.append("{0} ({1})".format(
+					focalLength,
+					QtCore.QCoreApplication.translate("ItemToolTip","physical")
+				))
+		if len(aperture) != 0:
+			settings.append("f/" + aperture)
+		if len(shutterSpeed) != 0:
+			settings.append(shutterSpeed + " s")
+		if len(isoValue) != 0:
+			settings.append("ISO " + isoValue)
+		if len(settings) != 0:
+			item.setCameraSettings(", ".join(settings))
+		
+		cameraModel = record.get("Model","")
+		lensType    = record.get("LensType","")
+		settings = []
+		if len(cameraModel) > 0 and not cameraModel.startswith("Unknown"):
+			settings.append(cameraModel)
+		if len(lensType) > 0 and not lensType.startswith("Unknown"):
+			settings.append(lensType)
+		if len(settings) != 0:
+			item.setCameraHardware(", ".join(settings))
+		
+		try:
+			latitude = float(record["GPSLatitude"])
+			longitude = float(record["GPSLongitude"])
+			if record.get("GPSLatitudeRef","") == "S": latitude = -latitude
+			if record.get("GPSLongitudeRef","") == "W": longitude = -longitude
+			try:    elevation = float(record["GPSAltitude"])
+			except: elevation = 0.0
+			if record.get("GPSAltitudeRef","") == "1": elevation = -elevation
+			item.setLocation(latitude,longitude,elevation)
+		except:
+			pass
+		
+		# copyright string = author name
+		#
+		# additional symbols and strings (i.e. "Copyright" and
+		# (c) or © resp.) are added later by the exec routine
+		#
+		# Thus this snippet first tries to use author information
+		# to set the copyright notice of the item. If no author
+		# information is given, the copyright tag is evaluated.
+		# If everything fails, no copyright is set (remains "").
+		author = record.get("Author","")
+		copyright = record.get("Copyright","")
+		try:    copyright = re.match(r'^(©|\(C\)|\(c\)|Copyright \(C\)|Copyright \(c\)|Copyright ©) [0-9-]* (.*)',copyright).groups()[1]
+		except: pass
+		if len(author) > 0:
+			item.setCopyright(author)
+		else:
+			if len(copyright) > 0:
+				item.setCopyright(copyright)
+		
+		descriptiontext = record.get("Description","")
+		if len(descriptiontext) > 0:
+			item.setDescription(descriptiontext)
+		
+		item.setSortCriterion(sortCriterion)
+		item.saveState()
+		return item
 	
 	
 	def updateImageList(self):
+		"""Clear the image list and start scanning the current directory.
+
+Scanning is done by an FPPIngestWorker in a separate thread; the worker delivers
+records via signals and the GUI thread only creates the items. A non-modal
+progress dialog shows progress and throughput and allows cancellation."""
+		self.stopIngest()
+		self.pool_digest.cancel()
 		self.list_images.clear()
-		
-		progress = QtWidgets.QProgressDialog(self)
-		progress.setWindowModality(QtCore.Qt.WindowModal)
-		progress.setMinimumDuration(0)
-		progress.setAutoClose(False)
-		progress.setAutoReset(False)
-		
-		if self.action_sortByName.isChecked():
-			sortCriterion = FotoPreProcessorItem.FPPGalleryItem.SortByName
-		elif self.action_sortByTime.isChecked():
-			sortCriterion = FotoPreProcessorItem.FPPGalleryItem.SortByTime
-		elif self.action_sortByCamera.isChecked():
-			sortCriterion = FotoPreProcessorItem.FPPGalleryItem.SortByCamera
+		self.scroll_image_label.clearCache()
+		self.list_images.setPreviewCache(self.scroll_image_label.cache_preview,self.ustr_path)
+		self.store_metadata = FotoPreProcessorItem.FPPMetadataStore()
+		self.dct_items = {}
+		self.dct_digests = {}
 		
 		# 2012-10-17, bug: program is stalled when a directory is part of the filelist
 		# solution: scan filelist and remove all non-regular files
@@ -643,329 +821,130 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		except:
 			filelist = []
 		
-		l_filelist = len(filelist)
-		progress.setRange(0,l_filelist)
-		progress.setValue(0)
-		
-		if l_filelist > 0 and len(self.ustr_path_exiftool) > 0:
-			proc_exiftool = subprocess.Popen([
-				self.ustr_path_exiftool,
-				"-stay_open","True",
-				"-@","-",
-				"-common_args",
-				"-X",
-				"-b",
-				"-m",
-				"-if",
-				"$MIMEType =~ /^image/",
-				"-d",
-				"%Y %m %d %H %M %S",
-				"-Orientation",
-				"-DateTimeOriginal",
-				"-Keywords",
-				"-FocalLength#",
-				"-ScaleFactor35efl",
-				"-Aperture",
-				"-ShutterSpeed",
-				"-ISO",
-				"-Model",
-				"-LensType",
-				"-ThumbnailImageValidArea",
-				"-Copyright",
-				"-xmp-dc:description",
-				"-Author",
-				"-GPS:GPSLatitude#",
-				"-GPS:GPSLatitudeRef#",
-				"-GPS:GPSLongitude#",
-				"-GPS:GPSLongitudeRef#",
-				"-GPS:GPSAltitude#",
-				"-GPS:GPSAltitudeRef#",
-				"-ThumbnailImage",
-				"-PreviewImage",
-				"-ImageSize"
-			],stdout=subprocess.PIPE,stdin=subprocess.PIPE,stderr=subprocess.PIPE)
-			
-			for i in range(0,l_filelist,self.int_stepsize):
-				#
-				# read self.int_stepsize images at once and process output
-				#
-				command = "\n".join(filelist[i:i+self.int_stepsize]) + "\n-execute\n"
-				proc_exiftool.stdin.write(command.encode("UTF-8"))
-				proc_exiftool.stdin.flush()
-				
-				# os.read is needed for stdout/stderr "file" objects...
-				# in addition, exiftool output ends with {ready}, so we have to catch it
-				f_stdout = proc_exiftool.stdout.fileno()
-				str_output = ""
-				QtCore.QCoreApplication.processEvents()
-				while not str_output[-64:].strip().endswith('{ready}'):
-					# read until {ready} occurs
-					str_output += os.read(f_stdout,self.int_readsize).decode()
-				QtCore.QCoreApplication.processEvents()
-				str_output = str_output.strip()[:-7]
-				
-				try:
-					descriptionElements = xml.dom.minidom.parseString(str_output).getElementsByTagName("rdf:Description")
-				except:
-					descriptionElements = ()
-				
-				self.list_images.setUpdatesEnabled(False)
-				
-				# 2017-07-14: deal with files ignored by exiftool (i.e. non-image files)
-				#             by advancing the progress bar
-				if i + self.int_stepsize < l_filelist:
-					n_nonimages = self.int_stepsize - len(descriptionElements)
-				else:
-					n_nonimages = l_filelist - i - len(descriptionElements)
-				progress.setValue(progress.value()+n_nonimages)
-				
-				for k,description in enumerate(descriptionElements):
-					#
-					# process every identified image
-					#
-					filepath = str(description.getAttribute("rdf:about"))
-					
-					if len(filepath) == 0: continue
-					if progress.wasCanceled(): break
-					
-					filename = os.path.basename(filepath)
-					progress.setValue(progress.value()+1)
-					progress.setLabelText("{0} {1}...".format(
-						QtCore.QCoreApplication.translate("Dialog","Processing Image"),
-						filename
-					))
-					
-					timestamp    = ""
-					focalLength  = ""
-					cropFactor   = ""
-					aperture     = ""
-					shutterSpeed = ""
-					isoValue     = ""
-					cameraModel  = ""
-					lensType     = ""
-					thumbArea    = ""
-					latitude     = ""
-					latitudeRef  = ""
-					longitude    = ""
-					longitudeRef = ""
-					elevation    = ""
-					elevationRef = ""
-					thumbData    = b""
-					previewData  = b""
-					author       = ""
-					copyright    = ""
-					descriptiontext = ""
-					imgwidth     = -1
-					imgheight    = -1
-					item = FotoPreProcessorItem.FPPGalleryItem(self.list_images)
-					item.setFilename(filename)
-					# 2017-07-14: store original file's MD5 sum (hexadecimal representation)
-					with open(filepath,"rb") as f:
-						item.setDigest(hashlib.md5(f.read()).hexdigest())
-					
-					for node in description.childNodes:
-						#
-						# process nodes of the XML structure
-						#
-						if node.nodeType != node.ELEMENT_NODE: continue
-						if node.localName == "Orientation":
-							item.setOrientation(self.getFirstTextChild(node))
-						elif node.localName == "DateTimeOriginal":
-							timestamp = self.getFirstTextChild(node)
-						elif node.localName == "Keywords":
-							keywords = []
-							rdfBag = node.getElementsByTagName("rdf:Bag")
-							if len(rdfBag) > 0:
-								# more than one keyword: stored as RDF bag,
-								# i.e. there is at least one rdf:Bag tag...
-								for bagItem in rdfBag[0].getElementsByTagName("rdf:li"):
-									keywords.append(self.getFirstTextChild(bagItem))
-							else:
-								# single keyword is stored as simple cdata
-								keywords.append(self.getFirstTextChild(node))
-							item.setKeywords(keywords)
-						elif node.localName == "FocalLength":
-							focalLength = self.getFirstTextChild(node)
-						elif node.localName == "ScaleFactor35efl":
-							cropFactor = self.getFirstTextChild(node)
-						elif node.localName == "Aperture":
-							aperture = self.getFirstTextChild(node)
-						elif node.localName == "ShutterSpeed":
-							shutterSpeed = self.getFirstTextChild(node)
-						elif node.localName == "ISO":
-							isoValue = self.getFirstTextChild(node)
-						elif node.localName == "Model":
-							cameraModel = self.getFirstTextChild(node)
-						elif node.localName == "LensType":
-							lensType = self.getFirstTextChild(node)
-						elif node.localName == "ThumbnailImageValidArea":
-							thumbArea = self.getFirstTextChild(node)
-						elif node.localName == "Copyright":
-							copyright = self.getFirstTextChild(node)
-							try:    copyright = re.match(r'^(©|\(C\)|\(c\)|Copyright \(C\)|Copyright \(c\)|Copyright ©) [0-9-]* (.*)',copyright).groups()[1]
-							except: pass
-						elif node.localName == "Description":
-							descriptiontext = self.getFirstTextChild(node)
-						elif node.localName == "Author":
-							author = self.getFirstTextChild(node)
-						elif node.localName == "GPSLatitude":
-							latitude = self.getFirstTextChild(node)
-						elif node.localName == "GPSLatitudeRef":
-							latitudeRef = self.getFirstTextChild(node)
-						elif node.localName == "GPSLongitude":
-							longitude = self.getFirstTextChild(node)
-						elif node.localName == "GPSLongitudeRef":
-							longitudeRef = self.getFirstTextChild(node)
-						elif node.localName == "GPSAltitude":
-							elevation = self.getFirstTextChild(node)
-						elif node.localName == "GPSAltitudeRef":
-							elevationRef = self.getFirstTextChild(node)
-						elif node.localName == "ThumbnailImage":
-							thumbData = base64.b64decode(self.getFirstTextChild(node))
-						elif node.localName == "PreviewImage":
-							previewData = base64.b64decode(self.getFirstTextChild(node))
-						elif node.localName == "ImageSize":
-							try:
-								imgwidth,imgheight = [int(i) for i in self.getFirstTextChild(node).split("x")]
-							except:
-								pass
-					
-					# 2013-01-08: +support for preview images >160px
-					# 2013-05-02: -support for preview images >160px (reduce memory footprint, instead do preview on-demand)
-					# resources: thumbnail image
-					# maximum: self.iconsize_max
-					# 1. try thumb
-					# 2. use unknownPicture2
-					# sidenote: optimised QPixmap usage; by avoiding stupid
-					# re-assignment (thumbImage = QPixmap()) memory usage is kept low
-					thumbImage = QtGui.QPixmap()
-					if not thumbImage.loadFromData(previewData):
-						# no preview image available, try thumb
-						if thumbImage.loadFromData(thumbData):
-							try:
-								# try to fit thumbnail into its area
-								(x1,x2,y1,y2) = tuple(thumbArea.split(" "))
-								thumbRect = QtCore.QRect()
-								thumbRect.setTop(int(y1))
-								thumbRect.setBottom(int(y2))
-								thumbRect.setLeft(int(x1))
-								thumbRect.setRight(int(x2))
-								thumbImage = thumbImage.copy(thumbRect)
-							except:
-								pass
-						else:
-							# no thumb: load image directly
-							if not thumbImage.load(filepath):
-								# direct image loading failed: load unknownPicture2
-								if not thumbImage.load(os.path.join(sys.path[0],"icons","unknownPicture2.png")):
-									# well, at this point we have a non-valid
-									# image and an erroneous installation...
-									continue
-					
-					# scale thumb image and store it in the item
-					thumbImage = thumbImage.scaled(
-						self.dct_iconsize[self.iconsize_max],
-						QtCore.Qt.KeepAspectRatio,
-						QtCore.Qt.SmoothTransformation
-					)
-					item.setThumbnail(thumbImage)
-					item.setSize(imgwidth,imgheight);
-					
-					if len(timestamp) == 0:
-						# no EXIF timestamp , so obtain timestamp from filesystem
-						timestamp = time.strftime(
-							"%Y %m %d %H %M %S",
-							time.localtime(os.path.getctime(filepath))
-						)
-					try:    item.setTimestamp(timestamp.split(" "))
-					except: pass
-				
-					settings = []
-					if len(focalLength) != 0:
-						try:
-							settings.append("{0} mm ({1})".format(
-								int(float(focalLength) * float(cropFactor)),
-								QtCore.QCoreApplication.translate("ItemToolTip","on full-frame")
-							))
-						except:
-							settings.append("{0} ({1})".format(
-								focalLength,
-								QtCore.QCoreApplication.translate("ItemToolTip","physical")
-							))
-					if len(aperture) != 0:
-						settings.append("f/" + aperture)
-					if len(shutterSpeed) != 0:
-						settings.append(shutterSpeed + " s")
-					if len(isoValue) != 0:
-						settings.append("ISO " + isoValue)
-					if len(settings) != 0:
-						item.setCameraSettings(", ".join(settings))
-					
-					settings = []
-					if len(cameraModel) > 0 and not cameraModel.startswith("Unknown"):
-						settings.append(cameraModel)
-					if len(lensType) > 0 and not lensType.startswith("Unknown"):
-						settings.append(lensType)
-					if len(settings) != 0:
-						item.setCameraHardware(", ".join(settings))
-					
-					try:
-						latitude = float(latitude)
-						longitude = float(longitude)
-						if latitudeRef == "S": latitude = -latitude
-						if longitudeRef == "W": longitude = -longitude
-						try:    elevation = float(elevation)
-						except: elevation = 0.0
-						if elevationRef == "1": elevation = -elevation
-						item.setLocation(latitude,longitude,elevation)
-					except:
-						pass
-					
-					# copyright string = author name
-					#
-					# additional symbols and strings (i.e. "Copyright" and
-					# (c) or © resp.) are added later by the exec routine
-					#
-					# Thus this snippet first tries to use author information
-					# to set the copyright notice of the item. If no author
-					# information is given, the copyright tag is evaluated.
-					# If everything fails, no copyright is set (remains "").
-					if len(author) > 0:
-						item.setCopyright(author)
-					else:
-						if len(copyright) > 0:
-							item.setCopyright(copyright)
-
-					if len(descriptiontext) > 0:
-						item.setDescription(descriptiontext)
+		self.resetActions()
+		if len(filelist) == 0 or len(self.ustr_path_exiftool) == 0:
+			return
+		
+		# 2026-10-18: progress dialog is non-modal, the GUI stays responsive
+		self.progress_ingest = QtWidgets.QProgressDialog(self)
+		self.progress_ingest.setWindowModality(QtCore.Qt.NonModal)
+		self.progress_ingest.setMinimumDuration(0)
+		self.progress_ingest.setAutoClose(False)
+		self.progress_ingest.setAutoReset(False)
+		self.progress_ingest.setRange(0,len(filelist))
+		self.progress_ingest.setValue(0)
+		self.progress_ingest.setLabelText(QtCore.QCoreApplication.translate("Dialog","Processing Image"))
+		self.float_ingeststart = time.time()
+		
+		self.thread_ingest = QtCore.QThread()
+		self.worker_ingest = FotoPreProcessorIngest.FPPIngestWorker(
+			filelist,
+			self.ustr_path_exiftool,
+			self.cache,
+			self.dct_iconsize[self.iconsize_max],
+			self.int_stepsize,
+			self.int_readsize,
+			self.int_exiftoolprocesses,
+			self.str_ingestbackend,
+			None if self.bool_lazydigests else self.pool_digest
+		)
+		self.worker_ingest.moveToThread(self.thread_ingest)
+		self.thread_ingest.started.connect(self.worker_ingest.run)
+		self.worker_ingest.recordsReady.connect(self.ingestRecords)
+		self.worker_ingest.progress.connect(self.ingestProgress)
+		self.worker_ingest.finished.connect(self.ingestFinished)
+		self.progress_ingest.canceled.connect(self.cancelIngest)
+		self.thread_ingest.start()
+	
+	
+	def ingestRecords(self,records=()):
+		"""Create items for a list of records delivered by the ingest worker."""
+		# ignore signals still queued by a previously stopped worker
+		if self.sender() != self.worker_ingest: return
+		if self.worker_ingest.isCancelled() and not self.worker_ingest.isFailed(): return
+		# items are added after their fields are set up (cf. createItem),
+		# so no itemChanged handling (e.g. digest calculation) is triggered
+		self.list_images.addItems([
+			self.createItem(filename,record,thumbData,digest,self.int_sorting)
+			for filename,record,thumbData,digest in records
+		])
+	
+	
+	def ingestProgress(self,count=0,filename=""):
+		"""Update the progress dialog: number of files processed and throughput."""
+		if self.sender() != self.worker_ingest or self.progress_ingest == None: return
+		self.progress_ingest.setValue(count)
+		elapsed = time.time() - self.float_ingeststart
+		if elapsed > 0:
+			self.progress_ingest.setLabelText("{0} {1}...\n{2:.1f} {3}".format(
+				QtCore.QCoreApplication.translate("Dialog","Processing Image"),
+				filename,
+				count / elapsed,
+				QtCore.QCoreApplication.translate("Dialog","images per second")
+			))
+	
+	
+	def ingestFinished(self):
+		"""Ingest worker is done: sort items (or clear list if cancelled) and clean up.
 
-					item.setSortCriterion(sortCriterion)
-					item.saveState()
-					#
-					# end of node processing
-					#
-					
-				if progress.wasCanceled(): break
-				#
-				# end of file processing
-				#
-			
-			# terminate exiftool
-			proc_exiftool.communicate("-stay_open\nFalse\n".encode("utf-8"))
-			
-		#
-		# end of image package processing
-		#
-		self.list_images.setUpdatesEnabled(True)
-			
-		if progress.wasCanceled():
+If exiftool failed, the items read so far are kept and the user is notified."""
+		if self.sender() != self.worker_ingest: return
+		failed = self.worker_ingest.isFailed()
+		cancelled = self.worker_ingest.isCancelled() and not failed
+		self.stopIngest()
+		if cancelled:
+			self.pool_digest.cancel()
 			self.list_images.clear()
+			self.store_metadata = FotoPreProcessorItem.FPPMetadataStore()
+			self.dct_items = {}
+			self.dct_digests = {}
 		else:
-			self.list_images.sortItems()
+			self.list_images.sortItems(self.int_sorting)
 			self.adjustIconSize()
-		
-		progress.close()
-		
+		if failed:
+			QtWidgets.QMessageBox.warning(
+				self,
+				QtCore.QCoreApplication.translate("Dialog","Exiftool Error"),
+				QtCore.QCoreApplication.translate("Dialog","Exiftool could not be started or terminated unexpectedly.\nScanning was stopped after {0} images.").format(self.list_images.count()),
+				QtWidgets.QMessageBox.Ok
+			)
+	
+	
+	def updateDigest(self,filepath="",digest=""):
+		"""MD5 sum of a file was calculated: update the corresponding item.
+
+If the item does not yet exist, the digest is kept until it is created."""
+		if os.path.dirname(filepath) != self.ustr_path: return
+		filename = os.path.basename(filepath)
+		if filename in self.dct_items:
+			self.dct_items[filename].setDigest(digest)
+		else:
+			self.dct_digests[filename] = digest
+	
+	
+	def cancelIngest(self):
+		"""Progress dialog was cancelled: tell the worker to stop.
+
+The worker's thread is busy, so the flag has to be set from the GUI thread."""
+		if self.worker_ingest != None:
+			self.worker_ingest.cancel()
+	
+	
+	def stopIngest(self):
+		"""Cancel a running ingest worker, wait for its thread and close the progress dialog."""
+		if self.worker_ingest != None:
+			self.worker_ingest.cancel()
+			self.thread_ingest.quit()
+			self.thread_ingest.wait()
+			self.worker_ingest = None
+			self.thread_ingest = None
+		if self.progress_ingest != None:
+			self.progress_ingest.close()
+			self.progress_ingest = None
+	
+	
+	def resetActions(self):
+		"""Reset the state of all actions depending on the image list."""
 		#self.action_apply.setEnabled(False)
 		self.action_save.setEnabled(False)
 		self.wasSaved = False
@@ -986,12 +965,26 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		self.action_rotateRight.setEnabled(False)
 	
 	
+	def rebuildCache(self):
+		"""Discard all metadata cache entries and re-scan the current directory."""
+		self.stopIngest()
+		self.cache.clear()
+		self.updateImageList()
+	
+	
+
 	def listImagesItemChanged(self,item):
-		edited = False
-		for i in range(0,self.list_images.count()):
-			if self.list_images.item(i).edited():
-				edited = True
-				break
+		self.listImagesItemsChanged((item,))
+	
+	
+	def listImagesItemsChanged(self,items):
+		# 2026-10-18: lazy mode: calculate MD5 sum of edited items in the background
+		for item in items:
+			if item.edited() and not item.hasDigest():
+				self.pool_digest.submit(os.path.join(self.ustr_path,item.filename()))
+		
+		# 2026-10-18: the gallery model keeps track of edited items
+		edited = self.list_images.editedCount() > 0
 		if edited: self.wasSaved = False
 		#self.action_apply.setEnabled(edited and len(self.ustr_path_exiftool) > 0)
 		self.action_save.setEnabled(edited and len(self.ustr_path_exiftool) > 0)
@@ -1003,6 +996,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		self.scroll_image_label.updateItem(self.ustr_path,item)
 		self.scroll_image_label.adjustSize()
 		self.main_widget.setCurrentIndex(1)
+		self.prefetchPreviewImages()
 	
 	
 	def closePreviewImage(self):
@@ -1022,6 +1016,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		item = self.list_images.currentItem()
 		self.scroll_image_label.updateItem(self.ustr_path,item)
 		self.scroll_image_label.adjustSize()
+		self.prefetchPreviewImages()
 	
 	
 	def loadNextPreviewImage(self):
@@ -1036,34 +1031,40 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		item = self.list_images.currentItem()
 		self.scroll_image_label.updateItem(self.ustr_path,item)
 		self.scroll_image_label.adjustSize()
+		self.prefetchPreviewImages()
+	
+	
+	def prefetchPreviewImages(self):
+		"""Decode the images following and preceding the current one in the background."""
+		count = self.list_images.count()
+		index = self.list_images.currentRow()
+		if count == 0 or index < 0: return
+		rows = []
+		for offset in range(1,self.int_previewprefetch+1):
+			for row in ((index + offset) % count,(index - offset) % count):
+				if row != index and row not in rows:
+					rows.append(row)
+		self.scroll_image_label.prefetchItems(self.ustr_path,[self.list_images.item(row) for row in rows])
 	
 	
 	def listImagesSelectionChanged(self):
-		items = self.list_images.selectedItems()
-		if len(items) > 0:
+		# 2026-10-18: data of selected items is aggregated incrementally by
+		#             the gallery view; selected items are only fetched
+		#             if conflicts have to be resolved
+		summary = self.list_images.selectionSummary()
+		if summary.count() > 0:
 			# collect data of selected items
-			location  = set()
-			timezones = set()
-			keywords  = set()
-			copyright = set()
-			description = set()
-			orientationEdited = False
-			locationEdited = False
-			timezonesEdited = False
-			keywordsEdited = False
-			copyrightEdited = False
-			descriptionEdited = False
-			for item in items:
-				location.add(item.location())
-				timezones.add(item.timezones())
-				keywords.add(item.keywords())
-				copyright.add(item.copyright())
-				orientationEdited = orientationEdited or item.orientationEdited()
-				locationEdited = locationEdited or item.locationEdited()
-				timezonesEdited = timezonesEdited or item.timezonesEdited()
-				keywordsEdited = keywordsEdited or item.keywordsEdited()
-				copyrightEdited = copyrightEdited or item.copyrightEdited()
-				descriptionEdited = descriptionEdited or item.descriptionEdited()
+			location  = set(summary.values("location"))
+			timezones = set(summary.values("timezones"))
+			keywords  = set(summary.values("keywords"))
+			copyright = set(summary.values("copyright"))
+			description = set(summary.values("description"))
+			orientationEdited = summary.edited("orientation")
+			locationEdited = summary.edited("location")
+			timezonesEdited = summary.edited("timezones")
+			keywordsEdited = summary.edited("keywords")
+			copyrightEdited = summary.edited("copyright")
+			descriptionEdited = summary.edited("description")
 			l_timezones = len(timezones)
 			l_location  = len(location)
 			l_keywords  = len(keywords)
@@ -1087,10 +1088,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 					QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
 				)
 				if answer == QtWidgets.QMessageBox.Yes:
-					locationEdited = False
-					for item in items:
-						item.setLocation(None,None,None)
-						locationEdited = locationEdited or item.locationEdited()
+					self.list_images.applyEdit(self.list_images.selectedItems(),"setLocation",None,None,None)
+					locationEdited = summary.edited("location")
 					enabled_geo = True
 				else:
 					enabled_geo = False
@@ -1124,10 +1123,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 				)
 				if ok and answer != lst_timezones[0]:
 					(fromTz,toTz) = tuple(str(answer).split(" → ",1))
-					timezonesEdited = False
-					for item in items:
-						item.setTimezones(fromTz,toTz)
-						timezonesEdited = timezonesEdited or item.timezonesEdited()
+					self.list_images.applyEdit(self.list_images.selectedItems(),"setTimezones",fromTz,toTz)
+					timezonesEdited = summary.edited("timezones")
 					enabled_tz = True
 				else:
 					enabled_tz = False
@@ -1159,21 +1156,20 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 				)
 				if ok and answer != str_disable:
 					set_kws = set(keywords.pop())
+					items = self.list_images.selectedItems()
 					keywordsEdited = False
 					if answer == str_empty:
 						# clear keywords of all selected items
 						tpl_kws = ()
-						for item in items:
-							item.setKeywords(tpl_kws)
-							keywordsEdited = keywordsEdited or item.keywordsEdited()
+						self.list_images.applyEdit(items,"setKeywords",tpl_kws)
+						keywordsEdited = summary.edited("keywords")
 					elif answer == str_union:
 						# create union of all keywords and apply it to all selected items
 						for kws in keywords:
 							set_kws = set_kws.union(set(kws))
 						tpl_kws = tuple(set_kws)
-						for item in items:
-							item.setKeywords(tpl_kws)
-							keywordsEdited = keywordsEdited or item.keywordsEdited()
+						self.list_images.applyEdit(items,"setKeywords",tpl_kws)
+						keywordsEdited = summary.edited("keywords")
 					elif answer == str_inter:
 						# create intersection, but don't apply it to the selected items;
 						# editing will be done on this set; addKeyword and
@@ -1181,16 +1177,14 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 						for kws in keywords:
 							set_kws = set_kws.intersection(set(kws))
 						tpl_kws = tuple(set_kws)
-						for item in items:
-							keywordsEdited = keywordsEdited or item.keywordsEdited()
+						keywordsEdited = summary.edited("keywords")
 					elif answer == str_diff:
 						# create symmetric difference and apply it to all selected items
 						for kws in keywords:
 							set_kws = set_kws.symmetric_difference(set(kws))
 						tpl_kws = tuple(set_kws)
-						for item in items:
-							item.setKeywords(tpl_kws)
-							keywordsEdited = keywordsEdited or item.keywordsEdited()
+						self.list_images.applyEdit(items,"setKeywords",tpl_kws)
+						keywordsEdited = summary.edited("keywords")
 					enabled_keywords = True
 				else:
 					enabled_keywords = False
@@ -1219,10 +1213,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 				if ok:
 					if answer != lst_copyright[0]:
 						copyrightNotice = str(answer)
-					copyrightEdited = False
-					for item in items:
-						item.setCopyright(copyrightNotice)
-						copyrightEdited = copyrightEdited or item.copyrightEdited()
+					self.list_images.applyEdit(self.list_images.selectedItems(),"setCopyright",copyrightNotice)
+					copyrightEdited = summary.edited("copyright")
 					enabled_copyright = True
 				else:
 					enabled_copyright = False
@@ -1240,21 +1232,21 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 				except:
 					pass
 				enabled_description = True
-			elif l_copyright > 1 and enabled_description:
-				lst_copyright = ["None (clear description)"]
-				lst_copyright.extend(list(copyright))
+			elif l_description > 1 and enabled_description:
+				# 2026-10-18: descriptions are collected now, so resolve their
+				#             conflicts instead of those of the copyright notices
+				lst_description = ["None (clear description)"]
+				lst_description.extend(list(description))
 				(answer,ok) = QtWidgets.QInputDialog.getItem(self,
-					QtCore.QCoreApplication.translate("Dialog","Copyright Collision"),
-					QtCore.QCoreApplication.translate("Dialog","The selected images feature different copyright notices.\nWhich one should be used?\nIf you cancel this dialog, copyright settings will be disabled."),
-					lst_copyright,0,False
+					QtCore.QCoreApplication.translate("Dialog","Description Collision"),
+					QtCore.QCoreApplication.translate("Dialog","The selected images feature different descriptions.\nWhich one should be used?\nIf you cancel this dialog, description settings will be disabled."),
+					lst_description,0,False
 				)
 				if ok:
-					if answer != lst_copyright[0]:
+					if answer != lst_description[0]:
 						descriptionText = str(answer)
-					descriptionEdited = False
-					for item in items:
-						item.setCopyright(descriptionText)
-						descriptionEdited = copyrightEdited or item.enabled_description()
+					self.list_images.applyEdit(self.list_images.selectedItems(),"setDescription",descriptionText)
+					descriptionEdited = summary.edited("description")
 					enabled_description = True
 				else:
 					enabled_description = False
@@ -1306,23 +1298,26 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 	#-----------------------------------------------------------------------
 	
 	def rotateImageLeft(self):
-		for item in self.list_images.selectedItems(): item.rotateLeft()
+		items = self.list_images.selectedItems()
+		self.list_images.applyEdit(items,"rotateLeft")
 		self.action_resetRotation.setEnabled(True)
-		if self.main_widget.currentIndex() == 1:
-			self.scroll_image_label.updateItem(self.ustr_path,item)
+		if self.main_widget.currentIndex() == 1 and len(items) > 0:
+			self.scroll_image_label.updateItem(self.ustr_path,items[-1])
 			self.scroll_image_label.adjustSize()
 	
 	def rotateImageRight(self):
-		for item in self.list_images.selectedItems(): item.rotateRight()
+		items = self.list_images.selectedItems()
+		self.list_images.applyEdit(items,"rotateRight")
 		self.action_resetRotation.setEnabled(True)
-		if self.main_widget.currentIndex() == 1:
-			self.scroll_image_label.updateItem(self.ustr_path,item)
+		if self.main_widget.currentIndex() == 1 and len(items) > 0:
+			self.scroll_image_label.updateItem(self.ustr_path,items[-1])
 			self.scroll_image_label.adjustSize()
 	
 	def resetRotation(self):
-		for item in self.list_images.selectedItems(): item.resetRotation()
-		if self.main_widget.currentIndex() == 1:
-			self.scroll_image_label.updateItem(self.ustr_path,item)
+		items = self.list_images.selectedItems()
+		self.list_images.applyEdit(items,"resetRotation")
+		if self.main_widget.currentIndex() == 1 and len(items) > 0:
+			self.scroll_image_label.updateItem(self.ustr_path,items[-1])
 			self.scroll_image_label.adjustSize()
 	
 	#-----------------------------------------------------------------------
@@ -1338,17 +1333,16 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 			latitude  = None
 			longitude = None
 			elevation = 0.0
-		edited = False
-		for item in self.list_images.selectedItems():
-			item.setLocation(latitude,longitude,elevation)
-			edited = edited or item.edited()
+		# 2026-10-18: edit all selected items at once
+		self.list_images.applyEdit(self.list_images.selectedItems(),"setLocation",latitude,longitude,elevation)
+		edited = self.list_images.selectionSummary().edited("location")
 		self.dock_timezones.setLocation(latitude,longitude)
 		self.dock_geotagging.setResetEnabled(edited)
 		self.action_resetLocation.setEnabled(edited)
 	
 	
 	def resetLocation(self):
-		for item in self.list_images.selectedItems(): item.resetLocation()
+		self.list_images.applyEdit(self.list_images.selectedItems(),"resetLocation")
 		self.listImagesSelectionChanged()
 	
 	#-----------------------------------------------------------------------
@@ -1359,10 +1353,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 		try:
 			fromTz = str(ftz)
 			toTz   = str(ttz)
-			edited = False
-			for item in self.list_images.selectedItems():
-				item.setTimezones(fromTz,toTz)
-				edited = edited or item.edited()
+			self.list_images.applyEdit(self.list_images.selectedItems(),"setTimezones",fromTz,toTz)
+			edited = self.list_images.selectionSummary().edited("timezones")
 			self.dock_timezones.setResetEnabled(edited)
 			self.action_resetTimezones.setEnabled(edited)
 		except:
@@ -1370,7 +1362,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 	
 	
 	def resetTimezones(self):
-		for item in self.list_images.selectedItems(): item.resetTimezones()
+		self.list_images.applyEdit(self.list_images.selectedItems(),"resetTimezones")
 		self.listImagesSelectionChanged()
 	
 	#-----------------------------------------------------------------------
@@ -1380,10 +1372,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 	def addKeyword(self,keyword=""):
 		try:
 			keyword = str(keyword)
-			edited = False
-			for item in self.list_images.selectedItems():
-				item.addKeyword(keyword)
-				edited = edited or item.edited()
+			self.list_images.applyEdit(self.list_images.selectedItems(),"addKeyword",keyword)
+			edited = self.list_images.selectionSummary().edited("keywords")
 			self.dock_keywords.setResetEnabled(edited)
 			self.action_resetKeywords.setEnabled(edited)
 		except:
@@ -1393,10 +1383,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 	def removeKeyword(self,keyword=""):
 		try:
 			keyword = str(keyword)
-			edited = False
-			for item in self.list_images.selectedItems():
-				item.removeKeyword(keyword)
-				edited = edited or item.edited()
+			self.list_images.applyEdit(self.list_images.selectedItems(),"removeKeyword",keyword)
+			edited = self.list_images.selectionSummary().edited("keywords")
 			self.dock_keywords.setResetEnabled(edited)
 			self.action_resetKeywords.setEnabled(edited)
 		except:
@@ -1404,7 +1392,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 	
 	
 	def resetKeywords(self):
-		for item in self.list_images.selectedItems(): item.resetKeywords()
+		self.list_images.applyEdit(self.list_images.selectedItems(),"resetKeywords")
 		self.listImagesSelectionChanged()
 	
 	#-----------------------------------------------------------------------
@@ -1414,10 +1402,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 	def updateCopyright(self,notice=""):
 		try:
 			notice = str(notice)
-			edited = False
-			for item in self.list_images.selectedItems():
-				item.setCopyright(notice)
-				edited = edited or item.edited()
+			self.list_images.applyEdit(self.list_images.selectedItems(),"setCopyright",notice)
+			edited = self.list_images.selectionSummary().edited("copyright")
 			self.dock_copyright.setResetEnabled(edited)
 			self.action_resetCopyright.setEnabled(edited)
 		except:
@@ -1425,7 +1411,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 	
 	
 	def resetCopyright(self):
-		for item in self.list_images.selectedItems(): item.resetCopyright()
+		self.list_images.applyEdit(self.list_images.selectedItems(),"resetCopyright")
 		self.listImagesSelectionChanged()
 	
 	#-----------------------------------------------------------------------
@@ -1435,10 +1421,8 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 	def updateDescription(self,notice=""):
 		try:
 			notice = str(notice)
-			edited = False
-			for item in self.list_images.selectedItems():
-				item.setDescription(notice)
-				edited = edited or item.edited()
+			self.list_images.applyEdit(self.list_images.selectedItems(),"setDescription",notice)
+			edited = self.list_images.selectionSummary().edited("description")
 			self.dock_description.setResetEnabled(edited)
 			self.action_resetDescription.setEnabled(edited)
 		except:
@@ -1446,7 +1430,7 @@ class FPPMainWindow(QtWidgets.QMainWindow):
 
 
 	def resetDescription(self):
-		for item in self.list_images.selectedItems(): item.resetDescription()
+		self.list_images.applyEdit(self.list_images.selectedItems(),"resetDescription")
 		self.listImagesSelectionChanged()
 
 	#-----------------------------------------------------------------------
@@ -1458,15 +1442,15 @@ Returns:
    A list of lists: [[cmd,arg1,...argn],...]"""
 		commands = []
 		dct_parameters = {}
-		lst_all_files = []
-		for i in range(0,self.list_images.count()):
-			item = self.list_images.item(i)
+		# 2026-10-18: only edited items are inspected
+		for item in self.list_images.editedItems():
 			name = str(os.path.join(self.ustr_path,item.filename()))
-			lst_all_files.append(name)
 			
 			if item.edited():
 				# 2017-07-14: start parameter list with the original file's MD5 sum,
 				# stored as image UID; also store original filename
+				# 2026-10-18: MD5 sum is calculated by the digest pool on demand,
+				#             i.e. wait if it is still outstanding
 				parameters = [ "-ImageUniqueID={}".format(item.digest()) ]
 				
 				if item.orientationEdited():
@@ -1562,8 +1546,7 @@ This method creates a "save file" dialog."""
 	
 	
 	def resetAll(self):
-		for item in self.list_images.selectedItems():
-			item.resetAll()
+		self.list_images.applyEdit(self.list_images.selectedItems(),"resetAll")
 		self.dock_geotagging.resetData()
 		self.dock_timezones.resetData()
 		self.dock_keywords.resetData()
@@ -1600,13 +1583,15 @@ This method creates a "save file" dialog."""
 			settings.setIniCodec(QtCore.QTextCodec.codecForName("UTF-8"))
 			
 			self.ustr_path_exiftool = self.sanitiseExecutable(
-				str(settings.value("ExiftoolPath","/usr/bin/exiftool").toString())
+				str(settings.value("ExiftoolPath","/usr/bin/exiftool"))
 			)
 			self.ustr_path_gimp = self.sanitiseExecutable(
-				str(settings.value("TheGimpPath","/usr/bin/gimp").toString())
+				str(settings.value("TheGimpPath","/usr/bin/gimp"))
 			)
 			self.action_openGimp.setEnabled(len(self.ustr_path_gimp) > 0)
 			self.action_openDir.setEnabled(len(self.ustr_path_exiftool) > 0)
+			self.extractor_preview.setExiftoolPath(self.ustr_path_exiftool)
+			self.dock_timezones.loadBoundaries(str(settings.value("TimezoneBoundaries","")))
 			#self.action_apply.setEnabled(self.action_apply.isEnabled() and len(self.ustr_path_exiftool) > 0)
 			self.action_save.setEnabled(self.action_save.isEnabled() and len(self.ustr_path_exiftool) > 0)
 			
@@ -1615,9 +1600,29 @@ This method creates a "save file" dialog."""
 			
 			try:    self.int_readsize = int(settings.value("ReadSize",1024))
 			except: self.int_readsize = 1024
-	
-			try:    self.float_readdelay = float(settings.value("ReadDelay",0.0001))
-			except: self.float_readdelay = 0.0001
+			
+			try:    self.int_cachesize = int(settings.value("CacheSize",512))
+			except: self.int_cachesize = 512
+			
+			try:    self.int_thumbnailmemory = int(settings.value("ThumbnailMemory",128))
+			except: self.int_thumbnailmemory = 128
+			
+			try:    self.int_previewmemory = int(settings.value("PreviewMemory",256))
+			except: self.int_previewmemory = 256
+			
+			try:    self.int_previewprefetch = int(settings.value("PreviewPrefetch",2))
+			except: self.int_previewprefetch = 2
+			
+			try:    self.int_exiftoolprocesses = int(settings.value("ExiftoolProcesses",os.cpu_count() or 1))
+			except: self.int_exiftoolprocesses = os.cpu_count() or 1
+			
+			self.str_ingestbackend = str(settings.value("IngestBackend",FotoPreProcessorIngest.FPPIngestWorker.BackendXML))
+			
+			self.bool_lazydigests = settings.value("LazyDigests",True) in ("true",True)
+			self.list_images.setIconMemory(self.int_thumbnailmemory * 1024**2)
+			self.scroll_image_label.setCacheMemory(self.int_previewmemory * 1024**2)
+			self.openCache()
+			self.action_rebuildCache.setEnabled(self.cache.isEnabled())
 	
 	#-----------------------------------------------------------------------
 	
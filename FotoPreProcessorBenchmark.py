@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FotoPreProcessorBenchmark: micro benchmarks of FotoPreProcessor's ingest code
+Copyright (C) 2012-2017 Frank Abelbeck <frank.abelbeck@googlemail.com>
+
+This file is part of the FotoPreProcessor program "FotoPreProcessor.py".
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+2026-10-18: parsing of exiftool's XML output, minidom vs. streaming parser
+2026-10-18: ingest backends, XML (-X) vs. JSON (-j) output
+2026-10-18: sorting gallery items, comparison operators vs. sort keys
+
+Synthetic exiftool output is generated, i.e. neither exiftool nor any image
+files are needed. Usage:
+
+   python3 FotoPreProcessorBenchmark.py [-h] [-b] [-o] [-n FILES] [-p KIB] [-c BYTES]
+"""
+
+import sys,os,time,base64,json,random,argparse,tracemalloc,xml.dom.minidom
+
+import FotoPreProcessorIngest,FotoPreProcessorItem
+
+
+def makeTags(i=0,thumbnail="",preview=""):
+	"""Return the tags exiftool reports for the i-th synthetic file as a list of
+tuples (group,tag,value); thumbnail and preview are base64 strings."""
+	lst_tags = [
+		("IFD0","Orientation","Horizontal (normal)"),
+		("IFD0","Model","Canon EOS 5D Mark III"),
+		("IFD0","Copyright","Copyright (C) 2017 Jane Doe"),
+		("ExifIFD","DateTimeOriginal","2017 07 14 12 {0:02d} {1:02d}".format(i//60%60,i%60)),
+		("ExifIFD","FocalLength",50.5),
+		("ExifIFD","ISO",400),
+		("GPS","GPSLatitude",52.374444),
+		("GPS","GPSLatitudeRef","N"),
+		("GPS","GPSLongitude",9.738611),
+		("GPS","GPSLongitudeRef","E"),
+		("IPTC","Keywords",["holiday","family & friends"]),
+		("Canon","LensType","Canon EF 50mm f/1.8 STM"),
+		("Composite","Aperture",2.8),
+		("Composite","ShutterSpeed","1/250"),
+		("Composite","ScaleFactor35efl",1.5),
+		("Composite","ImageSize","5760x3840"),
+		("IFD1","ThumbnailImage",thumbnail)
+	]
+	if len(preview) > 0:
+		lst_tags.append(("Composite","PreviewImage",preview))
+	return lst_tags
+
+
+def makeXMLBatch(files=100,previewsize=0):
+	"""Create exiftool -X output (as bytes) describing given number of files.
+
+previewsize is the size of the embedded preview image in bytes (0: none); a
+small thumbnail image is always embedded."""
+	thumbnail = base64.b64encode(os.urandom(8*1024)).decode()
+	preview = base64.b64encode(os.urandom(previewsize)).decode()
+	lst_lines = [
+		"<?xml version='1.0' encoding='UTF-8'?>",
+		"<rdf:RDF xmlns:rdf='http://www.w3.org/1999/02/22-rdf-syntax-ns#'>"
+	]
+	for i in range(files):
+		lst_lines.extend((
+			"",
+			"<rdf:Description rdf:about='/home/user/pictures/trip/IMG_{0:05d}.CR2'".format(i),
+			"  xmlns:et='http://ns.exiftool.ca/1.0/' et:toolkit='Image::ExifTool 10.50'",
+			"  xmlns:IFD0='http://ns.exiftool.ca/EXIF/IFD0/1.0/'",
+			"  xmlns:IFD1='http://ns.exiftool.ca/EXIF/IFD1/1.0/'",
+			"  xmlns:ExifIFD='http://ns.exiftool.ca/EXIF/ExifIFD/1.0/'",
+			"  xmlns:GPS='http://ns.exiftool.ca/EXIF/GPS/1.0/'",
+			"  xmlns:IPTC='http://ns.exiftool.ca/IPTC/IPTC/1.0/'",
+			"  xmlns:Canon='http://ns.exiftool.ca/MakerNotes/Canon/1.0/'",
+			"  xmlns:Composite='http://ns.exiftool.ca/Composite/1.0/'>"
+		))
+		for group,tag,value in makeTags(i,thumbnail,preview):
+			if isinstance(value,list):
+				lst_lines.append(" <{0}:{1}>".format(group,tag))
+				lst_lines.append("  <rdf:Bag>")
+				for item in value:
+					lst_lines.append("   <rdf:li>{0}</rdf:li>".format(item.replace("&","&amp;")))
+				lst_lines.append("  </rdf:Bag>")
+				lst_lines.append(" </{0}:{1}>".format(group,tag))
+			elif tag in ("ThumbnailImage","PreviewImage"):
+				lst_lines.append(" <{0}:{1} rdf:datatype='http://www.w3.org/2001/XMLSchema#base64Binary'>".format(group,tag))
+				lst_lines.append(value)
+				lst_lines.append("</{0}:{1}>".format(group,tag))
+			else:
+				lst_lines.append(" <{0}:{1}>{2}</{0}:{1}>".format(group,tag,value))
+		lst_lines.append("</rdf:Description>")
+	lst_lines.append("</rdf:RDF>")
+	return "\n".join(lst_lines).encode()
+
+
+def makeJSONBatch(files=100,previewsize=0):
+	"""Create exiftool -j output (as bytes) describing given number of files
+(cf. makeXMLBatch()); binary data is exported as "base64:..." strings."""
+	thumbnail = base64.b64encode(os.urandom(8*1024)).decode()
+	preview = base64.b64encode(os.urandom(previewsize)).decode()
+	lst_objects = []
+	for i in range(files):
+		dct_tags = { "SourceFile": "/home/user/pictures/trip/IMG_{0:05d}.CR2".format(i) }
+		for group,tag,value in makeTags(i,thumbnail,preview):
+			if tag in ("ThumbnailImage","PreviewImage"):
+				value = "base64:" + value
+			dct_tags[tag] = value
+		lst_objects.append(dct_tags)
+	return json.dumps(lst_objects,indent=2).encode()
+
+
+def iterChunks(data=b"",chunksize=1024):
+	"""Split data into chunks, emulating reads from exiftool's stdout."""
+	for i in range(0,len(data),chunksize):
+		yield data[i:i+chunksize]
+
+
+def parseMinidom(data=b"",chunksize=1024):
+	"""Reference implementation: build a DOM of the whole batch, then convert
+every description (the scan code of FotoPreProcessor 2017)."""
+	def getFirstTextChild(node):
+		value = ""
+		for child in node.childNodes:
+			if child.nodeType == node.TEXT_NODE and len(child.nodeValue.strip()) > 0:
+				value = str(node.childNodes[0].nodeValue.strip())
+				break
+		return value
+
+	set_tags = set(FotoPreProcessorIngest.FPPIngestWorker.ScanTags)
+	str_output = ""
+	for chunk in iterChunks(data,chunksize):
+		str_output += chunk.decode()
+	lst_records = []
+	for description in xml.dom.minidom.parseString(str_output).getElementsByTagName("rdf:Description"):
+		record = {}
+		for node in description.childNodes:
+			if node.nodeType != node.ELEMENT_NODE: continue
+			if node.localName == "Keywords":
+				keywords = []
+				rdfBag = node.getElementsByTagName("rdf:Bag")
+				if len(rdfBag) > 0:
+					for bagItem in rdfBag[0].getElementsByTagName("rdf:li"):
+						keywords.append(getFirstTextChild(bagItem))
+				else:
+					keywords.append(getFirstTextChild(node))
+				record["Keywords"] = keywords
+			elif node.localName in ("ThumbnailImage","PreviewImage"):
+				record[node.localName] = base64.b64decode(getFirstTextChild(node))
+			elif node.localName in set_tags:
+				record[node.localName] = getFirstTextChild(node)
+		lst_records.append((str(description.getAttribute("rdf:about")),record))
+	return lst_records
+
+
+def parseStreaming(data=b"",chunksize=1024):
+	"""Current implementation: feed chunks to FPPRecordParser."""
+	parser = FotoPreProcessorIngest.FPPRecordParser(FotoPreProcessorIngest.FPPIngestWorker.ScanTags)
+	lst_records = []
+	for chunk in iterChunks(data,chunksize):
+		lst_records.extend(parser.feed(chunk))
+	lst_records.extend(parser.close())
+	return lst_records
+
+
+def parseJSON(data=b"",chunksize=1024):
+	"""JSON backend: collect chunks, then let FPPJSONRecordParser parse the batch."""
+	parser = FotoPreProcessorIngest.FPPJSONRecordParser(FotoPreProcessorIngest.FPPIngestWorker.ScanTags)
+	lst_records = []
+	for chunk in iterChunks(data,chunksize):
+		lst_records.extend(parser.feed(chunk))
+	lst_records.extend(parser.close())
+	return lst_records
+
+
+def measure(function,data=b"",chunksize=1024,repeat=3):
+	"""Run function(data,chunksize); returns a tuple (seconds,peak) of the best
+run time and the peak memory allocated during a separate (traced) run."""
+	float_best = float("inf")
+	for i in range(repeat):
+		t = time.perf_counter()
+		function(data,chunksize)
+		float_best = min(float_best,time.perf_counter()-t)
+	tracemalloc.start()
+	function(data,chunksize)
+	(current,peak) = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return (float_best,peak)
+
+
+def benchmarkParsers(files=100,previewsize=256*1024,chunksize=1024,repeat=3):
+	"""Compare all parsers on batches without and with embedded previews."""
+	parsers = (
+		("minidom",parseMinidom),
+		("streaming",parseStreaming),
+	)
+	print("{0:<12} {1:>10} {2:>12} {3:>12} {4:>12}".format("parser","previews","batch [MiB]","time [s]","peak [MiB]"))
+	for size in (0,previewsize):
+		data = makeXMLBatch(files,size)
+		reference = parseMinidom(data,chunksize)
+		for name,function in parsers:
+			if function(data,chunksize) != reference:
+				print("{0}: records differ from reference".format(name))
+			(seconds,peak) = measure(function,data,chunksize,repeat)
+			print("{0:<12} {1:>10} {2:>12.1f} {3:>12.3f} {4:>12.1f}".format(
+				name,
+				"yes" if size > 0 else "no",
+				len(data)/1024**2,
+				seconds,
+				peak/1024**2
+			))
+
+
+def benchmarkBackends(files=5000,previewsize=0,chunksize=1024,repeat=3,stepsize=64):
+	"""Compare the ingest backends on a directory of given number of files,
+scanned in batches of stepsize files (cf. FPPIngestWorker)."""
+	backends = (
+		("xml",makeXMLBatch,parseStreaming),
+		("json",makeJSONBatch,parseJSON),
+	)
+	batches = [min(stepsize,files-i) for i in range(0,files,stepsize)]
+	print("{0} files in {1} batches".format(files,len(batches)))
+	print("{0:<12} {1:>10} {2:>12} {3:>12} {4:>12}".format("backend","previews","output [MiB]","time [s]","peak [MiB]"))
+	reference = None
+	for name,makeBatch,parse in backends:
+		# every batch of same size yields the same output: create it once
+		dct_data = dict([(size,makeBatch(size,previewsize)) for size in set(batches)])
+		def parseDirectory(data,chunksize):
+			for size in batches:
+				parse(dct_data[size],chunksize)
+		records = [(filepath,sorted(record.items())) for filepath,record in parse(dct_data[batches[0]],chunksize)]
+		for filepath,record in records:
+			record[:] = [(tag,value) for tag,value in record if tag not in ("ThumbnailImage","PreviewImage")]
+		if reference == None:
+			reference = records
+		elif records != reference:
+			print("{0}: records differ from xml backend".format(name))
+		(seconds,peak) = measure(parseDirectory,b"",chunksize,repeat)
+		print("{0:<12} {1:>10} {2:>12.1f} {3:>12.3f} {4:>12.1f}".format(
+			name,
+			"yes" if previewsize > 0 else "no",
+			sum([len(dct_data[size]) for size in batches])/1024**2,
+			seconds,
+			peak/1024**2
+		))
+
+
+class ReferenceSortItem(object):
+	"""Reference implementation: wrap a gallery item and compare like the
+FPPGalleryItem.__lt__() of FotoPreProcessor 2017 (comparisonHelper); the
+compared properties were item attributes, so they are copied once."""
+	
+	SortByName   = FotoPreProcessorItem.FPPGalleryItem.SortByName
+	SortByTime   = FotoPreProcessorItem.FPPGalleryItem.SortByTime
+	SortByCamera = FotoPreProcessorItem.FPPGalleryItem.SortByCamera
+	
+	def __init__(self,item):
+		self.item = item
+		self.str_filename = item.filename()
+		self.date_timestamp = item.timestamp()
+		self.str_cameraHardware = item.cameraHardware()
+		self.int_sortCriterion = item.int_sortCriterion
+	
+	def __lt__(self,other):
+		a,b = self,other
+		try:
+			resultName = a.str_filename < b.str_filename
+			resultTime = a.date_timestamp < b.date_timestamp
+			resultCam  = a.str_cameraHardware < b.str_cameraHardware
+			result = False
+			try:
+				if a.int_sortCriterion == a.SortByName:
+					result = resultName
+				elif a.int_sortCriterion == a.SortByCamera:
+					if a.str_cameraHardware == b.str_cameraHardware:
+						if a.date_timestamp == b.date_timestamp:
+							result = resultName
+						else:
+							result = resultTime
+					else:
+						result = resultCam
+				elif a.int_sortCriterion == a.SortByTime:
+					if a.date_timestamp == b.date_timestamp:
+						result = resultName
+					else:
+						result = resultTime
+			except:
+				pass
+			return result
+		except:
+			return False
+
+
+def makeItems(files=10000):
+	"""Create given number of gallery items in random order: a few cameras,
+image series sharing a timestamp."""
+	lst_cameras = [
+		"Canon EOS 5D Mark III, Canon EF 50mm f/1.8 STM",
+		"Canon EOS 450D, Canon EF-S 15-85mm f/3.5-5.6 IS USM",
+		"Nikon D750, AF-S NIKKOR 24-120mm f/4G ED VR",
+		"Apple iPhone 7"
+	]
+	rng = random.Random(files)
+	store = FotoPreProcessorItem.FPPMetadataStore()
+	lst_items = []
+	for i in range(files):
+		item = FotoPreProcessorItem.FPPGalleryItem(store)
+		item.setFilename("IMG_{0:06d}.CR2".format(i))
+		item.setCameraHardware(rng.choice(lst_cameras))
+		seconds = rng.randrange(files//3 + 1)
+		item.setTimestamp((2017,7,14,seconds//3600%24,seconds//60%60,seconds%60))
+		lst_items.append(item)
+	rng.shuffle(lst_items)
+	return lst_items
+
+
+def benchmarkSorting(sizes=(10000,50000,100000),repeat=3):
+	"""Compare sorting items by comparison operators vs. by precomputed keys;
+"keys" includes computing the keys, "cached keys" re-sorts with keys
+already computed (e.g. after switching the sort criterion back)."""
+	criteria = (
+		("name",FotoPreProcessorItem.FPPGalleryItem.SortByName),
+		("time",FotoPreProcessorItem.FPPGalleryItem.SortByTime),
+		("camera",FotoPreProcessorItem.FPPGalleryItem.SortByCamera),
+	)
+	print("{0:>8} {1:<8} {2:>14} {3:>12} {4:>12}".format("items","order","reference [s]","keys [s]","cached [s]"))
+	for size in sizes:
+		lst_items = makeItems(size)
+		for name,criterion in criteria:
+			for item in lst_items:
+				item.setSortCriterion(criterion)
+			reference = [wrapper.item for wrapper in sorted([ReferenceSortItem(item) for item in lst_items])]
+			lst_sorted = sorted(lst_items,key=FotoPreProcessorItem.FPPGalleryItem.sortKey)
+			if any([a is not b for a,b in zip(lst_sorted,reference)]):
+				print("{0}: order differs from reference".format(name))
+			float_reference = float_keys = float_cached = float("inf")
+			for i in range(repeat):
+				lst_wrapped = [ReferenceSortItem(item) for item in lst_items]
+				t = time.perf_counter()
+				lst_wrapped.sort()
+				float_reference = min(float_reference,time.perf_counter()-t)
+				for item in lst_items:
+					item.tpl_sortKeys = None
+				lst_sorted = list(lst_items)
+				t = time.perf_counter()
+				lst_sorted.sort(key=FotoPreProcessorItem.FPPGalleryItem.sortKey)
+				float_keys = min(float_keys,time.perf_counter()-t)
+				lst_sorted = list(lst_items)
+				t = time.perf_counter()
+				lst_sorted.sort(key=FotoPreProcessorItem.FPPGalleryItem.sortKey)
+				float_cached = min(float_cached,time.perf_counter()-t)
+			print("{0:>8} {1:<8} {2:>14.3f} {3:>12.3f} {4:>12.3f}".format(size,name,float_reference,float_keys,float_cached))
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="Benchmark parsing of exiftool output with synthetic data.")
+	parser.add_argument("-b","--backends",action="store_true",help="compare ingest backends (XML vs. JSON) on a whole directory instead of XML parsers on a single batch")
+	parser.add_argument("-n","--files",type=int,default=None,help="number of files per batch (default: 100) or directory (default: 5000)")
+	parser.add_argument("-o","--sorting",action="store_true",help="compare sorting of gallery items (comparison operators vs. sort keys) at 10k/50k/100k items or given number of files")
+	parser.add_argument("-s","--stepsize",type=int,default=64,help="number of files per batch when comparing backends (default: 64)")
+	parser.add_argument("-p","--preview",type=int,default=None,help="size of embedded previews in KiB, 0: none (default: 256 for parsers, 0 for backends)")
+	parser.add_argument("-c","--chunksize",type=int,default=1024,help="bytes read from exiftool at once (default: 1024)")
+	parser.add_argument("-r","--repeat",type=int,default=3,help="number of timed runs (default: 3)")
+	args = parser.parse_args()
+	if args.sorting:
+		benchmarkSorting((args.files,) if args.files else (10000,50000,100000),args.repeat)
+	elif args.backends:
+		benchmarkBackends(args.files or 5000,(args.preview or 0)*1024,args.chunksize,args.repeat,args.stepsize)
+	else:
+		benchmarkParsers(args.files or 100,(256 if args.preview == None else args.preview)*1024,args.chunksize,args.repeat)
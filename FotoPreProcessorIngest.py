@@ -0,0 +1,895 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FotoPreProcessorIngest: background scanning of image directories
+Copyright (C) 2012-2017 Frank Abelbeck <frank.abelbeck@googlemail.com>
+
+This file is part of the FotoPreProcessor program "FotoPreProcessor.py".
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+2026-10-18: directory ingest moved from FPPMainWindow.updateImageList to a
+            worker object living in its own thread
+"""
+
+import sys,os,subprocess,time,base64,hashlib,queue,threading,selectors,json,concurrent.futures,xml.etree.ElementTree
+
+from PyQt5 import QtGui, QtCore
+
+
+class FPPIngestWorker(QtCore.QObject):
+	"""Class for scanning a list of image files in a background thread.
+
+The worker is meant to be moved to a QThread; run() is started by the thread's
+started() signal. Metadata is read from the metadata cache or via exiftool and
+the MD5 sum is calculated. Results are delivered to the GUI thread as lists of
+records, i.e. tuples
+
+   (filename,record,thumbnail,digest)
+
+with record being a dict of tag values (cf. FPPRecordParser), thumbnail the
+encoded thumbnail image (bytes) and digest a hex string. The GUI thread only
+has to create the items; thumbnails are decoded when they are shown.
+
+MD5 sums of new files are calculated by an FPPDigestPool while scanning goes
+on; these records carry an empty digest, the pool delivers it later."""
+
+	# new signal/slot mechanism: define emitted signals (must be class vars!)
+	recordsReady = QtCore.pyqtSignal(list)
+	progress = QtCore.pyqtSignal(int,str)
+	finished = QtCore.pyqtSignal()
+
+	# names of the text-valued tags requested from exiftool
+	ScanTags = (
+		"Orientation", "DateTimeOriginal", "FocalLength", "ScaleFactor35efl",
+		"Aperture", "ShutterSpeed", "ISO", "Model", "LensType",
+		"ThumbnailImageValidArea", "Copyright", "Description", "Author",
+		"GPSLatitude", "GPSLatitudeRef", "GPSLongitude", "GPSLongitudeRef",
+		"GPSAltitude", "GPSAltitudeRef", "ImageSize"
+	)
+
+	# arguments passed to every exiftool process of the pool
+	# (output format is added according to the backend)
+	# 2026-10-18: -PreviewImage is no longer requested: previews are large and
+	#             extracted on demand instead (cf. FPPPreviewExtractor)
+	ScanArgs = (
+		"-b",
+		"-m",
+		"-if",
+		"$MIMEType =~ /^image/",
+		"-d",
+		"%Y %m %d %H %M %S",
+		"-Orientation",
+		"-DateTimeOriginal",
+		"-Keywords",
+		"-FocalLength#",
+		"-ScaleFactor35efl",
+		"-Aperture",
+		"-ShutterSpeed",
+		"-ISO",
+		"-Model",
+		"-LensType",
+		"-ThumbnailImageValidArea",
+		"-Copyright",
+		"-xmp-dc:description",
+		"-Author",
+		"-GPS:GPSLatitude#",
+		"-GPS:GPSLatitudeRef#",
+		"-GPS:GPSLongitude#",
+		"-GPS:GPSLongitudeRef#",
+		"-GPS:GPSAltitude#",
+		"-GPS:GPSAltitudeRef#",
+		"-ThumbnailImage",
+		"-ImageSize"
+	)
+
+	# number of files looked up in the cache between two progress reports
+	CacheBatchSize = 64
+
+	# quality hint for decoding scaled thumbnails (cf. QImageReader.setQuality)
+	ThumbnailQuality = 75
+
+	# ingest backends: name -> (exiftool output format option, parser class)
+	BackendXML  = "xml"
+	BackendJSON = "json"
+
+	def __init__(self,filelist=(),path_exiftool="",cache=None,thumbsize=None,stepsize=4,readsize=1024,processes=1,backend="xml",digests=None):
+		"""Constructor; initialise fields.
+
+filelist is a sequence of absolute file paths, cache an FPPMetadataCache and
+thumbsize the QSize thumbnails are scaled to. processes is the number of
+exiftool processes scanning the files in parallel. backend selects exiftool's
+output format, FPPIngestWorker.BackendXML (-X) or FPPIngestWorker.BackendJSON
+(-j); both yield the same records. digests is the FPPDigestPool MD5 sums are
+calculated by (None: no MD5 sums)."""
+		super().__init__()
+		self.lst_files = list(filelist)
+		self.ustr_path_exiftool = str(path_exiftool)
+		self.cache = cache
+		self.pool_digest = digests
+		self.size_thumb = QtCore.QSize(thumbsize)
+		self.int_stepsize = max(int(stepsize),1)
+		self.int_readsize = max(int(readsize),1)
+		self.int_processes = max(int(processes),1)
+		if backend == self.BackendJSON:
+			self.str_format = "-j"
+			self.class_parser = FPPJSONRecordParser
+		else:
+			self.str_format = "-X"
+			self.class_parser = FPPRecordParser
+		self.int_processed = 0
+		self.bool_cancelled = False
+		self.bool_failed = False
+		# 2026-10-18: records of a batch are completed on a pool of threads
+		self.executor_records = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+	def cancel(self):
+		"""Request the worker to stop. Safe to be called from the GUI thread."""
+		self.bool_cancelled = True
+
+
+	def isCancelled(self):
+		"""Return True if scanning was stopped, by cancel() or by failure."""
+		return self.bool_cancelled
+
+
+	def isFailed(self):
+		"""Return True if scanning was stopped because exiftool could not be
+started or terminated unexpectedly; records emitted so far are valid."""
+		return self.bool_failed
+
+
+	def run(self):
+		"""Scan all files: first consult the cache, then run exiftool on the rest."""
+		try:
+			lst_uncached = self.processCachedFiles()
+			if len(lst_uncached) > 0 and len(self.ustr_path_exiftool) > 0 and not self.bool_cancelled:
+				self.processExiftoolFiles(lst_uncached)
+		except:
+			print("error while scanning image files:",sys.exc_info())
+		self.executor_records.shutdown(wait=True)
+		if self.cache != None:
+			self.cache.commit()
+		self.finished.emit()
+
+
+	def advance(self,count=1,filename=""):
+		self.int_processed += count
+		self.progress.emit(self.int_processed,filename)
+
+
+	def processCachedFiles(self):
+		"""Create records for all files with an up-to-date cache entry.
+
+Records are emitted and progress is advanced every CacheBatchSize files looked
+up, i.e. also if these are non-image files or not cached at all.
+
+Returns the list of files not found in the cache."""
+		lst_uncached = []
+		lst_records = []
+		n_hits = 0
+		for index,filepath in enumerate(self.lst_files,1):
+			if self.bool_cancelled: break
+			cached = None
+			if self.cache != None:
+				cached = self.cache.lookup(filepath)
+			if cached == None:
+				lst_uncached.append(filepath)
+			else:
+				n_hits += 1
+				(record,thumbData,digest) = cached
+				if record != None: # None: known non-image file
+					if len(digest) == 0 and self.pool_digest != None:
+						# MD5 sum was not calculated completely last time
+						self.pool_digest.submit(filepath)
+					if len(thumbData) == 0:
+						thumbData = self.loadThumbnailData(filepath,record)
+					if thumbData != None:
+						lst_records.append((os.path.basename(filepath),record,thumbData,digest))
+			if index % self.CacheBatchSize == 0 and n_hits > 0:
+				if len(lst_records) > 0:
+					self.recordsReady.emit(lst_records)
+					lst_records = []
+				self.advance(n_hits,os.path.basename(filepath))
+				n_hits = 0
+		if len(lst_records) > 0:
+			self.recordsReady.emit(lst_records)
+		self.advance(n_hits)
+		return lst_uncached
+
+
+	def processExiftoolFiles(self,filelist=()):
+		"""Scan given files with a pool of exiftool processes.
+
+The files are split into batches of StepSize files. Every process is served by
+a thread which takes batches from a work queue and hands them over to its
+exiftool process. Output is passed on via a per-batch queue as soon as it is
+read. It is parsed here in batch order, i.e. records are emitted in the order
+of the file list.
+
+Not more than two batches per process are queued in advance; this way memory
+consumption is bounded if parsing is slower than exiftool."""
+		batches = [filelist[i:i+self.int_stepsize] for i in range(0,len(filelist),self.int_stepsize)]
+		int_processes = min(self.int_processes,len(batches))
+		queue_batches = queue.Queue()
+		dct_output = {}
+		condition = threading.Condition()
+		
+		def serveProcess():
+			try:
+				proc_exiftool = FPPExiftoolProcess(self.ustr_path_exiftool,(self.str_format,)+self.ScanArgs,self.int_readsize)
+			except:
+				proc_exiftool = None
+			while True:
+				job = queue_batches.get()
+				if job == None: break
+				(k,batch) = job
+				# output of this batch, terminated by True (done)
+				# or False (exiftool terminated unexpectedly)
+				queue_chunks = queue.Queue()
+				with condition:
+					dct_output[k] = queue_chunks
+					condition.notify_all()
+				if self.bool_cancelled or proc_exiftool == None:
+					queue_chunks.put(False)
+					continue
+				try:
+					proc_exiftool.send(batch)
+					for chunk in proc_exiftool.iterOutput(partial=True,abort=self.isCancelled):
+						queue_chunks.put(chunk)
+					queue_chunks.put(True)
+				except:
+					queue_chunks.put(False)
+			if proc_exiftool != None:
+				proc_exiftool.close()
+		
+		def iterChunks(queue_chunks):
+			while True:
+				chunk = queue_chunks.get()
+				if chunk is True: return
+				if chunk is False: raise EOFError
+				yield chunk
+		
+		lst_threads = [threading.Thread(target=serveProcess,daemon=True) for i in range(int_processes)]
+		for thread in lst_threads:
+			thread.start()
+		
+		int_queued = 0
+		for k,batch in enumerate(batches):
+			# keep the processes busy
+			while int_queued < len(batches) and int_queued < k + 2*int_processes:
+				queue_batches.put((int_queued,batches[int_queued]))
+				int_queued += 1
+			# wait until this batch is processed by exiftool
+			with condition:
+				while k not in dct_output:
+					condition.wait()
+				queue_chunks = dct_output.pop(k)
+			try:
+				self.processOutput(batch,iterChunks(queue_chunks))
+			except EOFError:
+				# exiftool terminated unexpectedly (or was not started):
+				# stop scanning, unless this is just the result of cancel()
+				if not self.bool_cancelled:
+					self.bool_failed = True
+					self.bool_cancelled = True
+			if self.bool_cancelled: break
+		
+		# terminate threads and exiftool processes
+		for thread in lst_threads:
+			queue_batches.put(None)
+		for thread in lst_threads:
+			thread.join()
+
+
+	def processOutput(self,batch=(),chunks=()):
+		"""Parse exiftool's output for given batch of files and emit the records.
+
+chunks is an iterable of byte strings as read from exiftool; they are fed to
+the backend's parser. The XML parser returns records while exiftool is still
+working on the batch, the JSON parser returns all records at the end. If a
+batch contains no image at all, exiftool's output is empty."""
+		set_nonimages = set(batch)
+		lst_pending = []
+		lst_records = []
+		parser = self.class_parser(self.ScanTags)
+		
+		def processRecords(records):
+			for filepath,record in records:
+				#
+				# process every identified image
+				# 2026-10-18: in parallel (thumbnails might have to be decoded)
+				#
+				if self.bool_cancelled: return
+				set_nonimages.discard(filepath)
+				lst_pending.append((filepath,record,self.executor_records.submit(self.processRecord,filepath,record)))
+		
+		bool_terminated = False
+		try:
+			for chunk in chunks:
+				processRecords(parser.feed(chunk))
+			processRecords(parser.close())
+			if self.bool_cancelled: return
+		except (xml.etree.ElementTree.ParseError,ValueError):
+			# broken output: don't cache any file as non-image
+			set_nonimages.clear()
+		except EOFError:
+			# 2026-10-18: exiftool terminated within this batch: emit the
+			#             records parsed so far, then pass the error on
+			bool_terminated = True
+
+		for filepath,record,future in lst_pending:
+			(thumbData,digest) = future.result()
+			if thumbData != None:
+				lst_records.append((os.path.basename(filepath),record,thumbData,digest))
+			if self.bool_cancelled and not bool_terminated: return
+
+		if bool_terminated:
+			if len(lst_records) > 0:
+				self.recordsReady.emit(lst_records)
+				self.advance(len(lst_records),lst_records[-1][0])
+			raise EOFError
+
+		# remember files exiftool did not recognise as images
+		if self.cache != None:
+			for filepath in set_nonimages:
+				self.cache.store(filepath,None,b"","")
+
+		if len(lst_records) > 0:
+			self.recordsReady.emit(lst_records)
+		# 2017-07-14: deal with files ignored by exiftool (i.e. non-image files)
+		#             by advancing the progress bar
+		self.advance(len(batch),os.path.basename(batch[-1]))
+
+
+	def processRecord(self,filepath="",record={}):
+		"""Complete a freshly parsed record: add timestamp fallback and MD5 sum,
+create the thumbnail and store everything in the cache.
+
+Returns a tuple (thumbnail,digest) of encoded image data (bytes, might be None)
+and a hex string."""
+		if len(record.get("DateTimeOriginal","")) == 0:
+			# no EXIF timestamp , so obtain timestamp from filesystem
+			# 2026-10-18: file might have vanished since it was scanned;
+			#             keep the record without timestamp then
+			try:
+				record["DateTimeOriginal"] = time.strftime(
+					"%Y %m %d %H %M %S",
+					time.localtime(os.path.getctime(filepath))
+				)
+			except OSError:
+				record["DateTimeOriginal"] = ""
+
+		thumbData = self.loadThumbnailData(filepath,record)
+
+		# binary data is replaced by the thumbnail in the cache
+		record.pop("ThumbnailImage",None)
+		record.pop("PreviewImage",None)
+		digest = ""
+		if thumbData != None and self.cache != None:
+			self.cache.store(filepath,record,thumbData,digest)
+
+		# 2017-07-14: store original file's MD5 sum (hexadecimal representation)
+		# 2026-10-18: calculated in the background, delivered (and cached) later;
+		#             submitted after the cache entry was stored, otherwise the
+		#             digest might be updated before the entry exists
+		if self.pool_digest != None:
+			self.pool_digest.submit(filepath)
+		return (thumbData,digest)
+
+
+	def loadThumbnailData(self,filepath="",record={}):
+		"""Return the thumbnail of given file as encoded image data (bytes).
+
+Embedded images which already fit into the thumbnail size are passed on as they
+are, i.e. without decoding them. Otherwise the scaled thumbnail is created and
+encoded as JPEG. Returns None if no thumbnail could be created."""
+		data = record.get("PreviewImage",b"")
+		if len(data) == 0 and "ThumbnailImageValidArea" not in record:
+			data = record.get("ThumbnailImage",b"")
+		if len(data) > 0:
+			buffer_data = QtCore.QBuffer()
+			buffer_data.setData(data)
+			size = QtGui.QImageReader(buffer_data).size()
+			if size.isValid() and size.width() <= self.size_thumb.width() and size.height() <= self.size_thumb.height():
+				return bytes(data)
+		thumbImage = self.loadThumbnail(filepath,record)
+		if thumbImage == None:
+			return None
+		return self.encodeThumbnail(thumbImage)
+
+
+	def loadThumbnail(self,filepath="",record={}):
+		"""Create the scaled thumbnail image of given file and return it as QImage.
+
+Returns None if not even the "unknown picture" icon could be loaded.
+
+QImage is used instead of QPixmap because pixmaps must not be created outside
+the GUI thread."""
+		# 2013-01-08: +support for preview images >160px
+		# 2013-05-02: -support for preview images >160px (reduce memory footprint, instead do preview on-demand)
+		# resources: thumbnail image
+		# maximum: self.size_thumb
+		# 1. try thumb
+		# 2. use unknownPicture2
+		buffer_preview = QtCore.QBuffer()
+		buffer_preview.setData(record.get("PreviewImage",b""))
+		thumbImage = self.readScaledImage(buffer_preview)
+		if thumbImage.isNull():
+			# no preview image available, try thumb
+			if thumbImage.loadFromData(record.get("ThumbnailImage",b"")):
+				try:
+					# try to fit thumbnail into its area
+					(x1,x2,y1,y2) = tuple(record["ThumbnailImageValidArea"].split(" "))
+					thumbRect = QtCore.QRect()
+					thumbRect.setTop(int(y1))
+					thumbRect.setBottom(int(y2))
+					thumbRect.setLeft(int(x1))
+					thumbRect.setRight(int(x2))
+					thumbImage = thumbImage.copy(thumbRect)
+				except:
+					pass
+			else:
+				# no thumb: load image directly
+				# 2026-10-18: let the decoder scale down (JPEG: DCT scaling)
+				thumbImage = self.readScaledImage(filepath)
+				# direct image loading failed: load unknownPicture2
+				if thumbImage.isNull() and not thumbImage.load(os.path.join(sys.path[0],"icons","unknownPicture2.png")):
+					# well, at this point we have a non-valid
+					# image and an erroneous installation...
+					return None
+
+		# scale thumb image (if it's not already small enough)
+		if thumbImage.width() <= self.size_thumb.width() and thumbImage.height() <= self.size_thumb.height():
+			return thumbImage
+		return thumbImage.scaled(
+			self.size_thumb,
+			QtCore.Qt.KeepAspectRatio,
+			QtCore.Qt.SmoothTransformation
+		)
+
+
+	def readScaledImage(self,source=""):
+		"""Read an image from given file path or QIODevice; return it as QImage.
+
+Images larger than the thumbnail size are scaled down while decoding, so the
+JPEG decoder can use DCT scaling instead of decoding all pixels. Returns a null
+image if the source can't be read. Orientation is not applied."""
+		reader = QtGui.QImageReader(source)
+		reader.setAutoTransform(False)
+		size = reader.size()
+		if size.isValid() and (size.width() > self.size_thumb.width() or size.height() > self.size_thumb.height()):
+			reader.setScaledSize(size.scaled(self.size_thumb,QtCore.Qt.KeepAspectRatio))
+			reader.setQuality(self.ThumbnailQuality)
+		return reader.read()
+
+
+	def encodeThumbnail(self,thumbImage=None):
+		"""Return given thumbnail QImage as JPEG-encoded bytes (used by the cache)."""
+		try:
+			bytearray_thumb = QtCore.QByteArray()
+			buffer_thumb = QtCore.QBuffer(bytearray_thumb)
+			buffer_thumb.open(QtCore.QIODevice.WriteOnly)
+			thumbImage.save(buffer_thumb,"JPG",90)
+			buffer_thumb.close()
+			return bytes(bytearray_thumb)
+		except:
+			return b""
+
+
+
+
+class FPPExiftoolProcess(object):
+	"""Class wrapping an exiftool process running in -stay_open mode.
+
+Commands are sent as argument blocks terminated by -execute. Given common
+arguments apply to every command executed; a config file has to be given at
+start-up since exiftool only accepts -config as first command line option.
+Pass stderr=subprocess.STDOUT to include error messages in the output."""
+
+	# maximum time (seconds) between calls of iterOutput()'s abort callable
+	PollInterval = 0.05
+
+	def __init__(self,path_exiftool="",args=(),readsize=1024,config=None,stderr=subprocess.DEVNULL):
+		self.int_readsize = max(int(readsize),1)
+		command = [path_exiftool]
+		if config != None:
+			command.extend(("-config",config))
+		command.extend(("-stay_open","True","-@","-"))
+		if len(args) > 0:
+			command.append("-common_args")
+			command.extend(args)
+		self.proc_exiftool = subprocess.Popen(
+			command,
+			stdout=subprocess.PIPE,stdin=subprocess.PIPE,stderr=stderr
+		)
+		# output read from exiftool but not yet consumed
+		self.bytearray_output = bytearray()
+		self.selector = selectors.DefaultSelector()
+		self.selector.register(self.proc_exiftool.stdout,selectors.EVENT_READ)
+
+
+	def encodeArgument(self,argument=""):
+		"""Return given argument as line of an exiftool argument file.
+
+Every line is one argument, so line breaks have to be escaped; exiftool
+interprets lines starting with #[CSTR] as C strings."""
+		if "\n" in argument or "\r" in argument:
+			argument = "#[CSTR]" + argument.replace("\\","\\\\").replace("\n","\\n").replace("\r","\\r")
+		return argument
+
+
+	def send(self,arguments=(),number=None):
+		"""Send an argument block to exiftool; if number is given, the block is
+terminated by -executeNUMBER and its output by {readyNUMBER}."""
+		lines = [self.encodeArgument(argument) for argument in arguments]
+		if number == None:
+			lines.append("-execute")
+		else:
+			lines.append("-execute{0}".format(number))
+		command = "\n".join(lines) + "\n"
+		self.proc_exiftool.stdin.write(command.encode("UTF-8"))
+		self.proc_exiftool.stdin.flush()
+
+
+	def receive(self,number=None):
+		"""Read exiftool's output up to the {ready} marker of given block number
+and return it (without marker). Returns None if exiftool terminated."""
+		try:
+			return b"".join(self.iterOutput(number)).decode(errors="replace").strip()
+		except EOFError:
+			return None
+
+
+	def iterOutput(self,number=None,partial=False,abort=None):
+		"""Generator reading exiftool's output up to the {ready} marker of given
+block number. Output is collected in a bytearray; the marker is searched for in
+newly read data only.
+
+If partial is True, output is yielded as soon as it is read, i.e. chunks end
+anywhere. Otherwise the whole output is yielded at once. Chunks are bytes
+objects, i.e. decoding is up to the caller.
+
+abort is an optional callable; it is called every PollInterval seconds at the
+latest while reading, and reading stops if it returns True. Raises EOFError if
+exiftool terminated."""
+		if number == None:
+			marker = b"{ready}\n"
+		else:
+			marker = "{{ready{0}}}\n".format(number).encode()
+		output = self.bytearray_output
+		int_start = 0  # start of current chunk
+		int_marker = 0 # marker search position
+		while True:
+			pos_marker = output.find(marker,int_marker)
+			if pos_marker >= 0:
+				with memoryview(output) as view:
+					chunk = bytes(view[int_start:pos_marker])
+				# keep output following the marker for the next block
+				del output[:pos_marker+len(marker)]
+				yield chunk
+				return
+			int_marker = max(int_start,len(output)-len(marker)+1)
+			if partial and int_marker > int_start:
+				# marker might start in the last bytes: keep them
+				with memoryview(output) as view:
+					chunk = bytes(view[int_start:int_marker])
+				yield chunk
+				int_start = int_marker
+			
+			# drop consumed output, then wait for new output
+			del output[:int_start]
+			int_marker -= int_start
+			int_start = 0
+			while True:
+				if abort != None and abort(): return
+				if len(self.selector.select(None if abort == None else self.PollInterval)) > 0: break
+			chunk = os.read(self.proc_exiftool.stdout.fileno(),self.int_readsize)
+			if len(chunk) == 0:
+				if partial and len(output) > 0:
+					# pass on the output kept back for marker search
+					chunk = bytes(output)
+					del output[:]
+					yield chunk
+				raise EOFError
+			output += chunk
+
+
+	def execute(self,arguments=(),number=None):
+		"""Run exiftool with given arguments and return its output (without {ready} marker).
+
+Returns None if exiftool terminated unexpectedly."""
+		try:
+			self.send(arguments,number)
+		except:
+			return None
+		return self.receive(number)
+
+
+	def close(self):
+		"""Terminate exiftool."""
+		self.selector.close()
+		try:
+			self.proc_exiftool.communicate("-stay_open\nFalse\n".encode("utf-8"))
+		except:
+			self.proc_exiftool.kill()
+
+
+
+class FPPPreviewExtractor(object):
+	"""Class extracting embedded preview images on demand.
+
+An exiftool process is started with the first request and kept open
+(-stay_open) until close() is called; if it terminates, the next request starts
+a new one. Requests may come from any thread, they are served one at a time."""
+
+	ReadSize = 64*1024
+
+	def __init__(self,path_exiftool=""):
+		self.ustr_path_exiftool = str(path_exiftool)
+		self.proc_exiftool = None
+		self.lock = threading.Lock()
+
+
+	def previewImage(self,filepath=""):
+		"""Return the preview image embedded in given file as encoded image data
+(bytes). Returns an empty bytes object if there is none."""
+		with self.lock:
+			if self.proc_exiftool == None:
+				if len(self.ustr_path_exiftool) == 0: return b""
+				try:
+					self.proc_exiftool = FPPExiftoolProcess(self.ustr_path_exiftool,("-b","-m"),self.ReadSize)
+				except:
+					return b""
+			try:
+				self.proc_exiftool.send(("-PreviewImage",filepath))
+				return b"".join(self.proc_exiftool.iterOutput())
+			except:
+				# exiftool terminated: start a new one with the next request
+				self.proc_exiftool.close()
+				self.proc_exiftool = None
+				return b""
+
+
+	def setExiftoolPath(self,path_exiftool=""):
+		"""Use another exiftool executable (from the next request on)."""
+		self.close()
+		self.ustr_path_exiftool = str(path_exiftool)
+
+
+	def close(self):
+		"""Terminate exiftool (if running)."""
+		with self.lock:
+			if self.proc_exiftool != None:
+				self.proc_exiftool.close()
+				self.proc_exiftool = None
+
+
+
+class FPPRecordParser(object):
+	"""Class for incremental parsing of exiftool's RDF/XML output (option -X).
+
+Output is fed in arbitrary chunks; every rdf:Description element is converted
+to a flat record as soon as it is complete and freed afterwards, i.e. the
+document tree never holds more than one description.
+
+Records are dicts mapping tag names (without group) to unicode strings.
+Keywords are stored as a list of strings, thumbnail and preview images as
+bytes. Other tags are only included if listed in tags."""
+
+	# namespace of RDF elements and attributes
+	NamespaceRDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+
+	def __init__(self,tags=()):
+		self.parser = xml.etree.ElementTree.XMLPullParser(events=("start","end"))
+		self.set_tags = set(tags)
+		self.element_root = None
+		self.bool_fed = False
+
+
+	def feed(self,data=b""):
+		"""Feed a chunk of output; returns a list of tuples (filepath,record) of all
+descriptions completed by this chunk. Raises xml.etree.ElementTree.ParseError."""
+		if len(data) == 0: return []
+		self.bool_fed = True
+		self.parser.feed(data)
+		return self.readEvents()
+
+
+	def close(self):
+		"""Finish parsing; returns the remaining records (cf. feed())."""
+		if not self.bool_fed: return [] # empty output: no image at all
+		self.parser.close()
+		return self.readEvents()
+
+
+	def readEvents(self):
+		lst_records = []
+		tag_description = self.NamespaceRDF + "Description"
+		for event,element in self.parser.read_events():
+			if event == "start":
+				if self.element_root == None:
+					self.element_root = element
+			elif element.tag == tag_description:
+				filepath = element.get(self.NamespaceRDF + "about","")
+				if len(filepath) > 0:
+					lst_records.append((filepath,self.parseDescription(element)))
+				# free the description
+				if self.element_root != None:
+					self.element_root.remove(element)
+				element.clear()
+		return lst_records
+
+
+	def parseDescription(self,description=None):
+		"""Convert an rdf:Description element to a record."""
+		record = {}
+		tag_bag = self.NamespaceRDF + "Bag"
+		tag_li = self.NamespaceRDF + "li"
+		for node in description:
+			localName = node.tag.rpartition("}")[2]
+			if localName == "Keywords":
+				rdfBag = node.find(tag_bag)
+				if rdfBag != None:
+					# more than one keyword: stored as RDF bag
+					record["Keywords"] = [(item.text or "").strip() for item in rdfBag.iter(tag_li)]
+				else:
+					# single keyword is stored as simple cdata
+					record["Keywords"] = [(node.text or "").strip()]
+			elif localName in ("ThumbnailImage","PreviewImage"):
+				record[localName] = base64.b64decode(node.text or "")
+			elif localName in self.set_tags:
+				record[localName] = (node.text or "").strip()
+		return record
+
+
+
+class FPPJSONRecordParser(object):
+	"""Class for parsing exiftool's JSON output (option -j).
+
+Creates the same records as FPPRecordParser: values are converted to unicode
+strings, Keywords to a list of strings and binary data (exported by exiftool
+as "base64:..." strings) to bytes. The output of a batch is a single JSON
+array, so records are returned by close() only."""
+
+	def __init__(self,tags=()):
+		self.set_tags = set(tags)
+		self.lst_chunks = []
+
+
+	def feed(self,data=b""):
+		"""Feed a chunk of output; always returns an empty list."""
+		self.lst_chunks.append(data)
+		return []
+
+
+	def close(self):
+		"""Parse the output; returns a list of tuples (filepath,record).
+Raises ValueError if the output is not valid JSON."""
+		data = b"".join(self.lst_chunks)
+		self.lst_chunks = []
+		if len(data.strip()) == 0: return [] # empty output: no image at all
+		lst_records = []
+		for dct_tags in json.loads(data.decode()):
+			filepath = str(dct_tags.pop("SourceFile",""))
+			if len(filepath) > 0:
+				lst_records.append((filepath,self.parseObject(dct_tags)))
+		return lst_records
+
+
+	def parseObject(self,dct_tags={}):
+		"""Convert the JSON object of a file to a record."""
+		record = {}
+		for name,value in dct_tags.items():
+			if name == "Keywords":
+				if not isinstance(value,list):
+					# single keyword is stored as simple value
+					value = [value]
+				record["Keywords"] = [str(keyword).strip() for keyword in value]
+			elif name in ("ThumbnailImage","PreviewImage"):
+				value = str(value)
+				if value.startswith("base64:"):
+					record[name] = base64.b64decode(value[7:])
+				else:
+					record[name] = value.encode("latin-1","replace")
+			elif name in self.set_tags:
+				record[name] = str(value).strip()
+		return record
+
+
+
+class FPPDigestPool(QtCore.QObject):
+	"""Class for calculating MD5 sums of files on a pool of threads.
+
+Files are read in chunks of ChunkSize bytes, i.e. memory consumption does not
+depend on file size; hashlib releases the GIL while hashing. Results are stored
+in the metadata cache and emitted via signal digestReady(filepath,digest). The
+pool should be created in the GUI thread; the signal is then delivered to the
+GUI thread, too."""
+
+	# new signal/slot mechanism: define emitted signals (must be class vars!)
+	digestReady = QtCore.pyqtSignal(str,str)
+
+	ChunkSize = 1024**2
+
+	def __init__(self,cache=None,threads=None):
+		super().__init__()
+		self.cache = cache
+		self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=threads or os.cpu_count() or 1)
+		self.lock = threading.Lock()
+		self.dct_futures = {}
+
+
+	def submit(self,filepath=""):
+		"""Schedule calculation of given file's MD5 sum. Thread-safe."""
+		with self.lock:
+			if filepath not in self.dct_futures:
+				self.dct_futures[filepath] = self.executor.submit(self.processFile,filepath)
+
+
+	def digest(self,filepath=""):
+		"""Return the MD5 sum of given file. If its calculation is already
+scheduled, wait for the result; otherwise calculate it in the calling thread."""
+		with self.lock:
+			future = self.dct_futures.get(filepath)
+		if future != None:
+			try:
+				return future.result()
+			except concurrent.futures.CancelledError:
+				pass
+		return self.processFile(filepath)
+
+
+	def processFile(self,filepath=""):
+		"""Calculate, cache and emit the MD5 sum of given file; returns it."""
+		digest = self.fileDigest(filepath)
+		with self.lock:
+			self.dct_futures.pop(filepath,None)
+			bool_idle = len(self.dct_futures) == 0
+		if len(digest) > 0:
+			if self.cache != None:
+				self.cache.updateDigest(filepath,digest)
+			self.digestReady.emit(filepath,digest)
+		if bool_idle and self.cache != None:
+			self.cache.commit()
+		return digest
+
+
+	def fileDigest(self,filepath=""):
+		"""Return the MD5 sum of given file as hex string (empty if file is unreadable)."""
+		md5 = hashlib.md5()
+		try:
+			with open(filepath,"rb") as f:
+				chunk = f.read(self.ChunkSize)
+				while len(chunk) > 0:
+					md5.update(chunk)
+					chunk = f.read(self.ChunkSize)
+		except:
+			return ""
+		return md5.hexdigest()
+
+
+	def cancel(self):
+		"""Cancel all calculations not yet started."""
+		with self.lock:
+			for future in self.dct_futures.values():
+				future.cancel()
+			self.dct_futures.clear()
+
+
+	def shutdown(self):
+		"""Cancel pending calculations and wait for running ones."""
+		self.cancel()
+		self.executor.shutdown(wait=True)
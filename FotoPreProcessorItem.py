@@ -1,7 +1,7 @@
 #!/usr/bin/env python2
 # -*- coding: utf-8 -*-
 """
-FotoPreProcessorItem: a custom QListWidgetItem
+FotoPreProcessorItem: gallery item, model and view
 Copyright (C) 2012-2017 Frank Abelbeck <frank.abelbeck@googlemail.com>
 
 This file is part of the FotoPreProcessor program "FotoPreProcessor.py".
@@ -20,7 +20,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-import datetime,pytz
+import sys,os,math,array,datetime,collections,threading,concurrent.futures,pytz
 
 from PyQt5 import QtGui, QtWidgets, QtCore
 
@@ -61,8 +61,8 @@ icons pixmap. This is actually used in the GUI to mark an item as "edited"."""
 		rect_thumb = QtCore.QRect(x, y, w_thumb, h_thumb)
 		
 		painter.drawPixmap(
-			x + (w-w_thumb)/2,
-			y + (h-h_thumb)/2,
+			x + (w-w_thumb)//2,
+			y + (h-h_thumb)//2,
 			QtGui.QPixmap(icon)
 		)
 		
@@ -71,22 +71,171 @@ icons pixmap. This is actually used in the GUI to mark an item as "edited"."""
 			w_marker = marker.width()
 			h_marker = marker.height()
 			painter.drawPixmap(
-				x + (w-w_marker)/2,
-				y + (h-h_marker)/2,
+				x + (w-w_marker)//2,
+				y + (h-h_marker)//2,
 				marker
 			)
 		
 		painter.restore()
 
 
-class FPPGalleryItem(QtWidgets.QListWidgetItem):
-	"""Class for a custom QListWidgetItem.
+class FPPMetadataStore(object):
+	"""Class for a columnar store of image metadata.
 
-The item is enhanced by properties for timestamp, GPS timestamp,
+Every image is a record, i.e. a row in a set of columns: numbers are kept in
+typed arrays (timestamp as seconds since 0001-01-01, timeshift, location,
+orientation, rotation, size and edit flags), camera, copyright and description
+strings, timezone names and keyword tuples are interned, i.e. kept once and
+referenced by index. Thus a record costs some dozen bytes instead of a couple
+of Python objects per property.
+
+FPPGalleryItems reference their record by row index."""
+	
+	NoTimestamp = -1
+	NoLocation  = float("nan")
+	
+	# interned strings present in every store
+	StringEmpty = 0
+	StringUTC   = 1
+	
+	# bits of the edit flags column
+	EditedOrientation = 1
+	EditedLocation    = 2
+	EditedTimezones   = 4
+	EditedKeywords    = 8
+	EditedCopyright   = 16
+	EditedDescription = 32
+	# a changed copyright notice alone doesn't mark an image as edited
+	EditedAny = EditedOrientation | EditedLocation | EditedTimezones | EditedKeywords | EditedDescription
+	
+	# column name, array type code and default value
+	Columns = (
+		("timestamp","q",NoTimestamp),
+		("timeshift","i",0),
+		("latitude","d",NoLocation),
+		("longitude","d",NoLocation),
+		("elevation","d",NoLocation),
+		("savedLatitude","d",NoLocation),
+		("savedLongitude","d",NoLocation),
+		("savedElevation","d",NoLocation),
+		("orientation","b",1),
+		("rotation","h",0),
+		("width","i",-1),
+		("height","i",-1),
+		("edited","B",0),
+		("cameraSettings","I",StringEmpty),
+		("cameraHardware","I",StringEmpty),
+		("copyright","I",StringEmpty),
+		("savedCopyright","I",StringEmpty),
+		("description","I",StringEmpty),
+		("savedDescription","I",StringEmpty),
+		("fromTimezone","I",StringUTC),
+		("toTimezone","I",StringUTC),
+		("savedFromTimezone","I",StringUTC),
+		("savedToTimezone","I",StringUTC),
+		("keywords","I",0),
+		("savedKeywords","I",0),
+	)
+	
+	def __init__(self):
+		"""Constructor; initialise empty columns."""
+		for name,typecode,default in self.Columns:
+			setattr(self,"arr_"+name,array.array(typecode))
+		self.lst_defaults = [(getattr(self,"arr_"+name),default) for name,typecode,default in self.Columns]
+		# filenames and MD5 sums are unique: plain lists
+		self.lst_filename = []
+		self.lst_digest = []
+		self.lst_strings = ["","UTC"]
+		self.dct_strings = { "": self.StringEmpty, "UTC": self.StringUTC }
+		self.lst_keywords = [()]
+		self.dct_keywords = { (): 0 }
+	
+	
+	def appendRecord(self):
+		"""Append a record of default values; returns its row index."""
+		for column,default in self.lst_defaults:
+			column.append(default)
+		self.lst_filename.append("")
+		self.lst_digest.append("")
+		return len(self.lst_filename) - 1
+	
+	
+	def count(self):
+		"""Return the number of records."""
+		return len(self.lst_filename)
+	
+	
+	def stringIndex(self,string=""):
+		"""Return the index of given string, interning it if necessary."""
+		try:
+			return self.dct_strings[string]
+		except KeyError:
+			index = len(self.lst_strings)
+			self.lst_strings.append(string)
+			self.dct_strings[string] = index
+			return index
+	
+	
+	def string(self,index=0):
+		"""Return the interned string of given index."""
+		return self.lst_strings[index]
+	
+	
+	def keywordsIndex(self,keywords=()):
+		"""Return the index of given keyword tuple, interning it if necessary."""
+		try:
+			return self.dct_keywords[keywords]
+		except KeyError:
+			index = len(self.lst_keywords)
+			keywords = tuple([self.string(self.stringIndex(i)) for i in keywords])
+			self.lst_keywords.append(keywords)
+			self.dct_keywords[keywords] = index
+			return index
+	
+	
+	def keywords(self,index=0):
+		"""Return the interned keyword tuple of given index."""
+		return self.lst_keywords[index]
+	
+	
+	def location(self,row=0,saved=False):
+		"""Return the (saved) location of given record as a tuple of floats
+(latitude,longitude,elevation) or an empty tuple."""
+		if saved:
+			latitude = self.arr_savedLatitude[row]
+			if math.isnan(latitude): return ()
+			return (latitude,self.arr_savedLongitude[row],self.arr_savedElevation[row])
+		else:
+			latitude = self.arr_latitude[row]
+			if math.isnan(latitude): return ()
+			return (latitude,self.arr_longitude[row],self.arr_elevation[row])
+	
+	
+	def editedRecords(self,flags=EditedAny):
+		"""Return a list of the rows of all records with any of given edit flags."""
+		return [row for row,edited in enumerate(self.arr_edited) if edited & flags]
+
+
+class FPPGalleryItem(object):
+	"""Class for a gallery item, i.e. a compact record of one image.
+
+The item holds properties for timestamp, GPS timestamp,
 camera settings, camera hardware, orientation, timeshift based on from/to
 timezones, location (latitude, longitude, elevation) and a set of keywords.
 
-Appropriate methods for handling and showing these properties are defined, too."""
+Appropriate methods for handling and showing these properties are defined, too.
+
+2026-10-18: items are no longer QListWidgetItems; they are shown by an
+FPPGalleryModel which creates icon, tooltip and edit marker on demand.
+
+2026-10-18: the properties are kept as a record of an FPPMetadataStore; the
+item just references its row, thumbnail and rendered icons."""
+	
+	__slots__ = (
+		"store_metadata","int_record",
+		"bytes_thumb","dct_icons","func_preview","bool_preview","model_gallery","int_row",
+		"func_digest","int_sortCriterion","tpl_sortKeys","int_version","tpl_tooltip",
+	)
 	
 	MapStringToOrientation = {
 		"Standard (normal)": 1,
@@ -103,128 +252,71 @@ Appropriate methods for handling and showing these properties are defined, too."
 	SortByTime   = 1
 	SortByCamera = 2
 	
-	def __init__(self,parent=None):
-		"""Constructor; initialise fields."""
-		QtWidgets.QListWidgetItem.__init__(self,parent,1001)
-		self.pix_thumb = QtGui.QPixmap(1,1)
-		
-		# 2017-07-14: store original file's MD5 sum
-		self.str_digest = ""
-		
-		self.str_filename = ""
-		self.date_timestamp = None
-		self.str_cameraSettings = ""
-		self.str_cameraHardware = ""
-		self.str_copyright = ""
-		self.str_description = ""
-
-		self.int_orientation = 1
-		self.int_rotation = 0
-		self.tpl_timezones = ("UTC","UTC")
-		self.tpl_location = ()
-		self.tpl_keywords = ()
+	# guards preview function and flag; previewData() is called by pool threads
+	LockPreview = threading.Lock()
+	
+	def __init__(self,store=None):
+		"""Constructor; append a record to given FPPMetadataStore (default: an
+own store) and initialise fields."""
+		if store == None:
+			store = FPPMetadataStore()
+		self.store_metadata = store
+		self.int_record = store.appendRecord()
 		
-		self.tpl_saved_timezones = ("UTC","UTC")
-		self.tpl_saved_location = ()
-		self.tpl_saved_keywords = ()
-		self.str_saved_copyright = ""
-		self.str_saved_description = ""
-
-		self.int_timeshift = 0
-		self.date_shiftedTimestamp = None
-		self.date_utcTimestamp = None
+		# 2026-10-18: thumbnail is kept as encoded image data; icons are
+		#             decoded on demand (cf. FPPGalleryModel) and kept by key
+		#             (width,height,orientation,rotation), None if there's none
+		self.bytes_thumb = b""
+		self.dct_icons = None
+		# 2026-10-18: optional function extracting the embedded preview image;
+		#             False as soon as it turned out there is no preview
+		self.func_preview = None
+		self.bool_preview = True
+		# 2026-10-18: model showing this item and the item's row in that model
+		self.model_gallery = None
+		self.int_row = -1
 		
-		self.bool_edited = False
-		self.bool_editedOrientation = False
-		self.bool_editedLocation = False
-		self.bool_editedTimezones = False
-		self.bool_editedKeywords = False
-		self.bool_editedCopyright = False
-		self.bool_editedDescription = False
-
-		self.int_width = -1
-		self.int_height = -1
+		# 2026-10-18: optional function calculating the MD5 sum on demand
+		self.func_digest = None
 		
 		self.int_sortCriterion = self.SortByName
+		# 2026-10-18: sort keys per criterion, computed when first needed;
+		#             None if name, timestamp or camera changed
+		self.tpl_sortKeys = None
+		
+		# 2026-10-18: data version, incremented whenever displayed data changes;
+		#             tooltip is kept as tuple (version,HTML string)
+		self.int_version = 0
+		self.tpl_tooltip = None
 	
 	
-	def __lt__(self,otherItem=None):
-		try:
-			resultName = self.str_filename < otherItem.str_filename
-			resultTime = self.date_timestamp < otherItem.date_timestamp
-			resultCam  = self.str_cameraHardware < otherItem.str_cameraHardware
-			return self.comparisonHelper(otherItem,resultName,resultTime,resultCam)
-		except:
-			return False
-	
-	
-	def __gt__(self,otherItem=None):
-		try:
-			resultName = self.str_filename > otherItem.str_filename
-			resultTime = self.date_timestamp > otherItem.date_timestamp
-			resultCam  = self.str_cameraHardware > otherItem.str_cameraHardware
-			return self.comparisonHelper(otherItem,resultName,resultTime,resultCam)
-		except:
-			return False
-	
-	
-	def __eq__(self,otherItem=None):
-		result = False
-		try:
-			if self.int_sortCriterion == self.SortByName:
-				result = self.str_filename == otherItem.str_filename
-			elif self.int_sortCriterion == self.SortByTime:
-				result = self.date_timestamp == otherItem.date_timestamp
-			elif self.int_sortCriterion == self.SortByCamera:
-				result = self.str_cameraHardware == otherItem.str_cameraHardware
-		except:
-			pass
-		return result
-	
-	
-	def __ne__(self,otherItem=None):
-		result = False
-		try:
-			if self.int_sortCriterion == self.SortByName:
-				result = self.str_filename != otherItem.str_filename
-			elif self.int_sortCriterion == self.SortByTime:
-				result = self.date_timestamp != otherItem.date_timestamp
-			elif self.int_sortCriterion == self.SortByCamera:
-				result = self.str_cameraHardware != otherItem.str_cameraHardware
-		except:
-			pass
-		return result
+	def record(self):
+		"""Return a tuple (store,row) referencing the item's metadata record."""
+		return (self.store_metadata,self.int_record)
 	
 	
-	def comparisonHelper(self,otherItem=None,resultName=False,resultTime=False,resultCam=False):
-		result = False
-		try:
-			if self.int_sortCriterion == self.SortByName:
-				# --- sort by name ---
-				result = resultName # name should be pretty unique...
-			
-			elif self.int_sortCriterion == self.SortByCamera:
-				# --- sort by camera ---
-				if self.str_cameraHardware == otherItem.str_cameraHardware:
-					# items created with same camera: sort by timestamp
-					if self.date_timestamp == otherItem.date_timestamp:
-						# same timestamp: possible (image series), sort by name
-						result = resultName
-					else:
-						result = resultTime
-				else:
-					result = resultCam
-			
-			elif self.int_sortCriterion == self.SortByTime:
-				# --- sort by time ---
-				if self.date_timestamp == otherItem.date_timestamp:
-					# same timestamp: possible (image series), sort by name
-					result = resultName
-				else:
-					result = resultTime
-		except:
-			pass
-		return result
+	def sortKey(self,criterion=None):
+		"""Return a tuple by which items are ordered according to given sort
+criterion (default: the item's sort criterion).
+
+By name: (filename,)
+By time: (no timestamp,timestamp,filename) -- images of a series by name
+By camera: (camera hardware,no timestamp,timestamp,filename)
+
+Items without timestamp are put after those with timestamp."""
+		if self.tpl_sortKeys == None:
+			store,row = self.store_metadata,self.int_record
+			filename = store.lst_filename[row]
+			seconds = store.arr_timestamp[row]
+			tpl_time = (seconds == store.NoTimestamp,seconds)
+			self.tpl_sortKeys = (
+				(filename,),
+				tpl_time + (filename,),
+				(store.string(store.arr_cameraHardware[row]),) + tpl_time + (filename,)
+			)
+		if criterion == None:
+			criterion = self.int_sortCriterion
+		return self.tpl_sortKeys[criterion]
 	
 	
 	def setSortCriterion(self,value=SortByName):
@@ -233,127 +325,185 @@ Appropriate methods for handling and showing these properties are defined, too."
 	
 	
 	def setSize(self,width,height):
+		store,row = self.store_metadata,self.int_record
 		try:
-			self.int_width = int(width)
-			self.int_height = int(height)
+			store.arr_width[row] = int(width)
+			store.arr_height[row] = int(height)
 		except:
-			self.int_width = -1
-			self.int_height = -1
+			store.arr_width[row] = -1
+			store.arr_height[row] = -1
 	
 	
 	def size(self):
-		return (self.int_width,self.int_height)
+		store,row = self.store_metadata,self.int_record
+		return (store.arr_width[row],store.arr_height[row])
 	
 	
 	def updateEditState(self):
-		"""Update "edited" state of the item (updates fields and UserRole).
+		"""Update "edited" state of the item (updates fields and UserRole) and
+the model's set of edited items.
 
 Compare orientation, timeshift, location, keywords to previously saved values."""
-		self.bool_editedOrientation = (self.int_rotation != 0)
-		self.bool_editedTimezones = (self.tpl_timezones != self.tpl_saved_timezones)
-		self.bool_editedLocation = (self.tpl_location != self.tpl_saved_location)
-		self.bool_editedKeywords = (self.tpl_keywords != self.tpl_saved_keywords)
-		self.bool_editedCopyright = (self.str_copyright != self.str_saved_copyright)
-		self.bool_editedDescription = (self.str_description != self.str_saved_description)
-		self.bool_edited = (self.bool_editedOrientation or \
-			self.bool_editedLocation or self.bool_editedTimezones or \
-			self.bool_editedKeywords or self.bool_editedDescription)
-		self.setData(QtCore.Qt.UserRole,self.bool_edited)
+		store,row = self.store_metadata,self.int_record
+		flags = 0
+		if store.arr_rotation[row] != 0:
+			flags |= store.EditedOrientation
+		if store.arr_fromTimezone[row] != store.arr_savedFromTimezone[row] or \
+			store.arr_toTimezone[row] != store.arr_savedToTimezone[row]:
+			flags |= store.EditedTimezones
+		if store.location(row) != store.location(row,True):
+			flags |= store.EditedLocation
+		# keyword tuples and strings are interned: compare indices
+		if store.arr_keywords[row] != store.arr_savedKeywords[row]:
+			flags |= store.EditedKeywords
+		if store.arr_copyright[row] != store.arr_savedCopyright[row]:
+			flags |= store.EditedCopyright
+		if store.arr_description[row] != store.arr_savedDescription[row]:
+			flags |= store.EditedDescription
+		store.arr_edited[row] = flags
+		if self.model_gallery != None:
+			self.model_gallery.updateEdited(self)
+	
+	
+	def editFlags(self):
+		"""Return the item's edit flags (cf. FPPMetadataStore.Edited*)."""
+		return self.store_metadata.arr_edited[self.int_record]
 	
 	
 	def edited(self):
 		"""Return True if item was edited.
 
 Note: This is based on a variable which gets updated by updateEditState()."""
-		return self.bool_edited
+		return self.editFlags() & FPPMetadataStore.EditedAny != 0
 	
 	
 	def orientationEdited(self):
 		"""Return True if the item's orientation was changed.
 
 Note: This is based on a variable which gets updated by updateEditState()."""
-		return self.bool_editedOrientation
+		return self.editFlags() & FPPMetadataStore.EditedOrientation != 0
 	
 	
 	def timezonesEdited(self):
 		"""Return True if the item's timezone correction was changed.
 
 Note: This is based on a variable which gets updated by updateEditState()."""
-		return self.bool_editedTimezones
+		return self.editFlags() & FPPMetadataStore.EditedTimezones != 0
 	
 	
 	def locationEdited(self):
 		"""Return True if the item's location was changed.
 
 Note: This is based on a variable which gets updated by updateEditState()."""
-		return self.bool_editedLocation
+		return self.editFlags() & FPPMetadataStore.EditedLocation != 0
 	
 	
 	def keywordsEdited(self):
 		"""Return True if the item's keyword set was changed.
 
 Note: This is based on a variable which gets updated by updateEditState()."""
-		return self.bool_editedKeywords
+		return self.editFlags() & FPPMetadataStore.EditedKeywords != 0
 	
 	
 	def copyrightEdited(self):
 		"""Return True if the item's copyright string was changed.
 
 Note: This is based on a variable which gets updated by updateEditState()."""
-		return self.bool_editedCopyright
+		return self.editFlags() & FPPMetadataStore.EditedCopyright != 0
 
 
 	def descriptionEdited(self):
 		"""Return True if the item's description string was changed.
 
 Note: This is based on a variable which gets updated by updateEditState()."""
-		return self.bool_editedDescription
+		return self.editFlags() & FPPMetadataStore.EditedDescription != 0
 
 	
 	def setFilename(self,filename=None):
 		"""Set filename property."""
 		if filename != None:
 			try:
-				self.str_filename = str(filename)
-				self.setText(str_filename)
+				self.store_metadata.lst_filename[self.int_record] = str(filename)
+				self.tpl_sortKeys = None
 				self.updateToolTip()
 			except:
 				pass
-		return self.str_filename
+		return self.filename()
 	
 	
 	def filename(self):
 		"""Return the item's filename as a unicode string. Might be an empty string."""
-		return self.str_filename
+		return self.store_metadata.lst_filename[self.int_record]
 	
 	
 	def setDigest(self,digest=None):
 		"""Set filename property."""
 		if digest != None:
 			try:
-				self.str_digest = str(digest)
+				self.store_metadata.lst_digest[self.int_record] = str(digest)
 			except:
 				pass
-		return self.str_digest
+		return self.store_metadata.lst_digest[self.int_record]
+	
+	
+	def setDigestFunction(self,function=None):
+		"""Set a function (without arguments) returning the MD5 sum as hex string.
+It is called by digest() if the MD5 sum is not yet known."""
+		self.func_digest = function
+	
+	
+	def hasDigest(self):
+		"""Return True if the MD5 sum is known, i.e. digest() won't calculate it."""
+		return len(self.store_metadata.lst_digest[self.int_record]) > 0
 	
 	
 	def digest(self):
-		"""Return the item's original file MD5 sm as hex string. Might be empty."""
-		return self.str_digest
+		"""Return the item's original file MD5 sm as hex string. Might be empty.
+
+If no MD5 sum was set, it is calculated via the digest function (if any)."""
+		if not self.hasDigest() and self.func_digest != None:
+			self.setDigest(self.func_digest())
+		return self.store_metadata.lst_digest[self.int_record]
 	
 	
-	def setThumbnail(self,pixmap=None):
-		"""Set thumbnail image. Expects a QPixmap."""
+	def setThumbnailData(self,data=b""):
+		"""Set thumbnail image. Expects encoded image data (bytes, e.g. JPEG)."""
 		try:
-			self.pix_thumb = QtGui.QPixmap(pixmap)
-			self.updateIcon()
+			self.bytes_thumb = bytes(data)
+			if self.model_gallery != None:
+				self.model_gallery.releaseIcons(self)
+			self.dct_icons = None
+			self.emitDataChanged()
 		except:
 			pass
 	
 	
-	def thumbnail(self):
-		"""Return thumbnail image as a QPixmap."""
-		return self.pix_thumb
+	def thumbnailData(self):
+		"""Return thumbnail image as encoded image data (bytes)."""
+		return self.bytes_thumb
+	
+	
+	def setPreviewFunction(self,function=None):
+		"""Set a function (without arguments) returning the embedded preview image
+as encoded image data (bytes). It is called by previewData()."""
+		with self.LockPreview:
+			self.func_preview = function
+			self.bool_preview = True
+	
+	
+	def previewData(self):
+		"""Return the embedded preview image as encoded image data (bytes).
+Might be empty. The preview is not kept, i.e. every call extracts it again.
+May be called from any thread."""
+		with self.LockPreview:
+			if not self.bool_preview or self.func_preview == None:
+				return b""
+			function = self.func_preview
+		data = function()
+		if len(data) == 0:
+			with self.LockPreview:
+				self.bool_preview = False
+		return data
 	
 	
 	def setTimezones(self,fromTimezone=None,toTimezone=None):
@@ -362,46 +512,48 @@ Note: This is based on a variable which gets updated by updateEditState()."""
 Expects valid timezone names as strings, e.g. "Europe/Berlin" or "UTC".
 If invalid timezone names are provided, nothing is changed."""
 		if fromTimezone != None and toTimezone != None:
+			store,row = self.store_metadata,self.int_record
 			try:
 				fromTz = pytz.timezone(str(fromTimezone))
 				toTz = pytz.timezone(str(toTimezone))
-				t_from = fromTz.localize(self.date_timestamp).strftime("%z")
-				t_to = toTz.localize(self.date_timestamp).strftime("%z")
+				t_from = fromTz.localize(self.timestamp()).strftime("%z")
+				t_to = toTz.localize(self.timestamp()).strftime("%z")
 				m_from = 60*int(t_from[0:3]) + int(t_from[3:5])
 				m_to   = 60*int(t_to[0:3])   + int(t_to[3:5])
-				self.tpl_timezones = (str(fromTimezone),str(toTimezone))
-				self.int_timeshift = m_to - m_from
+				store.arr_fromTimezone[row] = store.stringIndex(str(fromTimezone))
+				store.arr_toTimezone[row] = store.stringIndex(str(toTimezone))
+				store.arr_timeshift[row] = m_to - m_from
 			except:
 				pass
-			self.updateShiftedTimestamps()
 			self.updateEditState()
 			self.updateToolTip()
 	
 	
 	def timeshift(self):
 		"""Return timezone correction as integer timeshift in minutes."""
-		return self.int_timeshift
+		return self.store_metadata.arr_timeshift[self.int_record]
 	
 	
 	def timezones(self):
 		"""Return timezone correction as a tuple (fromTz,toTz) of unicode strings."""
-		return self.tpl_timezones
+		store,row = self.store_metadata,self.int_record
+		return (store.string(store.arr_fromTimezone[row]),store.string(store.arr_toTimezone[row]))
 	
 	
-	def updateShiftedTimestamps(self):
-		"""Update shifted timestamp value.
+	def shiftedTimestamps(self):
+		"""Return a tuple (shifted timestamp,GPS timestamp).
 
 Timezone correction as set by setTimezones(fromTz,toTz) is applied to the
-original timestamp and the result is stored internally for display purposes."""
+original timestamp. If this fails, the original timestamp and None are returned."""
+		timestamp = self.timestamp()
 		try:
-			fromTz = pytz.timezone(self.tpl_timezones[0])
-			toTz = pytz.timezone(self.tpl_timezones[1])
-			t_from = fromTz.localize(self.date_timestamp)
-			self.date_shiftedTimestamp = toTz.normalize(t_from.astimezone(toTz))
-			self.date_utcTimestamp = t_from.astimezone(pytz.utc)
+			(fromTz,toTz) = self.timezones()
+			fromTz = pytz.timezone(fromTz)
+			toTz = pytz.timezone(toTz)
+			t_from = fromTz.localize(timestamp)
+			return (toTz.normalize(t_from.astimezone(toTz)),t_from.astimezone(pytz.utc))
 		except:
-			self.date_shiftedTimestamp = self.date_timestamp
-		self.updateEditState
+			return (timestamp,None)
 	
 	
 	def setTimestamp(self,tpl_timestamp=()):
@@ -409,15 +561,16 @@ original timestamp and the result is stored internally for display purposes."""
 
 Expects a tuple (year,month,day,hour,minute,second) of integers."""
 		try:
-			self.date_timestamp = datetime.datetime(
+			delta = datetime.datetime(
 				int(tpl_timestamp[0]),
 				int(tpl_timestamp[1]),
 				int(tpl_timestamp[2]),
 				int(tpl_timestamp[3]),
 				int(tpl_timestamp[4]),
 				int(tpl_timestamp[5])
-			)
-			self.updateShiftedTimestamps()
+			) - datetime.datetime.min
+			self.store_metadata.arr_timestamp[self.int_record] = delta.days * 86400 + delta.seconds
+			self.tpl_sortKeys = None
 			self.updateToolTip()
 		except:
 			pass
@@ -425,16 +578,19 @@ Expects a tuple (year,month,day,hour,minute,second) of integers."""
 	
 	def timestamp(self):
 		"""Return the item's timestamp. Might be None."""
-		return self.date_timestamp
+		seconds = self.store_metadata.arr_timestamp[self.int_record]
+		if seconds == FPPMetadataStore.NoTimestamp:
+			return None
+		return datetime.datetime.min + datetime.timedelta(seconds=seconds)
 	
 	
 	def shiftedTimestamp(self):
-		return self.date_shiftedTimestamp
+		return self.shiftedTimestamps()[0]
 	
 	
 	def utcTimestamp(self):
 		"""Return the item's GPS timestamp. Might be None."""
-		return self.date_utcTimestamp
+		return self.shiftedTimestamps()[1]
 	
 	
 	def setOrientation(self,value=None):
@@ -451,18 +607,24 @@ An integer as well as a string is accepted:
    8 <---> "Rotate 270 CW"
 
 Horizontal (normal) orientation (=1) is set a default."""
+		store,row = self.store_metadata,self.int_record
 		try:
-			self.int_orientation = self.MapStringToOrientation[str(value)]
+			store.arr_orientation[row] = self.MapStringToOrientation[str(value)]
 		except:
 			try:
-				self.int_orientation = max(min(int(value),8),1)
+				store.arr_orientation[row] = max(min(int(value),8),1)
 			except:
 				pass
-		self.updateIcon()
 		self.updateEditState()
 		self.updateToolTip()
 	
 	
+	def exifOrientation(self):
+		"""Return the orientation value read from the image file (without any
+additional rotations) as an integer."""
+		return self.store_metadata.arr_orientation[self.int_record]
+	
+	
 	def orientation(self):
 		"""Return the item's orientation value as an integer. Equals 1 by default.
 This takes any additional rotations into account.
@@ -486,70 +648,67 @@ Applying 90° steps, clockwise, results in following EXIF orientation cycle:
 		cycle_standard = (1,6,3,8)
 		cycle_mirrored = (2,5,4,7)
 		
+		orientation = self.exifOrientation()
+		rotation = self.rotation()
+		
 		# no rotation: just return orientation
-		if self.int_rotation == 0: return self.int_orientation
+		if rotation == 0: return orientation
 		
 		# otherwise: take rotation into account by applying above cycles
 		try:
-			if self.int_orientation in cycle_standard:
+			if orientation in cycle_standard:
 				# command explained:
 				# 1. get index of the cycle item which holds the current orientation value
 				# 2. calculate the rotation angle offset (90° steps)
 				# 3. step on in the cycle from current orientation, wrap around at the boundaries (4 elements -> mod 4)
-				return cycle_standard[(cycle_standard.index(self.int_orientation) + self.int_rotation // 90) % 4]
+				return cycle_standard[(cycle_standard.index(orientation) + rotation // 90) % 4]
 			else:
-				return cycle_mirrored[(cycle_mirrored.index(self.int_orientation) + self.int_rotation // 90) % 4]
+				return cycle_mirrored[(cycle_mirrored.index(orientation) + rotation // 90) % 4]
 		except:
-			print(self.str_filename,sys.exc_info())
+			print(self.filename(),sys.exc_info())
 	
 	
 	def rotation(self):
 		"""Return the item's rotation value [degrees, default: 0] as an integer. """
-		return self.int_rotation
+		return self.store_metadata.arr_rotation[self.int_record]
 	
 	
-	def rotateLeft(self):
-		"""Subtract 90° from the rotation value and limit to range [0;360[."""
-		self.int_rotation = (self.int_rotation - 90) % 360
-		self.updateIcon()
+	def setRotation(self,rotation=0):
+		"""Set the rotation value [degrees] and limit to range [0;360[."""
+		self.store_metadata.arr_rotation[self.int_record] = rotation % 360
 		self.updateEditState()
 		self.updateToolTip()
 	
 	
+	def rotateLeft(self):
+		"""Subtract 90° from the rotation value and limit to range [0;360[."""
+		self.setRotation(self.rotation() - 90)
+	
+	
 	def rotateNormal(self):
 		"""Set orientation value to normal orientation (=1)."""
-		self.int_rotation = 0
-		self.updateIcon()
-		self.updateEditState()
-		self.updateToolTip()
+		self.setRotation(0)
 	
 	
 	def rotateRight(self):
 		"""Add 90° to the rotation value and limit to range [0;360[."""
-		self.int_rotation = (self.int_rotation + 90) % 360
-		self.updateIcon()
-		self.updateEditState()
-		self.updateToolTip()
+		self.setRotation(self.rotation() + 90)
 	
 	
 	def addKeyword(self,keyword=""):
 		try:
-			keywords = list(self.tpl_keywords)
+			keywords = list(self.keywords())
 			keywords.append(str(keyword))
-			self.tpl_keywords = tuple(keywords)
-			self.updateEditState()
-			self.updateToolTip()
+			self.setKeywords(keywords)
 		except:
 			pass
 	
 	
 	def removeKeyword(self,keyword=""):
 		try:
-			keywords = list(self.tpl_keywords)
+			keywords = list(self.keywords())
 			keywords.remove(str(keyword))
-			self.tpl_keywords = tuple(keywords)
-			self.updateEditState()
-			self.updateToolTip()
+			self.setKeywords(keywords)
 		except:
 			pass
 	
@@ -560,7 +719,8 @@ Applying 90° steps, clockwise, results in following EXIF orientation cycle:
 The parameter keywords is expected to be a set, list or tuple of strings
 whicht will be converted to a tuple of unicode strings."""
 		try:
-			self.tpl_keywords = tuple([str(i) for i in keywords])
+			store = self.store_metadata
+			store.arr_keywords[self.int_record] = store.keywordsIndex(tuple([str(i) for i in keywords]))
 			self.updateEditState()
 			self.updateToolTip()
 		except:
@@ -569,7 +729,8 @@ whicht will be converted to a tuple of unicode strings."""
 	
 	def keywords(self):
 		"""Return the item's keyword tuple (a tuple of unicode strings). Might be empty."""
-		return self.tpl_keywords
+		store = self.store_metadata
+		return store.keywords(store.arr_keywords[self.int_record])
 	
 	
 	def setCameraSettings(self,settings=""):
@@ -580,14 +741,16 @@ Recommended settings: focal length, aperture, shutter speed and ISO level, e.g.:
     "35 mm, f/5.6, 1/250 s, ISO 100" """
 		if settings != None:
 			try:
-				self.str_cameraSettings = str(settings)
+				store = self.store_metadata
+				store.arr_cameraSettings[self.int_record] = store.stringIndex(str(settings))
 				self.updateToolTip()
 			except:
 				pass
 	
 	def cameraSettings(self):
 		"""Return the item's camera settings unicode string. Might be empty."""
-		return self.str_cameraSettings
+		store = self.store_metadata
+		return store.string(store.arr_cameraSettings[self.int_record])
 	
 	
 	def setCameraHardware(self,hardware=""):
@@ -598,21 +761,25 @@ Hardware: Camera model and/or lens type, e.g.:
     "Canon EOS 450D, Canon EF-S 15-85mm f/3.5-5.6 IS USM" """
 		if hardware != None:
 			try:
-				self.str_cameraHardware = str(hardware)
+				store = self.store_metadata
+				store.arr_cameraHardware[self.int_record] = store.stringIndex(str(hardware))
+				self.tpl_sortKeys = None
 				self.updateToolTip()
 			except:
 				pass
 	
 	def cameraHardware(self):
 		"""Return the item's camera hardware unicode string. Might be empty."""
-		return self.str_cameraHardware
+		store = self.store_metadata
+		return store.string(store.arr_cameraHardware[self.int_record])
 	
 	
 	def setCopyright(self,notice=""):
 		"""Set copyright string. Expects a unicode string."""
 		if notice != None:
 			try:
-				self.str_copyright = str(notice)
+				store = self.store_metadata
+				store.arr_copyright[self.int_record] = store.stringIndex(str(notice))
 				self.updateEditState()
 				self.updateToolTip()
 			except:
@@ -620,14 +787,16 @@ Hardware: Camera model and/or lens type, e.g.:
 	
 	def copyright(self):
 		"""Return the item's copyright unicode string. Might be empty."""
-		return self.str_copyright
+		store = self.store_metadata
+		return store.string(store.arr_copyright[self.int_record])
 	
 	
 	def setDescription(self,description=""):
 		"""Set description string. Expects a unicode string."""
 		if description != None:
 			try:
-				self.str_description = str(description)
+				store = self.store_metadata
+				store.arr_description[self.int_record] = store.stringIndex(str(description))
 				self.updateEditState()
 				self.updateToolTip()
 			except:
@@ -635,7 +804,8 @@ Hardware: Camera model and/or lens type, e.g.:
 
 	def description(self):
 		"""Return the item's description unicode string. Might be empty."""
-		return self.str_description
+		store = self.store_metadata
+		return store.string(store.arr_description[self.int_record])
 
 
 	def setLocation(self,latitude=None,longitude=None,elevation=None):
@@ -648,17 +818,19 @@ longitude >= 0: eastward            longitude < 0:  westward
 altitude >= 0:  above sea level     altitude < 0: below sea level
 
 If any of the coordinates equals None, location information will be erased."""
+		store,row = self.store_metadata,self.int_record
 		try:
-			self.tpl_location = (float(latitude),float(longitude),float(elevation))
+			location = (float(latitude),float(longitude),float(elevation))
 		except:
-			self.tpl_location = ()
+			location = (store.NoLocation,store.NoLocation,store.NoLocation)
+		(store.arr_latitude[row],store.arr_longitude[row],store.arr_elevation[row]) = location
 		self.updateEditState()
 		self.updateToolTip()
 	
 	
 	def location(self):
 		"""Return location of item as a tuple of floats (latitude,longitude,elevation)."""
-		return self.tpl_location
+		return self.store_metadata.location(self.int_record)
 		
 		#-----------------------------------------------------------------------
 		# read or set location tuple("x.xxxx...","x.xxx...")
@@ -692,7 +864,7 @@ Args:
 
 Returns:
    A boolean."""
-		if self.int_orientation in (5,6,7,8) and self.int_width == width and self.int_height == height:
+		if self.exifOrientation() in (5,6,7,8) and self.size() == (width,height):
 			return False
 		else:
 			return True
@@ -706,154 +878,188 @@ Args:
 
 Returns:
    None."""
-		if self.int_orientation == 2:
+		orientation = self.exifOrientation()
+		if orientation == 2:
 			# 2 = "Mirror horizontal"
 			matrix.scale(-1,1)
-		elif self.int_orientation == 3:
+		elif orientation == 3:
 			# 3 = "Rotate 180"
 			matrix.rotate(180)
-		elif self.int_orientation == 4:
+		elif orientation == 4:
 			# 4 = "Mirror vertical"
 			matrix.scale(1,-1)
-		elif self.int_orientation == 5:
+		elif orientation == 5:
 			# 5 = "Mirror horizontal and rotate 270 CW"
 			matrix.scale(-1,1)
 			matrix.rotate(270)
-		elif self.int_orientation == 6:
+		elif orientation == 6:
 			# 6 = "Rotate 90 CW"
 			matrix.rotate(90)
-		elif self.int_orientation == 7:
+		elif orientation == 7:
 			# 7 = "Mirror horizontal and rotate 90 CW"
 			matrix.scale(1,-1)
 			matrix.rotate(90)
-		elif self.int_orientation == 8:
+		elif orientation == 8:
 			# 8 = "Rotate 270 CW"
 			matrix.rotate(270)
 		
 	
-	def updateIcon(self):
-		"""Apply currently set orientation to stored thumbnail image
-in order to create a new item icon."""
-		iconsize = self.listWidget().iconSize()
+	def iconKey(self,iconsize):
+		"""Return the key (width,height,orientation,rotation) of an icon of
+given QSize showing the item's current orientation."""
+		return (iconsize.width(),iconsize.height(),self.exifOrientation(),self.rotation())
+	
+	
+	def iconMatrix(self):
+		"""Return the QTransform turning the thumbnail into the item's icon."""
 		matrix = QtGui.QTransform()
 		# assume thumbnails to be not auto-rotated: apply orientation matrix
 		self.applyOrientation(matrix)
 		# apply rotation
-		matrix.rotate(self.int_rotation)
-		thumb = self.pix_thumb.transformed(
-				matrix,
-				QtCore.Qt.SmoothTransformation
-			).scaled(
-				iconsize,
-				QtCore.Qt.KeepAspectRatio,
-				QtCore.Qt.SmoothTransformation
-			)
-		self.setIcon(QtGui.QIcon(thumb))
-		self.setSizeHint(iconsize+QtCore.QSize(8,8))
+		matrix.rotate(self.rotation())
+		return matrix
+
 	
 	
 	def updateToolTip(self):
-		"""Update the item's tooltip."""
-		str_tooltip = "<h4>{0}</h4>".format(self.str_filename)
+		"""Tooltip is created on demand by toolTip(): just increment the data
+version (invalidating the current tooltip) and notify the model."""
+		self.int_version += 1
+		self.emitDataChanged()
+	
+	
+	def dataVersion(self):
+		"""Return the item's data version (incremented on every change)."""
+		return self.int_version
+	
+	
+	def toolTip(self):
+		"""Return the item's tooltip (an HTML string); it is created when first
+asked for and kept until the item's data changes."""
+		if self.tpl_tooltip != None and self.tpl_tooltip[0] == self.int_version:
+			return self.tpl_tooltip[1]
+		store,row = self.store_metadata,self.int_record
+		str_tooltip = "<h4>{0}</h4>".format(self.filename())
 		
-		if self.date_timestamp != None:
-			if self.bool_editedTimezones:
+		timestamp = self.timestamp()
+		if timestamp != None:
+			if self.timezonesEdited():
+				(timestamp_shifted,timestamp_utc) = self.shiftedTimestamps()
 				str_tooltip += "<p><font color=\"blue\">{0}</font> ({1} UTC)</p>".format(
-					self.date_shiftedTimestamp.strftime("%Y-%m-%d %H:%M:%S"),
-					self.date_utcTimestamp.strftime("%Y-%m-%d %H:%M:%S"),
+					timestamp_shifted.strftime("%Y-%m-%d %H:%M:%S"),
+					timestamp_utc.strftime("%Y-%m-%d %H:%M:%S"),
 				)
 			else:
-				str_tooltip += "<p>{0}</p>".format(self.date_timestamp.strftime("%Y-%m-%d %H:%M:%S"))
+				str_tooltip += "<p>{0}</p>".format(timestamp.strftime("%Y-%m-%d %H:%M:%S"))
 		
-		if len(self.str_cameraSettings) != 0:
-			str_tooltip += "<p>{0}</p>".format(self.str_cameraSettings)
-		if len(self.str_cameraHardware) != 0:
-			str_tooltip += "<p>{0}</p>".format(self.str_cameraHardware)
+		cameraSettings = self.cameraSettings()
+		if len(cameraSettings) != 0:
+			str_tooltip += "<p>{0}</p>".format(cameraSettings)
+		cameraHardware = self.cameraHardware()
+		if len(cameraHardware) != 0:
+			str_tooltip += "<p>{0}</p>".format(cameraHardware)
 		
-		if len(self.tpl_keywords) > 0:
-			if self.bool_editedKeywords:
-				str_tooltip += "<p><font color=\"blue\">{0}</font></p>".format(", ".join(self.tpl_keywords))
+		keywords = self.keywords()
+		if len(keywords) > 0:
+			if self.keywordsEdited():
+				str_tooltip += "<p><font color=\"blue\">{0}</font></p>".format(", ".join(keywords))
 			else:
-				str_tooltip += "<p>{0}</p>".format(", ".join(self.tpl_keywords))
+				str_tooltip += "<p>{0}</p>".format(", ".join(keywords))
 		
-		if len(self.tpl_location) == 3:
-			if self.bool_editedLocation:
+		location = store.location(row)
+		location_saved = store.location(row,True)
+		if len(location) == 3:
+			if self.locationEdited():
 				str_tooltip += "<p><font color=\"blue\">"
 			else:
 				str_tooltip += "<p>"
 			str_tooltip += "{0:+.3f}, {1:+.3f}, {2:+.0f} m {3}".format(
-					self.tpl_location[0],
-					self.tpl_location[1],
-					self.tpl_location[2],
+					location[0],
+					location[1],
+					location[2],
 					QtCore.QCoreApplication.translate("ItemToolTip","Elevation")
 			)
-			if self.bool_editedLocation:
-				if len(self.tpl_saved_location) == 3:
+			if self.locationEdited():
+				if len(location_saved) == 3:
 					str_tooltip += "</font> ({0:+.3f}, {1:+.3f}, {2:+.0f} m {3})".format(
-						self.tpl_saved_location[0],
-						self.tpl_saved_location[1],
-						self.tpl_saved_location[2],
+						location_saved[0],
+						location_saved[1],
+						location_saved[2],
 						QtCore.QCoreApplication.translate("ItemToolTip","Elevation")
 					)
 			str_tooltip += "</p>"
 		
-		if len(self.str_copyright) > 0:
-			if self.bool_editedCopyright:
-				str_tooltip += "<p><font color=\"blue\">&#169; {0}</font></p>".format(self.str_copyright)
+		copyright = self.copyright()
+		if len(copyright) > 0:
+			if self.copyrightEdited():
+				str_tooltip += "<p><font color=\"blue\">&#169; {0}</font></p>".format(copyright)
 			else:
-				str_tooltip += "<p>&#169; {0}</p>".format(self.str_copyright)
+				str_tooltip += "<p>&#169; {0}</p>".format(copyright)
 		
-		if len(self.str_description) > 0:
-			if self.bool_editedDescription:
-				str_tooltip += "<p><font color=\"red\">&#169; {0}</font></p>".format(self.str_description)
+		description = self.description()
+		if len(description) > 0:
+			if self.descriptionEdited():
+				str_tooltip += "<p><font color=\"red\">&#169; {0}</font></p>".format(description)
 			else:
-				str_tooltip += "<p>&#169; {0}</p>".format(self.str_description)
+				str_tooltip += "<p>&#169; {0}</p>".format(description)
 
-		self.setToolTip(str_tooltip)
+		self.tpl_tooltip = (self.int_version,str_tooltip)
+		return str_tooltip
+	
+	
+	def emitDataChanged(self):
+		"""Notify the model showing this item (if any) about changed data."""
+		if self.model_gallery != None:
+			self.model_gallery.itemDataChanged(self)
 	
 	
 	def saveState(self):
 		"""Back-up the item's state."""
-		self.tpl_saved_keywords = self.tpl_keywords
-		self.tpl_saved_location = self.tpl_location
-		self.tpl_saved_timezones = self.tpl_timezones
-		self.str_saved_copyright = self.str_copyright
-		self.str_saved_description = self.str_description
+		store,row = self.store_metadata,self.int_record
+		store.arr_savedKeywords[row] = store.arr_keywords[row]
+		store.arr_savedLatitude[row] = store.arr_latitude[row]
+		store.arr_savedLongitude[row] = store.arr_longitude[row]
+		store.arr_savedElevation[row] = store.arr_elevation[row]
+		store.arr_savedFromTimezone[row] = store.arr_fromTimezone[row]
+		store.arr_savedToTimezone[row] = store.arr_toTimezone[row]
+		store.arr_savedCopyright[row] = store.arr_copyright[row]
+		store.arr_savedDescription[row] = store.arr_description[row]
 		self.updateEditState()
 		self.updateToolTip()
 	
 	
 	def resetRotation(self):
 		"""Discard any rotation."""
-		self.int_rotation = 0
-		self.updateIcon()
-		self.updateEditState()
-		self.updateToolTip()
+		self.setRotation(0)
 	
 	
 	def resetTimezones(self):
 		"""Return to previously saved timezone correction."""
-		self.setTimezones(*self.tpl_saved_timezones)
+		store,row = self.store_metadata,self.int_record
+		self.setTimezones(store.string(store.arr_savedFromTimezone[row]),store.string(store.arr_savedToTimezone[row]))
 	
 	
 	def resetKeywords(self):
 		"""Return to previously saved keyword set."""
-		self.setKeywords(self.tpl_saved_keywords)
+		store = self.store_metadata
+		self.setKeywords(store.keywords(store.arr_savedKeywords[self.int_record]))
 	
 	
 	def resetLocation(self):
 		"""Return to previously saved location."""
-		self.setLocation(*self.tpl_saved_location)
+		self.setLocation(*self.store_metadata.location(self.int_record,True))
 	
 	
 	def resetCopyright(self):
 		"""Return to previously saved location."""
-		self.setCopyright(self.str_saved_copyright)
+		store = self.store_metadata
+		self.setCopyright(store.string(store.arr_savedCopyright[self.int_record]))
 	
 	
 	def resetDescription(self):
 		"""Return to previously saved location."""
-		self.setDescription(self.str_saved_description)
+		store = self.store_metadata
+		self.setDescription(store.string(store.arr_savedDescription[self.int_record]))
 
 
 	def resetAll(self):
@@ -869,3 +1075,814 @@ Convenience method to call all other reset* methods at once."""
 
 
 
+
+
+def readImage(source="",matrix=None,size=None):
+	"""Read an image from given file path or QIODevice and apply the QTransform
+matrix. Returns a QImage (null if the source can't be read).
+
+If size (a QSize) is given, images larger than size (after transformation) are
+scaled down while decoding (JPEG: DCT scaling); the result is roughly of that
+size. Orientation information of the image file is not applied."""
+	if matrix == None:
+		matrix = QtGui.QTransform()
+	reader = QtGui.QImageReader(source)
+	reader.setAutoTransform(False)
+	size_image = reader.size()
+	if size != None and size_image.isValid():
+		# size of the transformed image, fitted into size...
+		size_scaled = matrix.mapRect(QtCore.QRect(QtCore.QPoint(0,0),size_image)).size()
+		size_scaled.scale(size,QtCore.Qt.KeepAspectRatio)
+		# ...transformed back (90 degree rotations swap dimensions)
+		if matrix.isRotating() and abs(matrix.m12()) > abs(matrix.m11()):
+			size_scaled.transpose()
+		if size_scaled.width() < size_image.width() and size_scaled.height() < size_image.height():
+			reader.setScaledSize(size_scaled)
+	image = reader.read()
+	if not image.isNull() and not matrix.isIdentity():
+		image = image.transformed(matrix,QtCore.Qt.SmoothTransformation)
+	return image
+
+
+class FPPThumbnailLoader(QtCore.QObject):
+	"""Class for rendering item icons on a pool of threads.
+
+An item's thumbnail data is decoded, transformed and scaled to the requested
+icon size in a pool thread; the result is emitted via signal
+iconReady(item,key,image). Requests no longer wanted (cf. retain()) are skipped
+when their turn comes. Icons larger than PreviewSize pixels are rendered from
+the decoded preview images of an FPPPreviewCache (cf. setPreviewCache()), i.e.
+previews are decoded once and shared with the image view. The loader should be
+created in the GUI thread; the signal is then delivered to the GUI thread, too.
+
+QImage is used instead of QPixmap because pixmaps must not be created outside
+the GUI thread."""
+	
+	# new signal/slot mechanism: define emitted signals (must be class vars!)
+	iconReady = QtCore.pyqtSignal(object,object,QtGui.QImage)
+	
+	# icons larger than this are rendered from the preview instead of the thumbnail
+	PreviewSize = 160
+	
+	def __init__(self,threads=None):
+		super().__init__()
+		self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=threads or os.cpu_count() or 1)
+		# id(item) -> requested key; changed by the GUI thread only
+		self.dct_wanted = {}
+		# FPPPreviewCache large icons are rendered from (None: use thumbnails)
+		# and directory of the items' files
+		self.cache_preview = None
+		self.str_directory = ""
+	
+	
+	def setPreviewCache(self,cache=None,directory=""):
+		"""Render icons larger than PreviewSize from the images of given
+FPPPreviewCache; directory contains the items' files."""
+		self.cache_preview = cache
+		self.str_directory = str(directory)
+	
+	
+	def request(self,item,key,iconsize):
+		"""Schedule rendering of the icon of given key for given item."""
+		if self.dct_wanted.get(id(item)) == key: return
+		self.dct_wanted[id(item)] = key
+		self.executor.submit(
+			self.processItem,
+			item,
+			key,
+			item.thumbnailData(),
+			item.iconMatrix(),
+			QtCore.QSize(iconsize),
+			self.cache_preview,
+			os.path.join(self.str_directory,item.filename())
+		)
+	
+	
+	def finish(self,item,key):
+		"""Icon of given key was delivered: forget the request."""
+		if self.dct_wanted.get(id(item)) == key:
+			del self.dct_wanted[id(item)]
+	
+	
+	def retain(self,ids=()):
+		"""Forget all requests except those of the given item ids."""
+		for i in [i for i in self.dct_wanted if i not in ids]:
+			del self.dct_wanted[i]
+	
+	
+	def processItem(self,item,key,data,matrix,iconsize,cache=None,filepath=""):
+		if self.dct_wanted.get(id(item)) != key: return
+		if cache != None and (iconsize.width() > self.PreviewSize or iconsize.height() > self.PreviewSize):
+			image = cache.load(item,filepath)
+			if not image.isNull():
+				# cached images are already oriented: apply rotation only
+				(width,height,orientation,rotation) = key
+				if rotation != 0:
+					matrix = QtGui.QTransform()
+					matrix.rotate(rotation)
+					image = image.transformed(matrix)
+				self.iconReady.emit(item,key,image.scaled(iconsize,QtCore.Qt.KeepAspectRatio,QtCore.Qt.SmoothTransformation))
+				return
+		self.iconReady.emit(item,key,self.renderIcon(data,matrix,iconsize))
+	
+	
+	@staticmethod
+	def renderIcon(data=b"",matrix=None,iconsize=None):
+		"""Decode given image data, apply the QTransform matrix and scale the
+result to fit into iconsize. Returns a QImage (null if data can't be decoded).
+
+Large images are scaled down while decoding (JPEG: DCT scaling)."""
+		buffer_data = QtCore.QBuffer()
+		buffer_data.setData(data)
+		image = readImage(buffer_data,matrix,iconsize)
+		if image.isNull(): return image
+		return image.scaled(iconsize,QtCore.Qt.KeepAspectRatio,QtCore.Qt.SmoothTransformation)
+	
+	
+	def cancel(self):
+		"""Forget all requests; pending ones are skipped."""
+		self.dct_wanted.clear()
+	
+	
+	def shutdown(self):
+		"""Skip pending requests and wait for running ones."""
+		self.cancel()
+		self.executor.shutdown(wait=True)
+
+
+class FPPPreviewCache(QtCore.QObject):
+	"""Class for decoding preview images on a pool of threads.
+
+Images are decoded at (at most) screen size, orientation is applied; given
+user rotation is not. Decoded images are kept in least-recently-used order and
+released as soon as they exceed the memory budget. request() schedules decoding
+in the background; load() returns an image, waiting for or doing its decoding
+if necessary. Images of files Qt can't read (e.g. RAW) are decoded from the
+item's embedded preview."""
+	
+	def __init__(self,budget=256*1024**2,size=None,threads=2):
+		super().__init__()
+		self.int_budget = max(int(budget),0)
+		self.int_bytes = 0
+		self.size_screen = QtCore.QSize(size) if size != None else QtCore.QSize(1920,1200)
+		self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=threads)
+		self.lock = threading.Lock()
+		self.dct_futures = {}
+		# filepath -> QImage, in least-recently-used order
+		self.dct_images = collections.OrderedDict()
+		# incremented by clear(): results of decoding started before are dropped
+		self.int_generation = 0
+	
+	
+	def setBudget(self,budget=0):
+		"""Set the memory budget (bytes) for decoded images."""
+		with self.lock:
+			self.int_budget = max(int(budget),0)
+			self.releaseLeastRecentlyUsed()
+	
+	
+	def setScreenSize(self,size):
+		"""Set the size images are decoded at; discards decoded images if it changed."""
+		if QtCore.QSize(size) != self.size_screen:
+			self.clear()
+			self.size_screen = QtCore.QSize(size)
+	
+	
+	def request(self,item,filepath=""):
+		"""Schedule decoding of given item's image file (if it's not decoded yet)."""
+		with self.lock:
+			if filepath in self.dct_images or filepath in self.dct_futures: return
+			matrix = QtGui.QTransform()
+			item.applyOrientation(matrix)
+			self.dct_futures[filepath] = self.executor.submit(self.processFile,item,filepath,matrix,self.int_generation)
+	
+	
+	def load(self,item,filepath=""):
+		"""Return the decoded image of given item's image file as QImage.
+If its decoding is already scheduled, wait for the result; otherwise decode it
+in the calling thread. Concurrent calls for the same file (e.g. by the icon
+loader's threads) wait for this decoding, too."""
+		with self.lock:
+			image = self.dct_images.get(filepath)
+			if image != None:
+				self.dct_images.move_to_end(filepath)
+				return image
+			future = self.dct_futures.get(filepath)
+			if future == None:
+				# decode here; mark as running, i.e. clear() can't cancel it
+				future = concurrent.futures.Future()
+				future.set_running_or_notify_cancel()
+				self.dct_futures[filepath] = future
+				generation = self.int_generation
+				bool_decode = True
+			else:
+				bool_decode = False
+		if not bool_decode:
+			try:
+				return future.result()
+			except concurrent.futures.CancelledError:
+				generation = self.int_generation
+		matrix = QtGui.QTransform()
+		item.applyOrientation(matrix)
+		try:
+			image = self.processFile(item,filepath,matrix,generation)
+		except:
+			image = QtGui.QImage()
+		if bool_decode:
+			future.set_result(image)
+		return image
+	
+	
+	def processFile(self,item,filepath,matrix,generation=0):
+		"""Decode and store the image; returns it."""
+		image = readImage(filepath,matrix,self.size_screen)
+		if image.isNull():
+			# image format not supported by Qt (e.g. RAW): use embedded preview
+			buffer_preview = QtCore.QBuffer()
+			buffer_preview.setData(item.previewData())
+			image = readImage(buffer_preview,matrix,self.size_screen)
+		with self.lock:
+			if generation != self.int_generation: return image
+			self.dct_futures.pop(filepath,None)
+			if not image.isNull() and filepath not in self.dct_images:
+				self.dct_images[filepath] = image
+				self.int_bytes += image.bytesPerLine() * image.height()
+				self.releaseLeastRecentlyUsed()
+		return image
+	
+	
+	def releaseLeastRecentlyUsed(self):
+		"""Discard least recently used images until the budget is met (lock held)."""
+		while self.int_bytes > self.int_budget and len(self.dct_images) > 0:
+			(filepath,image) = self.dct_images.popitem(last=False)
+			self.int_bytes -= image.bytesPerLine() * image.height()
+	
+	
+	def clear(self):
+		"""Cancel pending decoding and discard all decoded images."""
+		with self.lock:
+			for future in self.dct_futures.values():
+				future.cancel()
+			self.dct_futures.clear()
+			self.dct_images.clear()
+			self.int_bytes = 0
+			self.int_generation += 1
+	
+	
+	def shutdown(self):
+		"""Cancel pending decoding and wait for running ones."""
+		self.clear()
+		self.executor.shutdown(wait=True)
+
+
+class FPPSelectionSummary(object):
+	"""Class aggregating the data of selected gallery items.
+
+For every field (location, timezones, keywords, copyright, description) it
+counts how many selected items carry each distinct value, and for every edit
+flag how many selected items are edited. Items are added and removed as the
+selection changes and updated when a selected item changes (cf.
+FPPGalleryView), so conflicts are known without inspecting the selection."""
+	
+	Fields = ("location","timezones","keywords","copyright","description")
+	EditFlags = ("orientation","location","timezones","keywords","copyright","description")
+	
+	def __init__(self):
+		"""Constructor; initialise fields."""
+		# id(item) -> (item,values,flags), as counted
+		self.dct_items = {}
+		self.dct_values = dict([(field,collections.Counter()) for field in self.Fields])
+		self.cnt_edited = collections.Counter()
+	
+	
+	@staticmethod
+	def itemState(item):
+		"""Return a tuple (values,flags) of given item, ordered like Fields and
+EditFlags."""
+		return (
+			(item.location(),item.timezones(),item.keywords(),item.copyright(),item.description()),
+			(item.orientationEdited(),item.locationEdited(),item.timezonesEdited(),
+			item.keywordsEdited(),item.copyrightEdited(),item.descriptionEdited())
+		)
+	
+	
+	def add(self,item):
+		"""Count given item (if not already counted)."""
+		if item == None or id(item) in self.dct_items: return
+		(values,flags) = self.itemState(item)
+		self.dct_items[id(item)] = (item,values,flags)
+		for field,value in zip(self.Fields,values):
+			self.dct_values[field][value] += 1
+		for flag,edited in zip(self.EditFlags,flags):
+			if edited: self.cnt_edited[flag] += 1
+	
+	
+	def remove(self,item):
+		"""Stop counting given item (if it is counted)."""
+		try:
+			(item,values,flags) = self.dct_items.pop(id(item))
+		except KeyError:
+			return
+		for field,value in zip(self.Fields,values):
+			counter = self.dct_values[field]
+			counter[value] -= 1
+			if counter[value] <= 0:
+				del counter[value]
+		for flag,edited in zip(self.EditFlags,flags):
+			if edited: self.cnt_edited[flag] -= 1
+	
+	
+	def update(self,item):
+		"""Count given item's current data (if it is counted)."""
+		if id(item) in self.dct_items:
+			self.remove(item)
+			self.add(item)
+	
+	
+	def updateItems(self,items=()):
+		"""Count given items' current data (those which are counted)."""
+		for item in items:
+			self.update(item)
+	
+	
+	def clear(self):
+		"""Forget all items."""
+		self.dct_items.clear()
+		for counter in self.dct_values.values():
+			counter.clear()
+		self.cnt_edited.clear()
+	
+	
+	def count(self):
+		"""Return the number of counted items."""
+		return len(self.dct_items)
+	
+	
+	def values(self,field):
+		"""Return a dictionary of distinct values of given field, mapped to the
+number of items carrying that value."""
+		return dict(self.dct_values[field])
+	
+	
+	def edited(self,flag):
+		"""Return True if any counted item has given edit flag set."""
+		return self.cnt_edited[flag] > 0
+
+
+class FPPGalleryModel(QtCore.QAbstractListModel):
+	"""Class for a list model holding FPPGalleryItems.
+
+Items are plain Python records; icon (DecorationRole), tooltip (ToolTipRole)
+and edit marker (UserRole) are created on demand when the view asks for them.
+Thus only visible items cost pixmaps and formatted strings.
+
+Icons are rendered by an FPPThumbnailLoader; until an icon is ready, an icon of
+the same orientation but another size (or an empty pixmap) is shown. Every item
+keeps its rendered icons by key (width,height,orientation,rotation), so
+switching icon sizes or rotating back and forth reuses earlier renders. All
+icons are kept in least-recently-used order and released as soon as they
+exceed the icon memory budget (current icons of the visible rows are never
+released).
+
+The model keeps track of its edited items (cf. FPPGalleryItem.updateEditState()),
+so asking whether anything was edited doesn't need to inspect every item.
+
+Edits of many items should be done by applyEdit(): views and listeners are
+notified once per operation (itemsChanged) instead of once per item."""
+	
+	itemChanged = QtCore.pyqtSignal(object)
+	itemsChanged = QtCore.pyqtSignal(object)
+	
+	def __init__(self,parent=None):
+		QtCore.QAbstractListModel.__init__(self,parent)
+		self.lst_items = []
+		self.size_icon = QtCore.QSize(128,128)
+		self.loader_icons = FPPThumbnailLoader()
+		self.loader_icons.iconReady.connect(self.iconReady)
+		# (id(item),key) -> item, in least-recently-used order
+		self.dct_icons = collections.OrderedDict()
+		self.int_iconbytes = 0
+		self.int_iconbudget = 128 * 1024**2
+		self.tpl_visible = (0,-1)
+		# 2026-10-18: edited items, id(item) -> item
+		self.dct_edited = {}
+		# 2026-10-18: items changed during applyEdit(), id(item) -> item;
+		#             None if no edit is applied
+		self.dct_batch = None
+	
+	
+	def rowCount(self,parent=QtCore.QModelIndex()):
+		if parent.isValid(): return 0
+		return len(self.lst_items)
+	
+	
+	def flags(self,index):
+		return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+	
+	
+	def data(self,index,role=QtCore.Qt.DisplayRole):
+		try:
+			item = self.lst_items[index.row()]
+		except:
+			return None
+		if role == QtCore.Qt.DecorationRole:
+			return self.icon(item)
+		elif role == QtCore.Qt.ToolTipRole:
+			return item.toolTip()
+		elif role == QtCore.Qt.UserRole:
+			return item.edited()
+		elif role == QtCore.Qt.SizeHintRole:
+			return self.size_icon + QtCore.QSize(8,8)
+		return None
+	
+	
+	def icon(self,item):
+		"""Return the item's icon as a QPixmap; request rendering if it's missing."""
+		key = item.iconKey(self.size_icon)
+		icons = item.dct_icons or {}
+		if key in icons:
+			self.dct_icons.move_to_end((id(item),key))
+			return icons[key]
+		self.loader_icons.request(item,key,self.size_icon)
+		# meanwhile show the largest icon of the same orientation (if any)
+		lst_icons = sorted([k for k in icons if k[2:] == key[2:]])
+		if len(lst_icons) > 0:
+			return icons[lst_icons[-1]]
+		return QtGui.QPixmap()
+	
+	
+	def hasIcon(self,item):
+		"""Return True if the item's icon for the current icon size is rendered."""
+		return item.dct_icons != None and item.iconKey(self.size_icon) in item.dct_icons
+	
+	
+	def iconReady(self,item,key,image):
+		"""Icon of an item was rendered: store it and update the view."""
+		self.loader_icons.finish(item,key)
+		if item.model_gallery is not self:
+			# item was removed meanwhile
+			return
+		self.releaseIcon(item,key)
+		if item.dct_icons == None:
+			item.dct_icons = {}
+		item.dct_icons[key] = QtGui.QPixmap.fromImage(image)
+		self.dct_icons[(id(item),key)] = item
+		self.int_iconbytes += self.iconBytes(item.dct_icons[key])
+		self.releaseLeastRecentlyUsed()
+		if key == item.iconKey(self.size_icon):
+			index = self.index(item.int_row)
+			self.dataChanged.emit(index,index,[QtCore.Qt.DecorationRole])
+	
+	
+	def iconBytes(self,pixmap):
+		return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+	
+	
+	def releaseIcon(self,item,key):
+		"""Discard the item's icon of given key."""
+		if self.dct_icons.pop((id(item),key),None) is not None:
+			self.int_iconbytes -= self.iconBytes(item.dct_icons.pop(key))
+			if len(item.dct_icons) == 0:
+				item.dct_icons = None
+	
+	
+	def releaseIcons(self,item):
+		"""Discard all icons of given item."""
+		for key in list(item.dct_icons or ()):
+			self.releaseIcon(item,key)
+	
+	
+	def releaseLeastRecentlyUsed(self):
+		"""Discard least recently used icons until the memory budget is met."""
+		if self.int_iconbytes <= self.int_iconbudget: return
+		(first,last) = self.tpl_visible
+		for (i,key),item in list(self.dct_icons.items()):
+			if self.int_iconbytes <= self.int_iconbudget: break
+			if not (first <= item.int_row <= last and key == item.iconKey(self.size_icon)):
+				self.releaseIcon(item,key)
+	
+	
+	def setIconMemory(self,size=0):
+		"""Set the memory budget (bytes) for rendered icons."""
+		self.int_iconbudget = max(int(size),0)
+		self.releaseLeastRecentlyUsed()
+	
+	
+	def setPreviewCache(self,cache=None,directory=""):
+		"""Render large icons from the images of given FPPPreviewCache (cf.
+FPPThumbnailLoader.setPreviewCache()); icons already rendered are kept."""
+		self.loader_icons.setPreviewCache(cache,directory)
+	
+	
+	def prefetch(self,first=0,last=-1,margin=0):
+		"""Rows first..last are visible: request their icons and those of
+margin rows before and after; requests for all other rows are dropped."""
+		self.tpl_visible = (first,last)
+		if last < first: return
+		lo = max(first - margin,0)
+		hi = min(last + margin,len(self.lst_items) - 1)
+		self.loader_icons.retain(set([id(item) for item in self.lst_items[lo:hi+1]]))
+		for row in list(range(first,hi+1)) + list(range(first-1,lo-1,-1)):
+			item = self.lst_items[row]
+			if not self.hasIcon(item):
+				self.loader_icons.request(item,item.iconKey(self.size_icon),self.size_icon)
+	
+	
+	def item(self,row):
+		"""Return the item at given row or None."""
+		if 0 <= row < len(self.lst_items):
+			return self.lst_items[row]
+		return None
+	
+	
+	def items(self):
+		"""Return a list of all items, in display order."""
+		return list(self.lst_items)
+	
+	
+	def updateEdited(self,item):
+		"""Add item to or remove it from the set of edited items."""
+		if item.edited():
+			self.dct_edited[id(item)] = item
+		else:
+			self.dct_edited.pop(id(item),None)
+	
+	
+	def editedCount(self):
+		"""Return the number of edited items."""
+		return len(self.dct_edited)
+	
+	
+	def editedItems(self):
+		"""Return a list of all edited items, in display order."""
+		return sorted(self.dct_edited.values(),key=lambda item: item.int_row)
+	
+	
+	def addItems(self,items=()):
+		"""Append a sequence of items to the model."""
+		items = list(items)
+		if len(items) == 0: return
+		first = len(self.lst_items)
+		self.beginInsertRows(QtCore.QModelIndex(),first,first+len(items)-1)
+		for row,item in enumerate(items,first):
+			item.model_gallery = self
+			item.int_row = row
+			self.updateEdited(item)
+		self.lst_items.extend(items)
+		self.endInsertRows()
+	
+	
+	def clear(self):
+		"""Remove all items from the model."""
+		self.beginResetModel()
+		self.loader_icons.cancel()
+		for item in self.lst_items:
+			self.releaseIcons(item)
+			item.model_gallery = None
+			item.int_row = -1
+		self.lst_items = []
+		self.dct_edited.clear()
+		self.tpl_visible = (0,-1)
+		self.endResetModel()
+	
+	
+	def shutdown(self):
+		"""Stop rendering icons; called when the program quits."""
+		self.loader_icons.shutdown()
+	
+	
+	def sortItems(self,criterion=None):
+		"""Sort items according to given criterion (default: each item's sort
+criterion) using the items' precomputed sort keys; keeps the selection."""
+		self.layoutAboutToBeChanged.emit()
+		indexes = self.persistentIndexList()
+		items = [self.lst_items[index.row()] for index in indexes]
+		if criterion == None:
+			self.lst_items.sort(key=FPPGalleryItem.sortKey)
+		else:
+			self.lst_items.sort(key=lambda item: item.sortKey(criterion))
+		for row,item in enumerate(self.lst_items):
+			item.int_row = row
+		self.changePersistentIndexList(indexes,[self.index(item.int_row) for item in items])
+		self.layoutChanged.emit()
+	
+	
+	def setIconSize(self,size):
+		"""Set icon size; icons are rendered again when they are shown."""
+		self.size_icon = QtCore.QSize(size)
+		if len(self.lst_items) > 0:
+			self.dataChanged.emit(
+				self.index(0),
+				self.index(len(self.lst_items)-1),
+				[QtCore.Qt.DecorationRole,QtCore.Qt.SizeHintRole]
+			)
+	
+	
+	def itemDataChanged(self,item):
+		"""Called by an item if its data changed: notify views and listeners
+(or collect the item if an edit is applied to many items)."""
+		if self.dct_batch != None:
+			self.dct_batch[id(item)] = item
+			return
+		index = self.index(item.int_row)
+		self.dataChanged.emit(index,index)
+		self.itemChanged.emit(item)
+	
+	
+	def applyEdit(self,items,method,*args):
+		"""Call the FPPGalleryItem method of given name with given arguments on
+all given items, e.g. applyEdit(items,"setLocation",lat,lon,ele).
+
+Views are notified by a single dataChanged() covering all changed rows,
+listeners by a single itemsChanged(list of changed items)."""
+		if self.dct_batch != None:
+			# already applying an edit: changes are reported by the outer call
+			for item in items:
+				getattr(item,method)(*args)
+			return
+		self.dct_batch = {}
+		try:
+			for item in items:
+				getattr(item,method)(*args)
+		finally:
+			changed = list(self.dct_batch.values())
+			self.dct_batch = None
+		if len(changed) > 0:
+			rows = [item.int_row for item in changed]
+			self.dataChanged.emit(self.index(min(rows)),self.index(max(rows)))
+			self.itemsChanged.emit(changed)
+
+
+class FPPGalleryView(QtWidgets.QListView):
+	"""Class for a list view showing an FPPGalleryModel.
+
+Offers the subset of the QListWidget interface used by the main window
+(items instead of indexes), so only visible items have to be realised.
+
+After scrolling, resizing or changes of the list, the view tells the model
+which rows are visible, so icons of these rows (and of one screen before and
+after) are rendered in the background."""
+	
+	itemSelectionChanged = QtCore.pyqtSignal()
+	itemChanged = QtCore.pyqtSignal(object)
+	itemsChanged = QtCore.pyqtSignal(object)
+	itemDoubleClicked = QtCore.pyqtSignal(object)
+	
+	def __init__(self,parent=None):
+		QtWidgets.QListView.__init__(self,parent)
+		self.model_gallery = FPPGalleryModel(self)
+		self.setModel(self.model_gallery)
+		# 2026-10-18: data of selected items is aggregated as the selection changes
+		self.summary_selection = FPPSelectionSummary()
+		self.selectionModel().selectionChanged.connect(self.updateSelection)
+		self.model_gallery.itemChanged.connect(self.summary_selection.update)
+		self.model_gallery.itemChanged.connect(self.itemChanged)
+		self.model_gallery.itemsChanged.connect(self.summary_selection.updateItems)
+		self.model_gallery.itemsChanged.connect(self.itemsChanged)
+		self.doubleClicked.connect(self.emitItemDoubleClicked)
+		
+		# 2026-10-18: render icons of visible rows once scrolling pauses
+		self.timer_prefetch = QtCore.QTimer(self)
+		self.timer_prefetch.setSingleShot(True)
+		self.timer_prefetch.setInterval(50)
+		self.timer_prefetch.timeout.connect(self.prefetchIcons)
+		self.verticalScrollBar().valueChanged.connect(self.schedulePrefetch)
+	
+	
+	def updateSelection(self,selected,deselected):
+		"""Update the selection summary by the selection's delta."""
+		for index in deselected.indexes():
+			self.summary_selection.remove(self.model_gallery.item(index.row()))
+		for index in selected.indexes():
+			self.summary_selection.add(self.model_gallery.item(index.row()))
+		self.itemSelectionChanged.emit()
+	
+	
+	def selectionSummary(self):
+		"""Return the FPPSelectionSummary of the selected items."""
+		return self.summary_selection
+	
+	
+	def emitItemDoubleClicked(self,index):
+		self.itemDoubleClicked.emit(self.model_gallery.item(index.row()))
+	
+	
+	def updateGeometries(self):
+		# called whenever items were laid out (e.g. after resize or insertion)
+		QtWidgets.QListView.updateGeometries(self)
+		self.schedulePrefetch()
+	
+	
+	def schedulePrefetch(self):
+		self.timer_prefetch.start()
+	
+	
+	def visibleRows(self):
+		"""Return a tuple (first,last) of the rows visible in the viewport.
+
+Items are laid out in row order, so it's sufficient to probe the viewport
+from the top and from the bottom. Returns (0,-1) if no item is visible."""
+		rect = self.viewport().rect()
+		cell = self.iconSize() + QtCore.QSize(8,8)
+		stepx = max(cell.width() // 2,1)
+		stepy = max(cell.height() // 2,1)
+		xs = list(range(rect.left(),rect.right()+1,stepx)) + [rect.right()]
+		
+		first = -1
+		for y in range(rect.top(),rect.bottom()+1,stepy):
+			rows = [self.indexAt(QtCore.QPoint(x,y)).row() for x in xs]
+			rows = [row for row in rows if row >= 0]
+			if len(rows) > 0:
+				first = min(rows)
+				break
+		if first < 0: return (0,-1)
+		
+		last = first
+		for y in range(rect.bottom(),rect.top()-1,-stepy):
+			rows = [self.indexAt(QtCore.QPoint(x,y)).row() for x in xs]
+			rows = [row for row in rows if row >= 0]
+			if len(rows) > 0:
+				last = max(rows)
+				break
+		return (first,last)
+	
+	
+	def prefetchIcons(self):
+		(first,last) = self.visibleRows()
+		self.model_gallery.prefetch(first,last,last - first + 1)
+	
+	
+	def setIconSize(self,size):
+		self.model_gallery.setIconSize(size)
+		QtWidgets.QListView.setIconSize(self,size)
+		self.schedulePrefetch()
+	
+	
+	def setIconMemory(self,size=0):
+		"""Set the memory budget (bytes) for rendered icons."""
+		self.model_gallery.setIconMemory(size)
+	
+	
+	def setPreviewCache(self,cache=None,directory=""):
+		"""Render large icons from the images of given FPPPreviewCache; directory
+contains the items' files."""
+		self.model_gallery.setPreviewCache(cache,directory)
+	
+	
+	def shutdown(self):
+		self.model_gallery.shutdown()
+	
+	
+	def count(self):
+		return self.model_gallery.rowCount()
+	
+	
+	def item(self,row):
+		return self.model_gallery.item(row)
+	
+	
+	def items(self):
+		return self.model_gallery.items()
+	
+	
+	def editedCount(self):
+		return self.model_gallery.editedCount()
+	
+	
+	def editedItems(self):
+		return self.model_gallery.editedItems()
+	
+	
+	def addItems(self,items=()):
+		self.model_gallery.addItems(items)
+	
+	
+	def clear(self):
+		# resetting the model clears the selection without notification
+		self.summary_selection.clear()
+		self.model_gallery.clear()
+	
+	
+	def sortItems(self,criterion=None):
+		self.model_gallery.sortItems(criterion)
+	
+	
+	def applyEdit(self,items,method,*args):
+		self.model_gallery.applyEdit(items,method,*args)
+	
+	
+	def selectedItems(self):
+		"""Return a list of all selected items."""
+		return [self.model_gallery.item(index.row()) for index in self.selectionModel().selectedIndexes()]
+	
+	
+	def currentRow(self):
+		return self.currentIndex().row()
+	
+	
+	def currentItem(self):
+		return self.model_gallery.item(self.currentRow())
+	
+	
+	def setCurrentRow(self,row,command=QtCore.QItemSelectionModel.ClearAndSelect):
+		self.selectionModel().setCurrentIndex(self.model_gallery.index(row),command)
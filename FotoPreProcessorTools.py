@@ -20,7 +20,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-import datetime,pytz,os.path,sys,codecs
+import datetime,pytz,os,os.path,sys,codecs,time,math,sqlite3,threading
 
 # 2015-06-16: search support needs urllib for requests and json for decoding
 import urllib.request,urllib.parse,json
@@ -32,13 +32,34 @@ class FPPTimezone:
 	"""Class for the management of timezone information.
 
 Relies on a properly setup timezone database (sys-libs/timezone-data) and
-provides the ability to reverse look-up a timezone name by position."""
+provides the ability to reverse look-up a timezone name by position.
+
+2026-10-18: reverse look-ups search a KD-tree of the timezones' positions as
+unit vectors, i.e. the nearest timezone is the one with the shortest
+great-circle distance (works across the date line and near the poles).
+
+2026-10-18: optionally, timezone boundary polygons can be loaded from a GeoJSON
+file (e.g. timezone-boundary-builder releases). Positions inside a polygon are
+resolved exactly; all other positions fall back to the nearest timezone."""
+	
+	# tolerance (decimal degrees) for simplification of boundary polygons
+	BoundaryTolerance = 0.001
+	# edge length (decimal degrees) of the cells of the polygon grid
+	BoundaryCellSize = 1.0
+	# average number of edges per horizontal band of an indexed ring
+	RingBandEdges = 8
 	
 	def __init__(self):
 		"""Constructor; initialise fields"""
 		self.dct_timezones = {}
 		self.dct_timezone_offsets = {}
 		self.tpl_timezone_names = ()
+		# KD-tree node: (vector,tzname,axis,left node,right node) or None
+		self.tree_timezones = None
+		# boundary grid: cell index -> list of (tzname,bbox,outer ring,holes),
+		# rings indexed by indexRing()
+		self.dct_boundaries = {}
+		self.lock_boundaries = threading.Lock()
 	
 	
 	def loadTimezoneDB(self,filename="/usr/share/zoneinfo/zone.tab"):
@@ -110,6 +131,221 @@ file is not available, FPP will try its one version of that file."""
 		self.dct_timezones["UTC"] = (51.477678,0.0) # http://en.wikipedia.org/wiki/World_Geodetic_System
 		self.dct_timezone_offsets["UTC"] = (0,0)
 		self.tpl_timezone_names = tuple(lst_tzname)
+		self.tree_timezones = self.buildTree(
+			[(self.unitVector(lat,lon),tzname) for tzname,(lat,lon) in self.dct_timezones.items()]
+		)
+	
+	
+	@staticmethod
+	def unitVector(latitude=0.0,longitude=0.0):
+		"""Return the unit vector (x,y,z) pointing to given position (decimal
+degrees). The squared distance of two such vectors grows monotonically with
+the great-circle distance of the positions."""
+		lat = math.radians(latitude)
+		lon = math.radians(longitude)
+		return (math.cos(lat)*math.cos(lon),math.cos(lat)*math.sin(lon),math.sin(lat))
+	
+	
+	def buildTree(self,entries=(),depth=0):
+		"""Build a KD-tree of given list of (vector,tzname) tuples; returns the
+root node."""
+		if len(entries) == 0:
+			return None
+		axis = depth % 3
+		entries = sorted(entries,key=lambda entry: entry[0][axis])
+		median = len(entries) // 2
+		return (
+			entries[median][0],
+			entries[median][1],
+			axis,
+			self.buildTree(entries[:median],depth+1),
+			self.buildTree(entries[median+1:],depth+1)
+		)
+	
+	
+	def nearestTimezone(self,vector=(0.0,0.0,1.0)):
+		"""Return the name of the timezone nearest to given unit vector (None
+if no timezone database was loaded)."""
+		best = [None,float("inf")]
+		def search(node):
+			if node == None: return
+			(point,tzname,axis,left,right) = node
+			dist = (point[0]-vector[0])**2 + (point[1]-vector[1])**2 + (point[2]-vector[2])**2
+			if dist < best[1]:
+				best[0] = tzname
+				best[1] = dist
+			diff = vector[axis] - point[axis]
+			if diff < 0:
+				search(left)
+				if diff**2 < best[1]: search(right)
+			else:
+				search(right)
+				if diff**2 < best[1]: search(left)
+		search(self.tree_timezones)
+		return best[0]
+	
+	
+	def loadTimezoneBoundaries(self,filename="",background=False):
+		"""Load timezone boundary polygons from a GeoJSON file.
+
+The file has to contain a FeatureCollection of Polygon/MultiPolygon features
+with the timezone name in property "tzid". Polygons of timezones not known
+from the timezone database are skipped, thus loadTimezoneDB() has to be called
+first. An empty filename removes all boundaries.
+
+If background is True, the file is loaded in a separate thread; look-ups use
+the nearest timezone until loading has finished."""
+		if background:
+			thread = threading.Thread(target=self.loadTimezoneBoundaries,args=(filename,))
+			thread.daemon = True
+			thread.start()
+			return
+		
+		dct_boundaries = {}
+		with self.lock_boundaries:
+			if len(filename) > 0:
+				try:
+					with open(filename,"r") as f:
+						features = json.load(f)["features"]
+				except:
+					features = () # unreadable or malformed file: no boundaries
+				for feature in features:
+					try:
+						tzname = str(feature["properties"]["tzid"])
+						geometry = feature["geometry"]
+						if geometry["type"] == "Polygon":
+							polygons = (geometry["coordinates"],)
+						elif geometry["type"] == "MultiPolygon":
+							polygons = geometry["coordinates"]
+						else:
+							continue
+					except:
+						continue
+					if tzname not in self.dct_timezone_offsets:
+						continue
+					for polygon in polygons:
+						rings = [self.simplifyRing(ring) for ring in polygon]
+						if len(rings) == 0 or len(rings[0]) < 4:
+							continue
+						lst_lon = [point[0] for point in rings[0]]
+						lst_lat = [point[1] for point in rings[0]]
+						bbox = (min(lst_lon),min(lst_lat),max(lst_lon),max(lst_lat))
+						entry = (
+							tzname,
+							bbox,
+							self.indexRing(rings[0]),
+							tuple(self.indexRing(ring) for ring in rings[1:] if len(ring) >= 4)
+						)
+						for cell_lat in range(self.cellIndex(bbox[1]),self.cellIndex(bbox[3])+1):
+							for cell_lon in range(self.cellIndex(bbox[0]),self.cellIndex(bbox[2])+1):
+								dct_boundaries.setdefault((cell_lat,cell_lon),[]).append(entry)
+			self.dct_boundaries = dct_boundaries
+	
+	
+	def cellIndex(self,degrees=0.0):
+		"""Return the index of the boundary grid cell containing given latitude
+or longitude."""
+		return int(math.floor(degrees / self.BoundaryCellSize))
+	
+	
+	def simplifyRing(self,ring=()):
+		"""Simplify a ring of [longitude,latitude] points with the Ramer-Douglas-
+Peucker algorithm; returns a tuple of (longitude,latitude) tuples.
+
+Rings which would collapse are returned unsimplified."""
+		points = [(float(point[0]),float(point[1])) for point in ring]
+		if len(points) < 5:
+			return tuple(points)
+		keep = [False] * len(points)
+		keep[0] = keep[-1] = True
+		tolerance = self.BoundaryTolerance**2
+		stack = [(0,len(points)-1)]
+		while len(stack) > 0:
+			first,last = stack.pop()
+			(x0,y0),(x1,y1) = points[first],points[last]
+			dx,dy = x1-x0,y1-y0
+			length = dx*dx + dy*dy
+			maxdist,index = 0.0,None
+			for i in range(first+1,last):
+				px,py = points[i]
+				if length > 0:
+					t = max(0.0,min(1.0,((px-x0)*dx + (py-y0)*dy) / length))
+					ex,ey = px - (x0+t*dx),py - (y0+t*dy)
+				else:
+					ex,ey = px-x0,py-y0
+				dist = ex*ex + ey*ey
+				if dist > maxdist:
+					maxdist,index = dist,i
+			if index != None and maxdist > tolerance:
+				keep[index] = True
+				stack.append((first,index))
+				stack.append((index,last))
+		simplified = tuple(point for point,flag in zip(points,keep) if flag)
+		if len(simplified) < 4:
+			return tuple(points)
+		return simplified
+	
+	
+	def indexRing(self,ring=()):
+		"""Index the edges of a ring of (x,y) tuples by horizontal bands of
+about RingBandEdges edges each; returns a tuple (ymin,band height,bands).
+
+Each band lists the non-horizontal edges (x0,y0,x1,y1) overlapping it, thus a
+ray cast at height y only has to test the edges of y's band."""
+		lst_y = [point[1] for point in ring]
+		ymin,ymax = min(lst_y),max(lst_y)
+		count = max(1,len(ring) // self.RingBandEdges)
+		height = (ymax - ymin) / count or 1.0
+		bands = [[] for i in range(count)]
+		x0,y0 = ring[-1]
+		for x1,y1 in ring:
+			if y0 != y1:
+				first = min(int((min(y0,y1) - ymin) / height),count-1)
+				last  = min(int((max(y0,y1) - ymin) / height),count-1)
+				for band in range(first,last+1):
+					bands[band].append((x0,y0,x1,y1))
+			x0,y0 = x1,y1
+		return (ymin,height,tuple(tuple(band) for band in bands))
+	
+	
+	@staticmethod
+	def pointInRing(x=0.0,y=0.0,ring=(0.0,1.0,())):
+		"""Return True if point (x,y) lies within given indexed ring (even-odd
+ray casting, see indexRing())."""
+		(ymin,height,bands) = ring
+		band = int((y - ymin) / height)
+		if band < 0:
+			return False
+		inside = False
+		for x0,y0,x1,y1 in bands[min(band,len(bands)-1)]:
+			if (y1 > y) != (y0 > y) and x < (x0-x1)*(y-y1)/(y0-y1) + x1:
+				inside = not inside
+		return inside
+	
+	
+	def boundaryTimezone(self,latitude=0.0,longitude=0.0):
+		"""Return the name of the timezone whose boundary polygon contains
+given position (None if no polygon contains it)."""
+		longitude = (longitude + 180.0) % 360.0 - 180.0
+		try:
+			candidates = self.dct_boundaries[(self.cellIndex(latitude),self.cellIndex(longitude))]
+		except (KeyError,ValueError,OverflowError):
+			return None
+		for tzname,bbox,outer,holes in candidates:
+			if bbox[0] <= longitude <= bbox[2] and bbox[1] <= latitude <= bbox[3] \
+			and self.pointInRing(longitude,latitude,outer) \
+			and not any(self.pointInRing(longitude,latitude,hole) for hole in holes):
+				return tzname
+		return None
+	
+	
+	def lookUpTimezone(self,latitude=0.0,longitude=0.0):
+		"""Return the name of the timezone at given position: the one of the
+containing boundary polygon, if any, else the nearest timezone."""
+		name = self.boundaryTimezone(latitude,longitude)
+		if name == None:
+			name = self.nearestTimezone(self.unitVector(latitude,longitude))
+		return name
 	
 	
 	def timezoneNames(self):
@@ -143,14 +379,29 @@ Returns None if no timezone name is found."""
 			longitude = float(longitude)
 		except:
 			pass
-		distance = 360**2 + 180**2
-		result = None
-		for tzname,coord in self.dct_timezones.items():
-			dist = (coord[0]-latitude)**2 + (coord[1]-longitude)**2
-			if dist < distance:
-				result = tzname
-				distance = dist
-		return result
+		return self.lookUpTimezone(latitude,longitude)
+	
+	
+	def timezoneNamesAt(self,coordinates=()):
+		"""Look-up timezone names for a sequence of (latitude,longitude) tuples.
+
+Returns a list of timezone names in the order of the coordinates; None for
+invalid coordinates. Each distinct position is looked up only once."""
+		dct_names = {}
+		lst_names = []
+		for coordinate in coordinates:
+			try:
+				position = (float(coordinate[0]),float(coordinate[1]))
+			except:
+				lst_names.append(None)
+				continue
+			try:
+				name = dct_names[position]
+			except KeyError:
+				name = self.lookUpTimezone(*position)
+				dct_names[position] = name
+			lst_names.append(name)
+		return lst_names
 
 
 
@@ -811,3 +1062,172 @@ This behaviour can be overridden by setting force=True."""
 			pass
 
 
+
+class FPPMetadataCache:
+	"""Class for a persistent cache of image metadata.
+
+Parsed tag values, scaled thumbnail image data and the MD5 sum of an image file
+are stored in an SQLite database. Entries are keyed by absolute path, file size,
+modification time and inode: if any of these differs, the entry is considered
+outdated and the file has to be scanned again.
+
+The database is limited to a maximum size (in bytes); least recently used
+entries are evicted first. A maximum size of zero disables the cache."""
+	
+	def __init__(self):
+		"""Constructor; initialise fields."""
+		self.connection = None
+		self.str_filename = ""
+		self.int_maxsize = 0
+		# the connection might be used by GUI and scanning code: serialise access
+		self.lock = threading.RLock()
+	
+	
+	def open(self,filename=None,maxsize=0):
+		"""Open (and if necessary create) the cache database with given filename.
+
+Returns True if the cache is ready for use."""
+		self.close()
+		try:    self.int_maxsize = max(int(maxsize),0)
+		except: self.int_maxsize = 0
+		if filename == None or self.int_maxsize == 0:
+			return False
+		try:
+			self.str_filename = str(filename)
+			os.makedirs(os.path.dirname(self.str_filename),exist_ok=True)
+			self.connection = sqlite3.connect(self.str_filename,check_same_thread=False)
+			self.connection.execute("""CREATE TABLE IF NOT EXISTS images (
+				path      TEXT PRIMARY KEY,
+				size      INTEGER,
+				mtime     INTEGER,
+				inode     INTEGER,
+				record    TEXT,
+				thumbnail BLOB,
+				digest    TEXT,
+				bytes     INTEGER,
+				accessed  REAL
+			)""")
+			self.connection.execute("CREATE INDEX IF NOT EXISTS images_accessed ON images (accessed)")
+			self.connection.commit()
+		except:
+			print("error while opening metadata cache:",sys.exc_info())
+			self.connection = None
+		return self.connection != None
+	
+	
+	def close(self):
+		"""Commit pending changes and close the database."""
+		with self.lock:
+			if self.connection != None:
+				self.commit()
+				self.connection.close()
+				self.connection = None
+	
+	
+	def isEnabled(self):
+		"""Return True if the cache database is open."""
+		return self.connection != None
+	
+	
+	def fileKey(self,filepath=""):
+		"""Return the key tuple (path,size,mtime,inode) of given file or None."""
+		try:
+			stat = os.stat(filepath)
+			return (os.path.abspath(filepath),stat.st_size,stat.st_mtime_ns,stat.st_ino)
+		except:
+			return None
+	
+	
+	def lookup(self,filepath=""):
+		"""Look up given file in the cache.
+
+Returns a tuple (record,thumbnail,digest) if an up-to-date entry exists and None
+otherwise. record is a dict of tag values (None if the file is no image),
+thumbnail contains encoded image data (bytes, might be empty) and digest is the
+file's MD5 sum as hex string (might be empty)."""
+		if self.connection == None: return None
+		key = self.fileKey(filepath)
+		if key == None: return None
+		with self.lock:
+			try:
+				row = self.connection.execute(
+					"SELECT record,thumbnail,digest FROM images WHERE path=? AND size=? AND mtime=? AND inode=?",
+					key
+				).fetchone()
+				if row == None: return None
+				self.connection.execute("UPDATE images SET accessed=? WHERE path=?",(time.time(),key[0]))
+				return (json.loads(row[0]),bytes(row[1]),str(row[2]))
+			except:
+				return None
+	
+	
+	def store(self,filepath="",record=None,thumbnail=b"",digest=""):
+		"""Store record, thumbnail data and digest of given file in the cache.
+
+The record dict has to be JSON serialisable; None marks a non-image file."""
+		if self.connection == None: return
+		key = self.fileKey(filepath)
+		if key == None: return
+		with self.lock:
+			try:
+				str_record = json.dumps(record)
+				thumbnail = bytes(thumbnail)
+				self.connection.execute(
+					"INSERT OR REPLACE INTO images VALUES (?,?,?,?,?,?,?,?,?)",
+					key + (str_record,thumbnail,str(digest),len(key[0])+len(str_record)+len(thumbnail),time.time())
+				)
+			except:
+				print("error while storing metadata cache entry:",sys.exc_info())
+	
+	
+	def updateDigest(self,filepath="",digest=""):
+		"""Set the MD5 sum of given file's entry (if it is up-to-date)."""
+		if self.connection == None: return
+		key = self.fileKey(filepath)
+		if key == None: return
+		with self.lock:
+			try:
+				self.connection.execute(
+					"UPDATE images SET digest=? WHERE path=? AND size=? AND mtime=? AND inode=?",
+					(str(digest),) + key
+				)
+			except:
+				print("error while updating metadata cache entry:",sys.exc_info())
+	
+	
+	def commit(self):
+		"""Evict entries exceeding the size limit and write changes to disk."""
+		with self.lock:
+			if self.connection == None: return
+			try:
+				self.evict()
+				self.connection.commit()
+			except:
+				print("error while committing metadata cache:",sys.exc_info())
+	
+	
+	def evict(self):
+		"""Delete least recently used entries until the cache fits its size limit."""
+		with self.lock:
+			if self.connection == None: return
+			total = self.connection.execute("SELECT TOTAL(bytes) FROM images").fetchone()[0]
+			if total <= self.int_maxsize: return
+			lst_paths = []
+			for path,size in self.connection.execute("SELECT path,bytes FROM images ORDER BY accessed"):
+				if total <= self.int_maxsize: break
+				lst_paths.append((path,))
+				total -= size
+			self.connection.executemany("DELETE FROM images WHERE path=?",lst_paths)
+	
+	
+	def clear(self):
+		"""Delete all cache entries."""
+		with self.lock:
+			if self.connection == None: return
+			try:
+				self.connection.execute("DELETE FROM images")
+				self.connection.commit()
+				self.connection.execute("VACUUM")
+			except:
+				print("error while clearing metadata cache:",sys.exc_info())
+
@@ -25,11 +25,11 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 2017-03-11: ported to PyQt5
 """
 
-import subprocess,sys,os.path,codecs,re,time,yaml
+import subprocess,sys,os.path,codecs,re,time,yaml,csv,tempfile
 
 from PyQt5 import QtGui, QtWidgets, QtCore
 
-import FotoPreProcessorTools
+import FotoPreProcessorTools,FotoPreProcessorIngest
 
 
 class FPPGeoTaggingDock(QtWidgets.QDockWidget):
@@ -206,6 +206,12 @@ Attributes: Delete on close"""
 		self.tz = FotoPreProcessorTools.FPPTimezone()
 		self.tz.loadTimezoneDB()
 		
+		# 2026-10-18: optional timezone boundary polygons for exact look-ups
+		settings = QtCore.QSettings()
+		settings.setIniCodec(QtCore.QTextCodec.codecForName("UTF-8"))
+		self.str_boundaries = ""
+		self.loadBoundaries(str(settings.value("TimezoneBoundaries","")))
+		
 		#
 		# setup GUI
 		#
@@ -302,6 +308,14 @@ Attributes: Delete on close"""
 			pass
 	
 	
+	def loadBoundaries(self,filename=""):
+		"""Load timezone boundary polygons from given GeoJSON file in the
+background; an empty filename disables boundary look-ups."""
+		if filename != self.str_boundaries:
+			self.str_boundaries = filename
+			self.tz.loadTimezoneBoundaries(filename,background=True)
+	
+	
 	def setLocation(self,latitude=None,longitude=None):
 		try:
 			self.float_latitude  = float(latitude)
@@ -697,14 +711,45 @@ class FPPApplyChangesDialog(QtWidgets.QDialog):
 	
 	
 	def calculate_commands(self):
+		"""Create the list of exiftool argument blocks; the executable itself is
+not part of a block since all blocks are executed by a single exiftool session
+(cf. execute()).
+
+Every entry of the list is a tuple (arguments,names,digests) of an argument list
+(without filenames), a list of the filenames to process and a list of
+(filename,digest) tuples to be written as ImageUniqueID."""
 		self.konsole.clear()
 		self.lst_commands = []
+		
+		# 2026-10-18: files with identical parameters (apart from the digest
+		#             stored as ImageUniqueID) are processed by one command;
+		#             digests are imported from a CSV file by the same command,
+		#             i.e. every file is still written only once; empty digests
+		#             stay explicit parameters since exiftool skips empty CSV
+		#             values, i.e. they would not clear ImageUniqueID
+		dct_groups = {}
 		for name,parameters in self.dict_parameters.items():
-			command = [self.ustr_path_exiftool,"-P","-overwrite_original"]
-			command.extend(parameters)
-			command.append(name)
-			self.konsole.appendPlainText(" ".join(command)+"\n")
-			self.lst_commands.append(command)
+			shared = []
+			digest = None
+			for parameter in parameters:
+				if parameter.startswith("-ImageUniqueID=") and len(parameter) > 15:
+					digest = parameter[15:]
+				else:
+					shared.append(parameter)
+			(names,digests) = dct_groups.setdefault(tuple(shared),([],[]))
+			names.append(name)
+			if digest != None:
+				digests.append((name,digest))
+		
+		for shared,(names,digests) in dct_groups.items():
+			command = ["-P","-overwrite_original"]
+			command.extend(shared)
+			if len(digests) > 0:
+				str_csv = "-csv=<ImageUniqueID of {0} files>".format(len(digests))
+			else:
+				str_csv = ""
+			self.konsole.appendPlainText(" ".join([self.ustr_path_exiftool]+command+[str_csv]+names)+"\n")
+			self.lst_commands.append((command,names,digests))
 		
 		if len(self.dict_parameters) > 0:
 			settings = QtCore.QSettings()
@@ -715,8 +760,9 @@ class FPPApplyChangesDialog(QtWidgets.QDialog):
 				# construct command to rename all files;
 				# naming scheme is given as a string of exiftool parameters:
 				# split along whitespace characters
-				command = [ self.ustr_path_exiftool,
-					"-config",str(os.path.join(sys.path[0],"FotoPreProcessor.exiftool")),
+				# 2026-10-18: config file FotoPreProcessor.exiftool is
+				#             loaded when the exiftool session is started
+				command = [
 					"-P",
 					"-overwrite_original"
 				]
@@ -725,10 +771,10 @@ class FPPApplyChangesDialog(QtWidgets.QDialog):
 #				]
 				command.extend(namingScheme.split())
 				# parameter dict keys = all known files
-				command.extend(self.dict_parameters.keys())
+				names = list(self.dict_parameters.keys())
 				# append command
-				self.konsole.appendPlainText(" ".join(command)+"\n")
-				self.lst_commands.append(command)
+				self.konsole.appendPlainText(" ".join([self.ustr_path_exiftool]+command+names)+"\n")
+				self.lst_commands.append((command,names,[]))
 		else:
 			# files not yet recorded: display hint
 			self.konsole.appendHtml("<i>"+QtCore.QCoreApplication.translate("Dialog","There are no changes to apply.\nEither load a changes file or edit some pictures.")+"</i>\n")
@@ -762,21 +808,53 @@ This calls cancelOp to handle different states of command execution."""
 		self.box_stdButtons.removeButton(self.button_execute)
 		self.box_stdButtons.removeButton(self.button_add)
 		self.progressbar.reset()
-		self.progressbar.setRange(1,len(self.lst_commands))
+		self.progressbar.setRange(0,sum([len(names) for arguments,names,digests in self.lst_commands]))
+		self.progressbar.setValue(0)
 		self.progressbar.setFormat("%v/%m")
 		self.progressbar.show()
 		self.konsole.clear()
 		
+		settings = QtCore.QSettings()
+		try:    int_readsize = int(settings.value("ReadSize",1024))
+		except: int_readsize = 1024
+		
+		try:    int_stepsize = max(int(settings.value("StepSize",4)),1)
+		except: int_stepsize = 4
+		
+		# 2026-10-18: run all commands in one exiftool session instead of
+		#             starting exiftool for every single file; command blocks
+		#             are numbered, i.e. output ends with {readyNUMBER}
 		self.bool_isRunning = True
-		for command in self.lst_commands:
-			if not self.bool_isRunning:
+		try:
+			proc_exiftool = FotoPreProcessorIngest.FPPExiftoolProcess(
+				self.ustr_path_exiftool,
+				readsize=int_readsize,
+				config=str(os.path.join(sys.path[0],"FotoPreProcessor.exiftool")),
+				stderr=subprocess.STDOUT
+			)
+		except:
+			print("error while starting exiftool:",sys.exc_info())
+			proc_exiftool = None
+		
+		for number,(command,names,digests) in enumerate(self.iterBlocks(int_stepsize),1):
+			if not self.bool_isRunning or proc_exiftool == None:
 				break
-			try:
-				self.konsole.appendPlainText(subprocess.check_output(command).decode())
-			except:
-				print("error while appending exiftool output:",sys.exc_info())
-			self.progressbar.setValue(self.progressbar.value()+1)
-			QtCore.QCoreApplication.processEvents() # make cancel button responsive...?
+			filename_csv = None
+			if len(digests) > 0:
+				filename_csv = self.writeDigestFile(digests)
+				command = ["-csv={0}".format(filename_csv)] + command
+			output = self.executeBlock(proc_exiftool,command,number)
+			if filename_csv != None:
+				os.remove(filename_csv)
+			if output == None:
+				print("error while appending exiftool output: exiftool terminated unexpectedly")
+				break
+			self.konsole.appendPlainText(output)
+			self.progressbar.setValue(self.progressbar.value()+len(names))
+			QtCore.QCoreApplication.processEvents()
+		
+		if proc_exiftool != None:
+			proc_exiftool.close()
 		
 		if self.bool_isRunning:
 			# command execution finished: remove cancel button, add close button
@@ -788,6 +866,54 @@ This calls cancelOp to handle different states of command execution."""
 		else:
 			# command execution was cancelled: close dialog, reject()
 			self.reject()
+	
+	
+	def iterBlocks(self,stepsize=4):
+		"""Generator splitting the commands into blocks of at most stepsize
+files; yields tuples (command,names,digests) with the filenames appended to the
+command and the digests of these files only."""
+		for arguments,names,digests in self.lst_commands:
+			dct_digests = dict(digests)
+			for index in range(0,len(names),stepsize):
+				block = names[index:index+stepsize]
+				yield (
+					list(arguments) + block,
+					block,
+					[(name,dct_digests[name]) for name in block if name in dct_digests]
+				)
+	
+	
+	def executeBlock(self,proc_exiftool=None,command=(),number=None):
+		"""Send a command block to exiftool and return its output; events are
+processed while reading (cf. executionCancelled()), so the dialog is repainted
+and the cancel button stays responsive.
+
+Returns None if exiftool terminated unexpectedly."""
+		lst_output = []
+		try:
+			proc_exiftool.send(command,number)
+			for chunk in proc_exiftool.iterOutput(number,partial=True,abort=self.executionCancelled):
+				lst_output.append(chunk)
+		except:
+			return None
+		return b"".join(lst_output).decode(errors="replace").strip()
+	
+	
+	def executionCancelled(self):
+		"""Process pending events and return True if execution was cancelled."""
+		QtCore.QCoreApplication.processEvents()
+		return not self.bool_isRunning
+	
+	
+	def writeDigestFile(self,digests=()):
+		"""Write given (filename,digest) tuples to a temporary CSV file which can
+be imported by exiftool via -csv=FILE. Returns the file's name."""
+		(handle,filename) = tempfile.mkstemp(suffix=".csv",prefix="fpp-")
+		with open(handle,"w",newline="",encoding="utf-8") as f:
+			writer = csv.writer(f)
+			writer.writerow(("SourceFile","ImageUniqueID"))
+			writer.writerows(digests)
+		return filename
 
 
 
@@ -816,8 +942,12 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 		self.edit_gimp = QtWidgets.QLineEdit()
 		self.edit_gimp.setCompleter(filecompleter)
 		
+		self.edit_boundaries = QtWidgets.QLineEdit()
+		self.edit_boundaries.setToolTip(QtCore.QCoreApplication.translate("Dialog","GeoJSON file with timezone boundary polygons;\nleave empty to estimate timezones by nearest city."))
+		
 		button_find_exiftool = QtWidgets.QPushButton(QtCore.QCoreApplication.translate("Dialog","..."))
 		button_find_gimp = QtWidgets.QPushButton(QtCore.QCoreApplication.translate("Dialog","..."))
+		button_find_boundaries = QtWidgets.QPushButton(QtCore.QCoreApplication.translate("Dialog","..."))
 		
 		self.check_naming = QtWidgets.QCheckBox(QtCore.QCoreApplication.translate("Dialog","Rename files according to naming scheme below\nWARNING: an erroneous input may lead to damaged image files!"))
 		self.edit_naming = QtWidgets.QLineEdit()
@@ -834,6 +964,37 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 		self.spinbox_readsize.setDecimals(0) # emulate integer spin box for big ints
 		self.spinbox_readsize.setSingleStep(2**5) # big ints, make step size multiple of 2
 		
+		self.spinbox_cachesize = QtWidgets.QSpinBox()
+		self.spinbox_cachesize.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding,QtWidgets.QSizePolicy.Fixed)
+		self.spinbox_cachesize.setRange(0,1024**2)
+		self.spinbox_cachesize.setSuffix(" MiB")
+		self.spinbox_cachesize.setSpecialValueText(QtCore.QCoreApplication.translate("Dialog","disabled"))
+		
+		self.spinbox_thumbnailmemory = QtWidgets.QSpinBox()
+		self.spinbox_thumbnailmemory.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding,QtWidgets.QSizePolicy.Fixed)
+		self.spinbox_thumbnailmemory.setRange(1,1024**2)
+		self.spinbox_thumbnailmemory.setSuffix(" MiB")
+		
+		self.spinbox_previewmemory = QtWidgets.QSpinBox()
+		self.spinbox_previewmemory.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding,QtWidgets.QSizePolicy.Fixed)
+		self.spinbox_previewmemory.setRange(1,1024**2)
+		self.spinbox_previewmemory.setSuffix(" MiB")
+		
+		self.spinbox_previewprefetch = QtWidgets.QSpinBox()
+		self.spinbox_previewprefetch.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding,QtWidgets.QSizePolicy.Fixed)
+		self.spinbox_previewprefetch.setRange(0,64)
+		
+		self.spinbox_processes = QtWidgets.QSpinBox()
+		self.spinbox_processes.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding,QtWidgets.QSizePolicy.Fixed)
+		self.spinbox_processes.setRange(1,256)
+		
+		self.combo_backend = QtWidgets.QComboBox()
+		self.combo_backend.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding,QtWidgets.QSizePolicy.Fixed)
+		self.combo_backend.addItem(QtCore.QCoreApplication.translate("Dialog","XML (-X)"),FotoPreProcessorIngest.FPPIngestWorker.BackendXML)
+		self.combo_backend.addItem(QtCore.QCoreApplication.translate("Dialog","JSON (-j)"),FotoPreProcessorIngest.FPPIngestWorker.BackendJSON)
+		
+		self.check_lazydigests = QtWidgets.QCheckBox(QtCore.QCoreApplication.translate("Dialog","Calculate MD5 sums of edited images only"))
+		
 		self.spinbox_latitude = QtWidgets.QDoubleSpinBox()
 		self.spinbox_latitude.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding,QtWidgets.QSizePolicy.Fixed)
 		self.spinbox_latitude.setRange(-85,85)
@@ -892,6 +1053,13 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 		layout_tuning = QtWidgets.QFormLayout()
 		layout_tuning.addRow(QtCore.QCoreApplication.translate("Dialog","Image files read at once:"),self.spinbox_stepsize)
 		layout_tuning.addRow(QtCore.QCoreApplication.translate("Dialog","Characters read at once:"),self.spinbox_readsize)
+		layout_tuning.addRow(QtCore.QCoreApplication.translate("Dialog","Metadata cache size:"),self.spinbox_cachesize)
+		layout_tuning.addRow(QtCore.QCoreApplication.translate("Dialog","Thumbnail memory:"),self.spinbox_thumbnailmemory)
+		layout_tuning.addRow(QtCore.QCoreApplication.translate("Dialog","Preview memory:"),self.spinbox_previewmemory)
+		layout_tuning.addRow(QtCore.QCoreApplication.translate("Dialog","Previews decoded in advance:"),self.spinbox_previewprefetch)
+		layout_tuning.addRow(QtCore.QCoreApplication.translate("Dialog","Parallel exiftool processes:"),self.spinbox_processes)
+		layout_tuning.addRow(QtCore.QCoreApplication.translate("Dialog","Exiftool output format:"),self.combo_backend)
+		layout_tuning.addRow(self.check_lazydigests)
 		group_tuning.setLayout(layout_tuning)
 		
 		#-----------------------------------------------------------------------
@@ -900,9 +1068,17 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 		layout_coords = QtWidgets.QFormLayout()
 		layout_coords.addRow(QtCore.QCoreApplication.translate("Dialog","Default latitude:"),self.spinbox_latitude)
 		layout_coords.addRow(QtCore.QCoreApplication.translate("Dialog","Default longitude:"),self.spinbox_longitude)
-		layout_geotag = QtWidgets.QHBoxLayout()
-		layout_geotag.addLayout(layout_coords)
-		layout_geotag.addWidget(button_lookUp)
+		layout_defaults = QtWidgets.QHBoxLayout()
+		layout_defaults.addLayout(layout_coords)
+		layout_defaults.addWidget(button_lookUp)
+		layout_boundaries = QtWidgets.QHBoxLayout()
+		layout_boundaries.addWidget(self.edit_boundaries)
+		layout_boundaries.addWidget(button_find_boundaries)
+		layout_boundaries_form = QtWidgets.QFormLayout()
+		layout_boundaries_form.addRow(QtCore.QCoreApplication.translate("Dialog","Timezone boundaries:"),layout_boundaries)
+		layout_geotag = QtWidgets.QVBoxLayout()
+		layout_geotag.addLayout(layout_defaults)
+		layout_geotag.addLayout(layout_boundaries_form)
 		group_geotag.setLayout(layout_geotag)
 		
 		#-----------------------------------------------------------------------
@@ -928,8 +1104,17 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 		button_find_gimp.clicked.connect(self.selectTheGimp)
 		self.spinbox_stepsize.editingFinished.connect(self.stepsizeChanged)
 		self.spinbox_readsize.editingFinished.connect(self.readsizeChanged)
+		self.spinbox_cachesize.editingFinished.connect(self.cachesizeChanged)
+		self.spinbox_thumbnailmemory.editingFinished.connect(self.thumbnailMemoryChanged)
+		self.spinbox_previewmemory.editingFinished.connect(self.previewMemoryChanged)
+		self.spinbox_previewprefetch.editingFinished.connect(self.previewPrefetchChanged)
+		self.spinbox_processes.editingFinished.connect(self.processesChanged)
+		self.combo_backend.activated.connect(self.backendChanged)
+		self.check_lazydigests.stateChanged.connect(self.lazyDigestsChanged)
 		self.spinbox_latitude.editingFinished.connect(self.latitudeChanged)
 		self.spinbox_longitude.editingFinished.connect(self.longitudeChanged)
+		self.edit_boundaries.editingFinished.connect(self.boundariesChanged)
+		button_find_boundaries.clicked.connect(self.selectBoundaries)
 		self.check_naming.stateChanged.connect(self.checkNamingChanged)
 		self.button_reset_naming.clicked.connect(self.resetNaming)
 		self.edit_naming.editingFinished.connect(self.editNamingChanged)
@@ -949,6 +1134,26 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 		except: value = 1024
 		int_readsize = value
 		
+		try:    value = int(self.settings.value("CacheSize",512))
+		except: value = 512
+		int_cachesize = value
+		
+		try:    value = int(self.settings.value("ThumbnailMemory",128))
+		except: value = 128
+		int_thumbnailmemory = value
+		
+		try:    value = int(self.settings.value("PreviewMemory",256))
+		except: value = 256
+		int_previewmemory = value
+		
+		try:    value = int(self.settings.value("PreviewPrefetch",2))
+		except: value = 2
+		int_previewprefetch = value
+		
+		try:    value = int(self.settings.value("ExiftoolProcesses",os.cpu_count() or 1))
+		except: value = os.cpu_count() or 1
+		int_processes = value
+		
 		try:    value = float(self.settings.value("DefaultLatitude",52.374444))
 		except: value = 52.374444
 		float_latitude = value
@@ -961,8 +1166,18 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 		self.edit_gimp.setText(self.settings.value("TheGimpPath","/usr/bin/gimp"))
 		self.spinbox_stepsize.setValue(int_stepsize)
 		self.spinbox_readsize.setValue(int_readsize)
+		self.spinbox_cachesize.setValue(int_cachesize)
+		self.spinbox_thumbnailmemory.setValue(int_thumbnailmemory)
+		self.spinbox_previewmemory.setValue(int_previewmemory)
+		self.spinbox_previewprefetch.setValue(int_previewprefetch)
+		self.spinbox_processes.setValue(int_processes)
+		self.combo_backend.setCurrentIndex(max(self.combo_backend.findData(
+			self.settings.value("IngestBackend",FotoPreProcessorIngest.FPPIngestWorker.BackendXML)
+		),0))
+		self.check_lazydigests.setChecked(self.settings.value("LazyDigests",True) in ("true",True))
 		self.spinbox_latitude.setValue(float_latitude)
 		self.spinbox_longitude.setValue(float_longitude)
+		self.edit_boundaries.setText(self.settings.value("TimezoneBoundaries",""))
 		self.edit_naming.setText(self.settings.value("NamingScheme",self.DEFAULT_NAMING_SCHEME))
 		self.check_naming.setChecked(self.settings.value("NamingEnabled",True) in ("true",True))
 		self.button_reset.setEnabled(False)
@@ -971,10 +1186,18 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 	def applyChangesAndAccept(self):
 		self.settings.setValue("StepSize",self.spinbox_stepsize.value())
 		self.settings.setValue("ReadSize",self.spinbox_readsize.value())
+		self.settings.setValue("CacheSize",self.spinbox_cachesize.value())
+		self.settings.setValue("ThumbnailMemory",self.spinbox_thumbnailmemory.value())
+		self.settings.setValue("PreviewMemory",self.spinbox_previewmemory.value())
+		self.settings.setValue("PreviewPrefetch",self.spinbox_previewprefetch.value())
+		self.settings.setValue("ExiftoolProcesses",self.spinbox_processes.value())
+		self.settings.setValue("IngestBackend",self.combo_backend.currentData())
+		self.settings.setValue("LazyDigests",self.check_lazydigests.isChecked())
 		self.settings.setValue("ExiftoolPath",self.edit_exiftool.text())
 		self.settings.setValue("TheGimpPath",self.edit_gimp.text())
 		self.settings.setValue("DefaultLatitude",self.spinbox_latitude.value())
 		self.settings.setValue("DefaultLongitude",self.spinbox_longitude.value())
+		self.settings.setValue("TimezoneBoundaries",self.edit_boundaries.text())
 		self.settings.setValue("NamingScheme",self.edit_naming.text())
 		self.settings.setValue("NamingEnabled",self.check_naming.isChecked())
 		self.button_reset.setEnabled(False)
@@ -1015,6 +1238,24 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 			self.edit_exiftool.setText(path)
 	
 	
+	def selectBoundaries(self):
+		path,pathfilter = QtWidgets.QFileDialog.getOpenFileName(self,
+			QtCore.QCoreApplication.translate("Dialog","Select Timezone Boundaries File"),
+			self.edit_boundaries.text(),
+			QtCore.QCoreApplication.translate("Dialog","GeoJSON files (*.json *.geojson);;All files (*)"),"",
+			QtWidgets.QFileDialog.DontUseNativeDialog
+		)
+		if len(path) > 0:
+			self.edit_boundaries.setText(path)
+			self.boundariesChanged()
+	
+	
+	def boundariesChanged(self):
+		self.button_reset.setEnabled(
+			self.edit_boundaries.text() != self.settings.value("TimezoneBoundaries","")
+		)
+	
+	
 	def stepsizeChanged(self):
 		try:    value = int(self.settings.value("StepSize",4))
 		except: value = 4
@@ -1027,6 +1268,46 @@ class FPPSettingsDialog(QtWidgets.QDialog):
 		self.button_reset.setEnabled( self.spinbox_readsize.value() != value )
 	
 	
+	def cachesizeChanged(self):
+		try:    value = int(self.settings.value("CacheSize",512))
+		except: value = 512
+		self.button_reset.setEnabled( self.spinbox_cachesize.value() != value )
+	
+	
+	def thumbnailMemoryChanged(self):
+		try:    value = int(self.settings.value("ThumbnailMemory",128))
+		except: value = 128
+		self.button_reset.setEnabled( self.spinbox_thumbnailmemory.value() != value )
+	
+	
+	def previewMemoryChanged(self):
+		try:    value = int(self.settings.value("PreviewMemory",256))
+		except: value = 256
+		self.button_reset.setEnabled( self.spinbox_previewmemory.value() != value )
+	
+	
+	def previewPrefetchChanged(self):
+		try:    value = int(self.settings.value("PreviewPrefetch",2))
+		except: value = 2
+		self.button_reset.setEnabled( self.spinbox_previewprefetch.value() != value )
+	
+	
+	def processesChanged(self):
+		try:    value = int(self.settings.value("ExiftoolProcesses",os.cpu_count() or 1))
+		except: value = os.cpu_count() or 1
+		self.button_reset.setEnabled( self.spinbox_processes.value() != value )
+	
+	
+	def backendChanged(self):
+		value = self.settings.value("IngestBackend",FotoPreProcessorIngest.FPPIngestWorker.BackendXML)
+		self.button_reset.setEnabled( self.combo_backend.currentData() != value )
+	
+	
+	def lazyDigestsChanged(self):
+		value = self.settings.value("LazyDigests",True) in ("true",True)
+		self.button_reset.setEnabled( self.check_lazydigests.isChecked() != value )
+	
+	
 	def latitudeChanged(self):
 		try:    value = float(self.settings.value("DefaultLatitude",52.374444))
 		except: value = 52.374444